@@ -0,0 +1,3 @@
+"""
+크롤링 성능 벤치마크
+"""
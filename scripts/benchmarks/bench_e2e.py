@@ -0,0 +1,153 @@
+"""
+보도자료 전체 수집 end-to-end 벤치마크
+
+기관마다 코퍼스를 응답하는 로컬 HTTP 서버를 띄우고 소스 명세의 URL을 서버 주소로 바꾼 뒤
+fetch_all_press_releases를 실행합니다. 서버 포트가 기관마다 다르므로 호스트별 동시 요청 제한도 실제와 같게 적용됩니다.
+요청마다 지연 시간을 넣어 실제 사이트의 응답 시간을 흉내 낼 수 있고,
+HTTP 캐시는 임시 디렉토리를 사용하므로 data/ 아래의 운영 데이터는 건드리지 않습니다.
+
+사용 예:
+    python -m scripts.benchmarks.bench_e2e --pages 3 --latency-ms 100
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+from contextlib import ExitStack, contextmanager
+from dataclasses import replace
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers import http_cache, press_crawler
+from crawlers.config import KST
+from crawlers.sources import SOURCES, register_source
+from crawlers.transport import get_stats
+from benchmarks.corpus import corpus_files, load_bytes
+
+
+class CorpusServer:
+    """경로의 첫 부분(/fsc?page=1 → fsc)에 해당하는 코퍼스 파일을 응답하는 로컬 서버"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        bodies = {name: load_bytes(name) for name in corpus_files()}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                name = self.path.lstrip('/').split('?')[0].split('/')[0]
+                body = bodies.get(name)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                content_type = 'application/rss+xml' if name.endswith('_rss') else 'text/html'
+                self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='corpus-server', daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@contextmanager
+def local_sources(servers: Dict[str, CorpusServer]) -> Iterator[None]:
+    """소스 URL을 기관별 로컬 서버로 바꾸고, 임시 HTTP 캐시와 날짜 필터 해제를 적용한 뒤 원래대로 복원"""
+    originals = dict(SOURCES)
+    original_cache = http_cache._cache
+    original_start_date = press_crawler.get_start_date
+    with tempfile.TemporaryDirectory(prefix='bench_http_cache_') as cache_dir:
+        try:
+            for key, spec in originals.items():
+                url = servers[key].url
+                register_source(replace(spec, base_url=url, list_url=f"{url}/{key}?page={{page}}"))
+            http_cache._cache = http_cache.HttpCache(cache_dir)
+            # 코퍼스 게시물 날짜가 검색 기간 밖이어도 모두 수집
+            press_crawler.get_start_date = lambda: datetime(1970, 1, 1, tzinfo=KST)
+            yield
+        finally:
+            for spec in originals.values():
+                register_source(spec)
+            http_cache._cache = original_cache
+            press_crawler.get_start_date = original_start_date
+
+
+def run(pages: int = 3, latency_ms: float = 50, rounds: int = 3) -> List[Dict]:
+    """페이지 수만큼 모든 기관을 수집하는 시간을 rounds회 측정 (라운드마다 빈 캐시)"""
+    servers = {key: CorpusServer(latency=latency_ms / 1000) for key in SOURCES}
+    with ExitStack() as stack:
+        for server in servers.values():
+            stack.enter_context(server)
+
+        timings = []
+        items = requests = 0
+        for _ in range(rounds):
+            with local_sources(servers):
+                requests_before = sum(server.requests for server in servers.values())
+                start = time.perf_counter()
+                items = len(press_crawler.fetch_all_press_releases(max_pages=pages, incremental=False))
+                timings.append(time.perf_counter() - start)
+                requests = sum(server.requests for server in servers.values()) - requests_before
+
+    stats = get_stats()
+    connections = sum(stats.get(server.url.split('://', 1)[1], {}).get('connections', 0)
+                      for server in servers.values())
+    return [{
+        'case': f"fetch_all_press_releases ({len(servers)}개 기관 × {pages}페이지, 지연 {latency_ms:g}ms)",
+        'items': items,
+        'requests': requests,
+        'seconds': min(timings),
+        'items_per_second': items / min(timings) if items else 0.0,
+        'connections': connections,
+    }]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='보도자료 end-to-end 수집 벤치마크')
+    parser.add_argument('--pages', type=int, default=3, help='기관별 수집 페이지 수')
+    parser.add_argument('--latency-ms', type=float, default=50, help='요청당 서버 지연 시간(ms)')
+    parser.add_argument('--rounds', type=int, default=3, help='측정 횟수 (최솟값 사용)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    # 크롤러 모듈의 INFO 로그는 측정 중 출력하지 않음
+    logging.getLogger().setLevel(logging.WARNING)
+    results = run(args.pages, args.latency_ms, args.rounds)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for result in results:
+        print(f"{result['case']}: {result['items']}개 항목, 요청 {result['requests']}회, "
+              f"{result['seconds']:.3f}초 ({result['items_per_second']:.0f} items/s), 연결 {result['connections']}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+크롤러 모듈 임포트 시간 벤치마크
+
+모듈마다 새 인터프리터를 띄워 임포트에 걸린 시간을 재고, 임포트만으로 브라우저 스택(Selenium,
+webdriver_manager)을 불러오거나 로깅 핸들러를 설정하지 않는지 확인합니다.
+브라우저 스택은 실제로 브라우저를 띄울 때만 불러와야 하므로, 임포트 단계에서 불러오면 AssertionError가 발생합니다.
+
+사용 예:
+    python -m scripts.benchmarks.bench_import --repeat 5
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from typing import List
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 측정할 모듈 (CLI 조회, 보도자료 단독 실행, 뉴스 수집, 스케줄러)
+MODULES = ['crawlers.store', 'crawlers.press_crawler', 'crawlers.news_crawler', 'scheduler']
+
+BROWSER_MODULES = ('selenium', 'webdriver_manager')
+
+PROBE = """
+import sys, json, time, logging
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps([seconds, [name for name in {browser!r} if name in sys.modules], len(logging.getLogger().handlers)]))
+"""
+
+
+def measure(module: str) -> tuple:
+    """새 인터프리터에서 (임포트 시간, 불러온 브라우저 모듈, 루트 로깅 핸들러 수)"""
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, browser=BROWSER_MODULES)],
+        cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True, timeout=60
+    ).stdout
+    return tuple(json.loads(output.strip().splitlines()[-1]))
+
+
+def run(repeat: int) -> List[dict]:
+    results = []
+    for module in MODULES:
+        samples = [measure(module) for _ in range(repeat)]
+        _, browser, handlers = samples[0]
+        assert not browser, f"{module} 임포트가 브라우저 스택을 불러옴: {browser}"
+        assert not handlers, f"{module} 임포트가 로깅 핸들러를 설정함"
+        results.append({'case': module, 'seconds': min(sample[0] for sample in samples)})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='크롤러 모듈 임포트 시간 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최솟값 사용)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for result in results:
+        print(f"{result['case']:<28} {result['seconds'] * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
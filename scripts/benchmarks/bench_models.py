@@ -0,0 +1,119 @@
+"""
+아이템 모델 직렬화 마이크로벤치마크
+
+기존 방식(일반 dataclass + dataclasses.asdict + json.dumps)과
+slots 모델의 to_dict / to_json / JSONL 인코딩·디코딩 속도, 인스턴스 메모리를 비교합니다.
+
+사용 예:
+    python -m scripts.benchmarks.bench_models --items 20000
+"""
+
+import os
+import sys
+import json
+import argparse
+import timeit
+import tracemalloc
+from dataclasses import asdict, fields, make_dataclass
+from typing import Callable, List
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.models import NewsItem, decode_jsonl, encode_jsonl
+
+# 비교용: slots 없는 기존 형태의 dataclass
+LegacyNewsItem = make_dataclass(
+    'LegacyNewsItem', [(f.name, f.type, f) for f in fields(NewsItem)]
+)
+
+
+def make_items(count: int) -> List[NewsItem]:
+    """벤치마크용 뉴스 아이템 생성"""
+    return [
+        NewsItem(
+            id=f"naver-20240601-{i}",
+            title=f"금융위원회, 보이스피싱 피해 환급 절차 개선 방안 발표 {i}",
+            source='네이버 뉴스',
+            publisher='연합뉴스',
+            date='2024-06-01T09:30:00',
+            url=f"https://www.yna.co.kr/view/AKR20240601{i:06d}",
+            summary="금융당국이 보이스피싱 피해금 환급 기간을 단축하는 방안을 내놓았다. \"신속한 구제\"가 목표다.",
+            tags=['보이스피싱', '금융위원회', '환급'],
+            keywords=['보이스피싱', '금융위원회', '환급', '피해', '절차'],
+            imageUrl=None,
+        )
+        for i in range(count)
+    ]
+
+
+def _measure(func: Callable[[], object], repeat: int) -> float:
+    """가장 빠른 실행 시간(초)"""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def _instance_bytes(factory: Callable[[], list]) -> float:
+    """인스턴스 하나당 할당 바이트 (필드 값 객체는 공유)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = factory()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(objects)
+
+
+def run(count: int, repeat: int) -> List[dict]:
+    items = make_items(count)
+    legacy = [LegacyNewsItem(**{f.name: getattr(item, f.name) for f in fields(NewsItem)}) for item in items]
+    jsonl = encode_jsonl(items)
+    assert [json.loads(line) for line in jsonl.splitlines()] == [asdict(item) for item in legacy]
+
+    cases = [
+        ('asdict + json.dumps (기존)',
+         lambda: [json.dumps(asdict(item), ensure_ascii=False) for item in legacy]),
+        ('to_dict + json.dumps',
+         lambda: [json.dumps(item.to_dict(), ensure_ascii=False) for item in items]),
+        ('to_json (직접 인코딩)',
+         lambda: [item.to_json() for item in items]),
+        ('JSONL 인코딩: json.dumps(asdict) (기존)',
+         lambda: ''.join(json.dumps(asdict(item), ensure_ascii=False) + '\n' for item in legacy).encode('utf-8')),
+        ('JSONL 인코딩: encode_jsonl',
+         lambda: encode_jsonl(items)),
+        ('JSONL 디코딩: json.loads + LegacyNewsItem(**) (기존)',
+         lambda: [LegacyNewsItem(**json.loads(line)) for line in jsonl.splitlines()]),
+        ('JSONL 디코딩: decode_jsonl',
+         lambda: decode_jsonl(jsonl)),
+    ]
+
+    results = []
+    for name, func in cases:
+        seconds = _measure(func, repeat)
+        results.append({'case': name, 'seconds': seconds, 'us_per_item': seconds / count * 1e6})
+
+    values = [(f.name, getattr(items[0], f.name)) for f in fields(NewsItem)]
+    results.append({'case': '인스턴스 메모리: 일반 dataclass (기존)',
+                    'bytes_per_item': _instance_bytes(lambda: [LegacyNewsItem(**dict(values)) for _ in range(count)])})
+    results.append({'case': '인스턴스 메모리: slots 모델',
+                    'bytes_per_item': _instance_bytes(lambda: [NewsItem(**dict(values)) for _ in range(count)])})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='아이템 모델 직렬화 벤치마크')
+    parser.add_argument('--items', type=int, default=20000, help='아이템 수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최솟값 사용)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    results = run(args.items, args.repeat)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for result in results:
+        if 'seconds' in result:
+            print(f"{result['case']:<48} {result['seconds'] * 1000:9.1f} ms  {result['us_per_item']:7.2f} us/item")
+        else:
+            print(f"{result['case']:<48} {result['bytes_per_item']:9.0f} B/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+스크래퍼별 파싱 벤치마크
+
+코퍼스의 목록 페이지를 네트워크 없이 반복 파싱하여 페이지당 처리 시간을 측정합니다.
+보도자료는 목록 파싱 + 아이템 생성(iter_page_items), 뉴스는 네이버 HTML / 구글 RSS 파서를 측정합니다.
+
+사용 예:
+    python -m scripts.benchmarks.bench_parse --repeat 50
+"""
+
+import os
+import sys
+import json
+import argparse
+import timeit
+from typing import Callable, Dict, List
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.sources import SOURCES
+from crawlers.press_crawler import iter_page_items
+from crawlers.news_fetcher import parse_google_rss, parse_naver_html
+from benchmarks.corpus import CORPUS_KEYWORD, load_bytes, load_text
+
+
+def _cases() -> Dict[str, Callable[[], list]]:
+    """스크래퍼 이름 → 코퍼스 1페이지를 파싱하는 함수"""
+    cases: Dict[str, Callable[[], list]] = {}
+    for key in SOURCES:
+        html = load_text(key)
+        cases[key] = lambda key=key, html=html: list(iter_page_items(key, html))
+
+    naver_html = load_text('naver')
+    cases['naver'] = lambda: parse_naver_html(naver_html, CORPUS_KEYWORD, max_items=100) or []
+    rss = load_bytes('google_rss')
+    cases['google_rss'] = lambda: parse_google_rss(rss, CORPUS_KEYWORD, max_items=100) or []
+    return cases
+
+
+def run(repeat: int = 50, rounds: int = 5) -> List[dict]:
+    results = []
+    for name, func in _cases().items():
+        items = len(func())
+        seconds = min(timeit.repeat(func, number=repeat, repeat=rounds)) / repeat
+        results.append({
+            'case': name,
+            'items': items,
+            'us_per_page': seconds * 1e6,
+            'us_per_item': seconds * 1e6 / items if items else None,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='스크래퍼별 파싱 벤치마크')
+    parser.add_argument('--repeat', type=int, default=50, help='측정 1회당 파싱 횟수')
+    parser.add_argument('--rounds', type=int, default=5, help='측정 횟수 (최솟값 사용)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat, args.rounds)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for result in results:
+        per_item = f"{result['us_per_item']:8.1f} us/item" if result['us_per_item'] else ''
+        print(f"{result['case']:<12} {result['items']:4d}개  {result['us_per_page']:9.1f} us/page  {per_item}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+분류 사전 태그 추출 마이크로벤치마크
+
+용어마다 본문을 다시 검색하는 방식(str.find 반복)과 Aho-Corasick 오토마톤 한 번 순회의
+아이템당 태그 추출 시간, 사전 컴파일 시간을 비교합니다. 사전 크기는 동의어를 늘려 키울 수 있습니다.
+
+사용 예:
+    python -m scripts.benchmarks.bench_tagger --items 2000 --extra-terms 500
+"""
+
+import os
+import sys
+import json
+import argparse
+import timeit
+from typing import Callable, Dict, List
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.tagger import Tagger, default_taxonomy
+
+BODY = ("금융위원회와 금융감독원은 전기통신금융사기 피해 환급 절차를 개선하고 고령층 등 금융취약계층의 "
+        "디지털금융 접근성을 높이기 위한 방안을 발표했다. 한국은행 기준금리 동결 이후 가계부채 증가세와 "
+        "부동산 PF 부실 우려에 대한 점검도 함께 진행한다. ") * 6
+
+
+def make_texts(count: int) -> List[tuple]:
+    """벤치마크용 (제목, 요약, 본문)"""
+    return [
+        (f"금융위, 보이스피싱 피해 환급 절차 개선 방안 발표 {i}",
+         "금융당국이 보이스피싱 피해금 환급 기간을 단축하는 방안을 내놓았다.",
+         BODY)
+        for i in range(count)
+    ]
+
+
+def make_taxonomy(extra_terms: int) -> Dict[str, List[str]]:
+    """기본 분류 사전에 본문에 나오지 않는 가상 용어를 extra_terms개 추가"""
+    taxonomy = default_taxonomy()
+    for i in range(extra_terms):
+        taxonomy[f"정책용어{i}"] = [f"정책 동의어{i}"]
+    return taxonomy
+
+
+def naive_tags(surfaces: Dict[str, str], title: str, summary: str, body: str) -> List[str]:
+    """비교용: 표기마다 텍스트 전체를 다시 검색"""
+    text = '\n'.join((title, summary, body)).lower()
+    return list(dict.fromkeys(tag for surface, tag in surfaces.items() if surface in text))
+
+
+def _measure(func: Callable[[], object], repeat: int) -> float:
+    """가장 빠른 실행 시간(초)"""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def run(count: int, repeat: int, extra_terms: int = 500) -> List[dict]:
+    texts = make_texts(count)
+    taxonomy = make_taxonomy(extra_terms)
+    tagger = Tagger(taxonomy)
+    surfaces = {term.lower(): tag for tag, synonyms in taxonomy.items() for term in (tag, *synonyms)}
+    assert set(tagger.tag_text(*texts[0], limit=None)) <= set(naive_tags(surfaces, *texts[0]))
+
+    results = []
+    seconds = _measure(lambda: Tagger(taxonomy), repeat)
+    results.append({'case': f'사전 컴파일 ({len(surfaces)}개 표기)', 'seconds': seconds})
+
+    cases = [
+        ('용어별 substring 검색 (비교)',
+         lambda: [naive_tags(surfaces, *text) for text in texts]),
+        ('Aho-Corasick 한 번 순회',
+         lambda: [tagger.tag_text(*text) for text in texts]),
+    ]
+    for name, func in cases:
+        seconds = _measure(func, repeat)
+        results.append({'case': name, 'seconds': seconds, 'us_per_item': seconds / count * 1e6})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='분류 사전 태그 추출 벤치마크')
+    parser.add_argument('--items', type=int, default=2000, help='아이템 수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최솟값 사용)')
+    parser.add_argument('--extra-terms', type=int, default=500, help='사전에 추가할 가상 용어 수')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    results = run(args.items, args.repeat, args.extra_terms)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for result in results:
+        line = f"{result['case']:<36} {result['seconds'] * 1000:9.1f} ms"
+        if 'us_per_item' in result:
+            line += f"  {result['us_per_item']:7.2f} us/item"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
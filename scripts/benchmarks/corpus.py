@@ -0,0 +1,105 @@
+"""
+벤치마크용 페이지 코퍼스
+
+기관별 보도자료 목록 1페이지와 네이버 뉴스 검색 결과, 구글 뉴스 RSS를 corpus/ 디렉토리에 보관합니다.
+벤치마크는 이 파일만 사용하므로 실제 사이트에 접속하지 않습니다.
+사이트 마크업이 바뀌면 --capture로 다시 받아 커밋합니다.
+
+사용 예:
+    python -m scripts.benchmarks.corpus --capture
+"""
+
+import os
+import sys
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote_plus
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.sources import SOURCES
+
+logger = logging.getLogger('benchmarks.corpus')
+
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+
+# 뉴스 코퍼스를 수집한 검색 키워드
+CORPUS_KEYWORD = '보이스피싱'
+
+NEWS_CORPUS = {
+    'naver': 'naver.html',
+    'google_rss': 'google_rss.xml',
+}
+
+
+def corpus_files() -> Dict[str, str]:
+    """코퍼스 이름 → 파일 이름 (보도자료는 소스 키 이름 그대로)"""
+    files = {key: f"{key}.html" for key in SOURCES}
+    files.update(NEWS_CORPUS)
+    return files
+
+
+def load_bytes(name: str) -> bytes:
+    """코퍼스 파일 원본 바이트"""
+    with open(CORPUS_DIR / corpus_files()[name], 'rb') as f:
+        return f.read()
+
+
+def load_text(name: str) -> str:
+    """코퍼스 파일 텍스트 (UTF-8)"""
+    return load_bytes(name).decode('utf-8')
+
+
+def capture_urls() -> Dict[str, str]:
+    """코퍼스 이름별 실제 수집 URL"""
+    from crawlers.news_fetcher import GOOGLE_RSS_URL, NAVER_SEARCH_URL
+
+    urls = {key: spec.list_url.format(page=1) for key, spec in SOURCES.items()}
+    urls['naver'] = NAVER_SEARCH_URL.format(query=quote_plus(CORPUS_KEYWORD), start=1)
+    urls['google_rss'] = GOOGLE_RSS_URL.format(query=quote_plus(CORPUS_KEYWORD))
+    return urls
+
+
+def capture(names: Optional[List[str]] = None):
+    """실제 사이트에서 페이지를 받아 코퍼스 갱신 (UTF-8로 저장)"""
+    from crawlers.transport import fetch
+
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    files = corpus_files()
+    for name, url in capture_urls().items():
+        if names and name not in names:
+            continue
+        try:
+            response = fetch(url)
+            response.raise_for_status()
+            if name.endswith('_rss'):
+                body = response.content
+            else:
+                response.encoding = response.apparent_encoding if response.encoding is None else response.encoding
+                body = response.text.encode('utf-8')
+            with open(CORPUS_DIR / files[name], 'wb') as f:
+                f.write(body)
+            logger.info(f"코퍼스 저장: {files[name]} ({len(body):,} bytes)")
+        except Exception as e:
+            logger.error(f"코퍼스 수집 오류 ({name}, {url}): {str(e)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='벤치마크 코퍼스 관리')
+    parser.add_argument('--capture', action='store_true', help='실제 사이트에서 코퍼스 다시 받기')
+    parser.add_argument('names', nargs='*', help='갱신할 코퍼스 이름 (기본: 전체)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if args.capture:
+        capture(args.names or None)
+    for name, filename in corpus_files().items():
+        path = CORPUS_DIR / filename
+        size = path.stat().st_size if path.exists() else 0
+        print(f"{name:<12} {filename:<16} {size:>9,} bytes")
+
+
+if __name__ == "__main__":
+    main()
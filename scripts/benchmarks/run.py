@@ -0,0 +1,124 @@
+"""
+벤치마크 일괄 실행 및 결과 기록
+
+파싱 / end-to-end / 모델 직렬화 / 태그 추출 / 모듈 임포트 벤치마크를 실행하고 결과를 results/ 아래 JSON으로 저장합니다.
+--baseline을 주면 기준 결과와 비교하여 허용치 이상 느려진 항목을 출력하고 종료 코드 1을 반환합니다.
+
+사용 예:
+    python -m scripts.benchmarks.run
+    python -m scripts.benchmarks.run --baseline scripts/benchmarks/results/baseline.json
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+import platform
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks import bench_e2e, bench_import, bench_models, bench_parse, bench_tagger
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# 값이 작을수록 좋은 지표 (회귀 비교 대상)
+LOWER_IS_BETTER = ('seconds', 'us_per_page', 'us_per_item', 'bytes_per_item')
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_all(quick: bool = False) -> Dict[str, Any]:
+    """모든 벤치마크 실행 (quick이면 반복 횟수를 줄임)"""
+    suites = {
+        'parse': lambda: bench_parse.run(repeat=10 if quick else 50, rounds=3 if quick else 5),
+        'e2e': lambda: bench_e2e.run(pages=2 if quick else 3, rounds=1 if quick else 3),
+        'models': lambda: bench_models.run(count=2000 if quick else 20000, repeat=3 if quick else 5),
+        'tagger': lambda: bench_tagger.run(count=500 if quick else 2000, repeat=3 if quick else 5),
+        'import': lambda: bench_import.run(repeat=3 if quick else 5),
+    }
+    results: Dict[str, List[dict]] = {}
+    for name, suite in suites.items():
+        print(f"[{name}] 실행 중...", file=sys.stderr)
+        results[name] = suite()
+    return {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+
+def flatten(report: Dict[str, Any]) -> Dict[str, float]:
+    """'suite/case/지표' → 값 (비교 대상 지표만)"""
+    values = {}
+    for suite, cases in report['results'].items():
+        for case in cases:
+            for metric in LOWER_IS_BETTER:
+                if case.get(metric) is not None:
+                    values[f"{suite}/{case['case']}/{metric}"] = case[metric]
+    return values
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """기준보다 tolerance 비율 이상 나빠진 지표 목록"""
+    current, previous = flatten(report), flatten(baseline)
+    regressions = []
+    for key, value in current.items():
+        base = previous.get(key)
+        if base and value > base * (1 + tolerance):
+            regressions.append(f"{key}: {base:.4g} → {value:.4g} (+{(value / base - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='크롤러 벤치마크 일괄 실행')
+    parser.add_argument('--output', type=Path, help='결과 JSON 경로 (기본: results/bench_<시각>.json)')
+    parser.add_argument('--baseline', type=Path, help='비교할 기준 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='회귀로 볼 악화 비율 (기본 0.25 = 25%%)')
+    parser.add_argument('--quick', action='store_true', help='반복 횟수를 줄여 빠르게 실행')
+    args = parser.parse_args(argv)
+
+    # 크롤러 모듈의 INFO 로그는 측정 중 출력하지 않음
+    logging.getLogger().setLevel(logging.WARNING)
+
+    report = run_all(quick=args.quick)
+    output = args.output or RESULTS_DIR / f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    os.makedirs(output.parent, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    for key, value in flatten(report).items():
+        print(f"{key:<80} {value:12.4g}")
+    print(f"결과 저장: {output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline['meta'].get('quick') != report['meta']['quick']:
+            print("기준 결과와 실행 모드(--quick)가 달라 비교하지 않습니다.")
+            sys.exit(2)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"성능 회귀 {len(regressions)}건 (허용치 {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("기준 대비 성능 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
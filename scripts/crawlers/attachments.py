@@ -0,0 +1,458 @@
+"""
+보도자료 첨부파일 수집 및 텍스트 추출
+
+상세 페이지에서 찾은 첨부파일(PDF, HWP, HWPX 등)을 ATTACHMENT_CHUNK_SIZE 단위로 받아
+본문 SHA-256 이름의 파일(data/attachments/<해시 앞 2자리>/<해시>.<형식>)로 저장합니다.
+- 받던 중 끊긴 파일은 partial/ 아래에 남겨 두고 다음 실행에서 Range 요청으로 이어받습니다.
+- ATTACHMENT_MAX_BYTES를 넘는 파일은 받지 않으며, 같은 URL이나 같은 해시의 파일은 다시 받거나 추출하지 않습니다.
+- 텍스트 추출은 별도 프로세스 풀에서 실행하여 큰 PDF가 수집을 막지 않게 하고,
+  결과(text/<해시>.txt)는 저장소 attachments 테이블에서 아이템 URL로 연결됩니다.
+  (아이템 ID는 수집할 때마다 새로 만들어지고 저장소가 충돌 시 바꿀 수 있어 쓰지 않음)
+
+PDF는 pypdf, HWP는 olefile 패키지가 설치되어 있을 때만 추출합니다 (HWPX와 텍스트 파일은 추가 패키지 불필요).
+"""
+
+import os
+import sys
+import re
+import zlib
+import struct
+import hashlib
+import logging
+import threading
+import traceback
+import multiprocessing
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import (
+    ATTACHMENT_DIR, ATTACHMENT_EXTENSIONS, ATTACHMENT_MAX_BYTES, ATTACHMENT_CHUNK_SIZE,
+    ATTACHMENT_DOWNLOAD_WORKERS, ATTACHMENT_EXTRACT_WORKERS
+)
+from crawlers.transport import open_stream
+from crawlers.store import ItemStore, get_store
+from crawlers.sources import SOURCES
+from crawlers.pipeline import Sink
+from crawlers.jobs import current_job
+from crawlers.metrics import ATTACHMENTS, ATTACHMENT_BYTES, FETCH_BYTES
+
+logger = logging.getLogger('attachments')
+
+PARTIAL_DIR = ATTACHMENT_DIR / 'partial'
+TEXT_DIR = ATTACHMENT_DIR / 'text'
+
+# 확장자를 알 수 없을 때 파일 앞부분으로 형식 판별
+_MAGIC = ((b'%PDF', 'pdf'), (b'\xd0\xcf\x11\xe0', 'hwp'), (b'PK\x03\x04', 'hwpx'))
+
+
+class AttachmentTooLarge(Exception):
+    """ATTACHMENT_MAX_BYTES를 넘는 첨부파일"""
+
+
+class ExtractorUnavailable(Exception):
+    """텍스트 추출에 필요한 패키지가 설치되지 않음"""
+
+
+# 형식 판별
+
+def _extension(name: Optional[str]) -> Optional[str]:
+    """파일 이름의 확장자 (소문자, 없으면 None)"""
+    if not name:
+        return None
+    match = re.search(r'\.([A-Za-z0-9]{1,5})$', name.strip())
+    return match.group(1).lower() if match else None
+
+
+def _disposition_name(value: Optional[str]) -> Optional[str]:
+    """Content-Disposition 헤더의 파일 이름"""
+    if not value:
+        return None
+    match = re.search(r"filename\*\s*=\s*[^']*'[^']*'([^;]+)", value, re.IGNORECASE)
+    if match:
+        return unquote(match.group(1).strip())
+    match = re.search(r'filename\s*=\s*"?([^";]+)"?', value, re.IGNORECASE)
+    return unquote(match.group(1).strip()) if match else None
+
+
+def guess_kind(name: Optional[str], url: str) -> Optional[str]:
+    """첨부파일 이름 또는 URL 경로로 짐작한 형식 (모르면 None)"""
+    return _extension(name) or _extension(unquote(urlsplit(url).path))
+
+
+def sniff_kind(path: Path) -> Optional[str]:
+    """파일 앞부분으로 판별한 형식"""
+    with open(path, 'rb') as f:
+        head = f.read(8)
+    for magic, kind in _MAGIC:
+        if head.startswith(magic):
+            return kind
+    return None
+
+
+# 텍스트 추출 (프로세스 풀에서 실행되므로 모듈 수준 함수로 정의)
+
+def _pdf_text(path: str) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ExtractorUnavailable("pypdf 패키지가 없어 PDF 텍스트를 추출할 수 없습니다")
+    reader = PdfReader(path)
+    if reader.is_encrypted:
+        reader.decrypt('')
+    return '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+# HWP 5.0 문단 텍스트 레코드와 한 글자 크기 제어 문자 (나머지 제어 문자는 8글자 크기)
+HWPTAG_PARA_TEXT = 67
+_HWP_CHAR_CONTROLS = {0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31}
+
+
+def _hwp_para_text(data: bytes) -> str:
+    """HWPTAG_PARA_TEXT 레코드 → 문자열 (개체·필드 등 제어 문자는 제거)"""
+    units = struct.unpack(f'<{len(data) // 2}H', data[:len(data) // 2 * 2])
+    kept = []
+    i = 0
+    while i < len(units):
+        code = units[i]
+        if code >= 32:
+            kept.append(code)
+        elif code in (10, 13):
+            kept.append(10)
+        elif code == 9:
+            kept.append(9)
+        elif code in (30, 31):
+            kept.append(32)
+        if code >= 32 or code in _HWP_CHAR_CONTROLS:
+            i += 1
+        else:
+            i += 8
+    return struct.pack(f'<{len(kept)}H', *kept).decode('utf-16-le', errors='ignore')
+
+
+def _hwp_section_text(data: bytes) -> str:
+    """BodyText/Section 스트림의 레코드에서 문단 텍스트만 모음"""
+    parts, pos = [], 0
+    while pos + 4 <= len(data):
+        header = struct.unpack_from('<I', data, pos)[0]
+        pos += 4
+        tag, size = header & 0x3FF, (header >> 20) & 0xFFF
+        if size == 0xFFF:
+            size = struct.unpack_from('<I', data, pos)[0]
+            pos += 4
+        if tag == HWPTAG_PARA_TEXT:
+            parts.append(_hwp_para_text(data[pos:pos + size]))
+        pos += size
+    return ''.join(parts)
+
+
+def _hwp_text(path: str) -> str:
+    try:
+        import olefile
+    except ImportError:
+        raise ExtractorUnavailable("olefile 패키지가 없어 HWP 텍스트를 추출할 수 없습니다")
+    with olefile.OleFileIO(path) as ole:
+        properties = struct.unpack_from('<I', ole.openstream('FileHeader').read(), 36)[0]
+        if properties & 0x2:
+            raise ValueError("암호가 설정된 HWP 문서")
+        compressed = bool(properties & 0x1)
+        sections = sorted(
+            (entry for entry in ole.listdir() if len(entry) == 2 and entry[0] == 'BodyText'),
+            key=lambda entry: int(re.sub(r'\D', '', entry[1]) or 0)
+        )
+        texts = []
+        for entry in sections:
+            data = ole.openstream(entry).read()
+            texts.append(_hwp_section_text(zlib.decompress(data, -15) if compressed else data))
+        if not any(texts) and ole.exists('PrvText'):
+            # 배포용 문서 등 본문을 읽을 수 없으면 미리보기 텍스트 사용
+            texts = [ole.openstream('PrvText').read().decode('utf-16-le', errors='ignore')]
+    return '\n'.join(texts)
+
+
+def _hwpx_text(path: str) -> str:
+    from lxml import etree
+    with zipfile.ZipFile(path) as archive:
+        sections = sorted(
+            (name for name in archive.namelist() if re.match(r'Contents/section\d+\.xml$', name)),
+            key=lambda name: int(re.sub(r'\D', '', name))
+        )
+        lines = []
+        for name in sections:
+            root = etree.fromstring(archive.read(name))
+            current = None
+            for node in root.iter('{*}t'):
+                paragraph = next(node.iterancestors('{*}p'), None)
+                if paragraph is not current or not lines:
+                    lines.append('')
+                    current = paragraph
+                lines[-1] += ''.join(node.itertext())
+    return '\n'.join(lines)
+
+
+def _plain_text(path: str) -> str:
+    with open(path, 'rb') as f:
+        data = f.read()
+    for encoding in ('utf-8', 'cp949'):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return data.decode('utf-8', errors='replace')
+
+
+EXTRACTORS = {
+    'pdf': _pdf_text,
+    'hwp': _hwp_text,
+    'hwpx': _hwpx_text,
+    'txt': _plain_text,
+}
+
+
+def extract_text(path: str, kind: str) -> str:
+    """첨부파일 텍스트 추출 (지원하지 않는 형식은 빈 문자열)"""
+    extractor = EXTRACTORS.get(kind)
+    if extractor is None:
+        return ''
+    text = extractor(path)
+    lines = (re.sub(r'[ \t\xa0\u3000]+', ' ', line).strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+# 텍스트 추출 프로세스 풀 (최초 사용 시 생성, 여러 작업이 공유)
+_extractor: Optional[ProcessPoolExecutor] = None
+_extractor_lock = threading.Lock()
+
+
+def get_extractor() -> ProcessPoolExecutor:
+    """공용 텍스트 추출 프로세스 풀 반환
+
+    스케줄러 스레드가 도는 중에 fork하면 잠금 상태까지 복제되므로 spawn으로 새 프로세스를 시작합니다.
+    """
+    global _extractor
+    if _extractor is None:
+        with _extractor_lock:
+            if _extractor is None:
+                _extractor = ProcessPoolExecutor(ATTACHMENT_EXTRACT_WORKERS,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+    return _extractor
+
+
+def _reset_extractor(broken: ProcessPoolExecutor):
+    """작업 프로세스가 비정상 종료되어 못 쓰게 된 풀을 버림 (다음 사용 시 새로 생성)"""
+    global _extractor
+    with _extractor_lock:
+        if _extractor is broken:
+            _extractor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+# 내려받기
+
+def _file_sha256(path: Path):
+    """이어받기 전 기존 부분 파일의 해시 상태"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(ATTACHMENT_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest
+
+
+def download(url: str, name: Optional[str] = None, max_bytes: int = ATTACHMENT_MAX_BYTES,
+             source: str = '') -> Dict[str, Any]:
+    """첨부파일을 스트리밍으로 받아 해시 이름의 파일로 저장하고 (sha256, size, kind, path) 반환
+
+    이전에 받다 만 부분 파일이 있으면 Range 요청으로 이어받고, 서버가 Range를 지원하지 않으면 처음부터 받습니다.
+    같은 해시의 파일이 이미 있으면 새로 받은 파일은 버립니다.
+    """
+    os.makedirs(PARTIAL_DIR, exist_ok=True)
+    partial = PARTIAL_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.part"
+    offset = partial.stat().st_size if partial.exists() else 0
+    headers = {'Range': f'bytes={offset}-'} if offset else None
+
+    response = open_stream(url, headers=headers)
+    try:
+        if response.status_code == 416 and offset:
+            # 부분 파일이 서버 파일보다 길거나 이미 끝까지 받은 상태 → 처음부터 다시
+            response.close()
+            offset = 0
+            response = open_stream(url)
+        response.raise_for_status()
+
+        resumed = offset > 0 and response.status_code == 206
+        if not resumed:
+            offset = 0
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit() and offset + int(length) > max_bytes:
+            raise AttachmentTooLarge(f"{offset + int(length)} bytes > {max_bytes} bytes")
+
+        name = name or _disposition_name(response.headers.get('Content-Disposition'))
+        digest = _file_sha256(partial) if resumed else hashlib.sha256()
+        size = offset
+        host = urlsplit(url).netloc
+        try:
+            with open(partial, 'ab' if resumed else 'wb') as f:
+                for chunk in response.iter_content(ATTACHMENT_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise AttachmentTooLarge(f"{size} bytes 이상 > {max_bytes} bytes")
+                    f.write(chunk)
+                    digest.update(chunk)
+                    FETCH_BYTES.inc(len(chunk), host=host)
+                    ATTACHMENT_BYTES.inc(len(chunk), source=source)
+        except AttachmentTooLarge:
+            partial.unlink(missing_ok=True)
+            raise
+        if resumed:
+            logger.info(f"첨부파일 이어받기 완료 ({offset}바이트부터): {url}")
+    finally:
+        response.close()
+
+    sha256 = digest.hexdigest()
+    kind = guess_kind(name, url) or sniff_kind(partial) or 'bin'
+    relative = Path(sha256[:2]) / f"{sha256}.{kind}"
+    target = ATTACHMENT_DIR / relative
+    if target.exists():
+        partial.unlink()
+    else:
+        os.makedirs(target.parent, exist_ok=True)
+        os.replace(partial, target)
+    return {'sha256': sha256, 'size': size, 'kind': kind, 'path': str(relative), 'name': name}
+
+
+# 파이프라인 싱크
+
+class AttachmentSink(Sink):
+    """아이템의 첨부파일을 받고 텍스트 추출을 프로세스 풀에 맡기는 싱크
+
+    write는 내려받기 작업을 스레드 풀에 넣고 바로 돌아오며(대기 중인 작업이 많으면 잠시 대기),
+    close는 내려받기가 끝나기를 작업 마감 시간까지만 기다립니다. 텍스트 추출은 공용 프로세스 풀에서 계속 진행됩니다.
+    """
+
+    def __init__(self, store: Optional[ItemStore] = None, max_workers: int = ATTACHMENT_DOWNLOAD_WORKERS):
+        self.store = store or get_store()
+        self._keys = {spec.name: key for key, spec in SOURCES.items()}
+        self._downloads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='attachment')
+        self._slots = threading.BoundedSemaphore(max_workers * 4)
+        self._futures: List[Future] = []
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._url_locks_lock = threading.Lock()
+        self.extractions: List[Future] = []
+        self.count = 0
+
+    def write(self, item: Any):
+        source = self._keys.get(getattr(item, 'source', None), '')
+        for attachment in getattr(item, 'attachments', None) or []:
+            self._slots.acquire()
+            future = self._downloads.submit(self._process, item.url, attachment, source)
+            future.add_done_callback(lambda _: self._slots.release())
+            self._futures.append(future)
+            self.count += 1
+
+    def close(self):
+        job = current_job()
+        _, not_done = wait(self._futures, timeout=job.remaining() if job is not None else None)
+        if not_done:
+            # 받던 파일은 부분 파일로 남아 다음 실행에서 이어받음
+            logger.warning(f"마감 시간까지 끝나지 않은 첨부파일 {len(not_done)}개는 다음 실행에서 이어받습니다.")
+        self._downloads.shutdown(wait=False, cancel_futures=True)
+        if self.count:
+            logger.info(f"첨부파일 처리: {self.count}개 (텍스트 추출 대기 {sum(not f.done() for f in self.extractions)}개)")
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        """같은 URL을 여러 아이템이 동시에 받지 않도록 URL별 잠금 (부분 파일 경로가 URL로 정해짐)"""
+        with self._url_locks_lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def _process(self, item_url: str, attachment: Dict[str, str], source: str):
+        url, name = attachment['url'], attachment.get('name')
+        record = {'item_url': item_url, 'url': url, 'name': name}
+        try:
+            existing = self.store.get_attachment(item_url, url)
+            if existing and existing['status'] in ('extracted', 'skipped'):
+                return
+
+            kind = guess_kind(name, url)
+            if kind and kind not in ATTACHMENT_EXTENSIONS:
+                self.store.save_attachment({**record, 'kind': kind, 'status': 'skipped'})
+                ATTACHMENTS.inc(source=source, result='skipped')
+                return
+
+            with self._url_lock(url):
+                known = self.store.find_attachment(url=url)
+                if known and (ATTACHMENT_DIR / known['path']).exists():
+                    record.update({field: known[field] for field in ('kind', 'sha256', 'size', 'path')})
+                    ATTACHMENTS.inc(source=source, result='reused')
+                else:
+                    downloaded = download(url, name, source=source)
+                    record.update(downloaded, name=name or downloaded['name'])
+                    ATTACHMENTS.inc(source=source, result='downloaded')
+
+            self._extract(record, source)
+        except AttachmentTooLarge as e:
+            logger.warning(f"첨부파일 크기 제한 초과로 건너뜀 ({url}): {str(e)}")
+            self.store.save_attachment({**record, 'status': 'skipped', 'error': str(e)})
+            ATTACHMENTS.inc(source=source, result='skipped')
+        except Exception as e:
+            logger.error(f"첨부파일 처리 오류 ({url}): {str(e)}")
+            self.store.save_attachment({**record, 'status': 'error', 'error': str(e)})
+            ATTACHMENTS.inc(source=source, result='error')
+            traceback.print_exc()
+
+    def _extract(self, record: Dict[str, Any], source: str):
+        """같은 해시의 텍스트가 있으면 연결만 하고, 없으면 프로세스 풀에서 추출"""
+        text_path = Path('text') / f"{record['sha256']}.txt"
+        if (ATTACHMENT_DIR / text_path).exists():
+            self.store.save_attachment({**record, 'text_path': str(text_path), 'status': 'extracted'})
+            return
+        if record['kind'] not in EXTRACTORS:
+            self.store.save_attachment({**record, 'status': 'skipped', 'error': f"지원하지 않는 형식: {record['kind']}"})
+            ATTACHMENTS.inc(source=source, result='skipped')
+            return
+
+        self.store.save_attachment({**record, 'status': 'downloaded'})
+        extractor = get_extractor()
+        try:
+            future = extractor.submit(extract_text, str(ATTACHMENT_DIR / record['path']), record['kind'])
+        except BrokenProcessPool:
+            _reset_extractor(extractor)
+            future = get_extractor().submit(extract_text, str(ATTACHMENT_DIR / record['path']), record['kind'])
+        future.add_done_callback(lambda done: self._save_text(record, text_path, done, source))
+        self.extractions.append(future)
+
+    def _save_text(self, record: Dict[str, Any], text_path: Path, future: Future, source: str):
+        """추출이 끝나면 텍스트 파일을 쓰고 레코드 갱신 (프로세스 풀 관리 스레드에서 호출)"""
+        try:
+            text = future.result()
+            os.makedirs(TEXT_DIR, exist_ok=True)
+            tmp_path = ATTACHMENT_DIR / text_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, ATTACHMENT_DIR / text_path)
+            self.store.save_attachment({**record, 'text_path': str(text_path), 'status': 'extracted'})
+            ATTACHMENTS.inc(source=source, result='extracted')
+        except ExtractorUnavailable as e:
+            logger.warning(f"첨부파일 텍스트 추출 생략 ({record['url']}): {str(e)}")
+            self.store.save_attachment({**record, 'status': 'unsupported', 'error': str(e)})
+            ATTACHMENTS.inc(source=source, result='unsupported')
+        except Exception as e:
+            logger.error(f"첨부파일 텍스트 추출 오류 ({record['url']}): {str(e)}")
+            self.store.save_attachment({**record, 'status': 'error', 'error': str(e)})
+            ATTACHMENTS.inc(source=source, result='error')
+
+
+def attachment_texts(item_url: str, store: Optional[ItemStore] = None) -> List[Tuple[str, str]]:
+    """아이템(URL) 첨부파일의 (이름, 추출 텍스트) 목록 (추출이 끝난 파일만)"""
+    store = store or get_store()
+    texts = []
+    for record in store.item_attachments(item_url):
+        if record['status'] != 'extracted' or not record['text_path']:
+            continue
+        with open(ATTACHMENT_DIR / record['text_path'], 'r', encoding='utf-8') as f:
+            texts.append((record['name'] or record['url'], f.read()))
+    return texts
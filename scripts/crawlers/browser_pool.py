@@ -0,0 +1,190 @@
+"""
+헤드리스 Chrome 브라우저 풀
+
+크롬 드라이버 경로는 프로세스당 한 번만 확인하고, 실행한 브라우저는 여러 페이지에 걸쳐 재사용합니다.
+일정 페이지 수를 처리했거나 브라우저가 비정상 종료되면 새 브라우저로 교체합니다.
+"""
+
+import os
+import sys
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from typing import Optional
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import DEFAULT_HEADERS, TIMEOUT, BROWSER_POOL_SIZE, BROWSER_MAX_PAGES
+from crawlers.metrics import BROWSER_LAUNCHES
+
+logger = logging.getLogger('browser_pool')
+
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path() -> str:
+    """크롬 드라이버 경로 확인 (프로세스당 한 번만 설치/조회)"""
+    global _driver_path
+    if _driver_path is None:
+        with _driver_path_lock:
+            if _driver_path is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _driver_path = ChromeDriverManager().install()
+                logger.info(f"크롬 드라이버 경로 확인: {_driver_path}")
+    return _driver_path
+
+
+def create_driver():
+    """헤드리스 크롬 웹드라이버 생성 (Selenium은 첫 브라우저를 띄울 때 임포트)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"user-agent={DEFAULT_HEADERS['User-Agent']}")
+
+    # 언어 설정
+    chrome_options.add_argument("--lang=ko-KR")
+
+    # 로깅 레벨 설정
+    chrome_options.add_argument("--log-level=3")
+
+    service = Service(resolve_driver_path())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+
+    # 페이지 로드 타임아웃 설정
+    driver.set_page_load_timeout(TIMEOUT)
+    return driver
+
+
+class _PooledDriver:
+    """풀에서 관리하는 드라이버와 처리한 페이지 수"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.aborted = False
+
+
+class BrowserPool:
+    """최대 size개의 브라우저를 유지하는 풀"""
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, max_pages: int = BROWSER_MAX_PAGES):
+        self.size = size
+        self.max_pages = max_pages
+        self._idle: LifoQueue = LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._in_use = set()
+        self.launches = 0
+        self.recycles = 0
+
+    def _launch(self) -> _PooledDriver:
+        """새 브라우저 실행"""
+        driver = create_driver()
+        with self._lock:
+            self.launches += 1
+        BROWSER_LAUNCHES.inc()
+        logger.info(f"브라우저 실행 (누적 {self.launches}회)")
+        return _PooledDriver(driver)
+
+    def _discard(self, pooled: _PooledDriver, reason: str):
+        """브라우저 종료 후 폐기"""
+        with self._lock:
+            self.recycles += 1
+        logger.info(f"브라우저 교체: {reason} (처리 페이지 {pooled.pages}개)")
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f"브라우저 종료 오류: {str(e)}")
+
+    @contextmanager
+    def driver(self):
+        """풀에서 브라우저를 빌려 사용하고 반납"""
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+
+        self._slots.acquire()
+        pooled = borrowed = None
+        try:
+            try:
+                pooled = self._idle.get_nowait()
+            except Empty:
+                pooled = self._launch()
+            borrowed = pooled
+            with self._lock:
+                self._in_use.add(borrowed)
+
+            try:
+                yield pooled.driver
+            except TimeoutException:
+                # 요소 대기 시간 초과는 브라우저 문제가 아니므로 그대로 반납
+                pooled.pages += 1
+                raise
+            except WebDriverException:
+                self._discard(pooled, "드라이버 오류")
+                pooled = None
+                raise
+
+            pooled.pages += 1
+            if pooled.pages >= self.max_pages:
+                self._discard(pooled, "최대 페이지 수 도달")
+                pooled = None
+        finally:
+            if borrowed is not None:
+                with self._lock:
+                    self._in_use.discard(borrowed)
+            if pooled is not None:
+                if self._closed or pooled.aborted:
+                    self._discard(pooled, "풀 종료")
+                else:
+                    self._idle.put(pooled)
+            self._slots.release()
+
+    def abort(self, reason: str = "작업 취소"):
+        """사용 중인 모든 브라우저 강제 종료 (멈춘 페이지 로드/대기 호출이 오류로 빠져나오게 함)"""
+        with self._lock:
+            in_use = list(self._in_use)
+        for pooled in in_use:
+            pooled.aborted = True
+            logger.warning(f"사용 중인 브라우저 강제 종료: {reason}")
+            try:
+                pooled.driver.quit()
+            except Exception as e:
+                logger.warning(f"브라우저 종료 오류: {str(e)}")
+
+    def close(self):
+        """대기 중인 모든 브라우저 종료"""
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except Empty:
+                break
+            try:
+                pooled.driver.quit()
+            except Exception:
+                pass
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> BrowserPool:
+    """프로세스 공용 브라우저 풀 반환 (종료 시 자동 정리)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool()
+                atexit.register(_pool.close)
+    return _pool
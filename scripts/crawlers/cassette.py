@@ -0,0 +1,201 @@
+"""
+HTTP 요청 기록/재생 카세트
+
+record 모드에서는 실제 요청과 응답(상태, 헤더, 본문, 소요 시간)을 DATA_DIR/cassettes/<이름>.jsonl에 순서대로 기록하고,
+replay 모드에서는 네트워크 없이 기록된 응답을 돌려줍니다. 재생 시 호스트별 지연과 지터를 넣거나
+기록 당시의 응답 시간을 그대로 재현할 수 있습니다.
+
+사용 예:
+    SCOPE_HTTP_MODE=record SCOPE_HTTP_CASSETTE=incident python -m scripts.scheduler
+    python -m scripts.crawlers.cassette record sample --pages 2
+    python -m scripts.crawlers.cassette replay sample --latency 0.1 --jitter 0.05 --host www.fsc.go.kr=0.3
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import random
+import logging
+import argparse
+import threading
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import CASSETTE_DIR, REPLAY_LATENCY
+
+logger = logging.getLogger('cassette')
+
+# 재생 시 응답 선택에 사용하는 조건부 요청 헤더
+VALIDATOR_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+
+class CassetteMiss(requests.ConnectionError):
+    """재생할 기록이 없는 요청 (네트워크 오류와 같은 경로로 처리됨)"""
+
+
+def cassette_path(name: str) -> Path:
+    return CASSETTE_DIR / f"{name}.jsonl"
+
+
+class Cassette:
+    """URL별 요청/응답 기록 (JSON Lines, 한 줄에 한 교환)"""
+
+    def __init__(self, name: str, path: Optional[Path] = None):
+        self.name = name
+        self.path = Path(path) if path else cassette_path(name)
+        self._lock = threading.Lock()
+        self._exchanges: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._cursors: Dict[str, int] = defaultdict(int)
+        self._seq = 0
+        self.latency: Dict[str, Tuple[float, float]] = dict(REPLAY_LATENCY)
+        self.use_recorded_latency = False
+        if self.path.exists():
+            self._load()
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    exchange = json.loads(line)
+                except ValueError:
+                    continue  # 기록 중 끊긴 줄
+                self._exchanges[exchange['url']].append(exchange)
+                self._seq = max(self._seq, exchange.get('seq', 0))
+        logger.info(f"카세트 로드: {self.path.name} ({self._seq}개 요청, URL {len(self._exchanges)}개)")
+
+    def __len__(self) -> int:
+        return sum(len(exchanges) for exchanges in self._exchanges.values())
+
+    # 기록
+
+    def record(self, url: str, request_headers: Dict[str, str], response: requests.Response, elapsed: float):
+        """요청/응답 한 건을 카세트 끝에 추가"""
+        with self._lock:
+            self._seq += 1
+            exchange = {
+                'seq': self._seq,
+                'at': datetime.now().isoformat(),
+                'method': 'GET',
+                'url': url,
+                'request_headers': {name: request_headers[name] for name in VALIDATOR_HEADERS
+                                    if request_headers.get(name)},
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': dict(response.headers),
+                'encoding': response.encoding,
+                'elapsed': round(elapsed, 4),
+                'body': base64.b64encode(response.content).decode('ascii'),
+            }
+            self._exchanges[url].append(exchange)
+            os.makedirs(self.path.parent, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(exchange, ensure_ascii=False) + '\n')
+
+    # 재생
+
+    def set_latency(self, host: str, latency: float, jitter: float = 0.0):
+        """재생 시 호스트별 지연 설정 ('*'는 기본값)"""
+        self.latency[host] = (latency, jitter)
+
+    def _delay(self, host: str, exchange: Dict[str, Any]) -> float:
+        if self.use_recorded_latency:
+            return exchange.get('elapsed', 0.0)
+        latency, jitter = self.latency.get(host, self.latency.get('*', (0.0, 0.0)))
+        return max(0.0, latency + random.uniform(-jitter, jitter)) if jitter else latency
+
+    def _next_exchange(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """기록 순서대로 응답 선택 (끝에 도달하면 마지막 응답 반복)"""
+        with self._lock:
+            exchanges = self._exchanges.get(url)
+            if not exchanges:
+                raise CassetteMiss(f"카세트 '{self.name}'에 기록되지 않은 요청: {url}")
+            index = min(self._cursors[url], len(exchanges) - 1)
+            self._cursors[url] += 1
+
+        exchange = exchanges[index]
+        # 기록 당시 304였어도 지금 요청에 검증자가 없으면(캐시 상태가 다르면) 직전의 전체 응답을 사용
+        if exchange['status'] == 304 and not any(headers.get(name) for name in VALIDATOR_HEADERS):
+            full = [candidate for candidate in exchanges if candidate['status'] == 200]
+            earlier = [candidate for candidate in full if candidate['seq'] < exchange['seq']]
+            if earlier or full:
+                return (earlier or full)[-1]
+        return exchange
+
+    def replay(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """기록된 응답으로 Response 객체 생성 (설정된 지연만큼 대기)"""
+        exchange = self._next_exchange(url, headers or {})
+        delay = self._delay(urlsplit(url).netloc, exchange)
+        if delay:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = exchange['status']
+        response.reason = exchange.get('reason')
+        response.headers = CaseInsensitiveDict(exchange.get('headers') or {})
+        response._content = base64.b64decode(exchange['body'])
+        response.encoding = exchange.get('encoding')
+        response.url = url
+        return response
+
+
+def _parse_host_latency(values: List[str]) -> Dict[str, float]:
+    latency = {}
+    for value in values:
+        host, _, seconds = value.partition('=')
+        latency[host] = float(seconds)
+    return latency
+
+
+def main(argv=None):
+    """카세트 기록/재생 CLI (보도자료 전체 수집을 한 번 실행)"""
+    parser = argparse.ArgumentParser(description='HTTP 요청 기록/재생으로 보도자료 수집 실행')
+    parser.add_argument('mode', choices=['record', 'replay'], help='기록 또는 재생')
+    parser.add_argument('name', help=f'카세트 이름 ({CASSETTE_DIR}/<이름>.jsonl)')
+    parser.add_argument('--pages', type=int, default=1, help='기관별 수집 페이지 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='재생 시 요청당 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='재생 시 지연 편차(초)')
+    parser.add_argument('--host', action='append', default=[], metavar='HOST=SECONDS',
+                        help='재생 시 호스트별 지연 (여러 번 지정 가능)')
+    parser.add_argument('--recorded-latency', action='store_true', help='기록 당시 응답 시간 그대로 재생')
+    args = parser.parse_args(argv)
+
+    from crawlers import transport
+    from crawlers.http_cache import HttpCache, set_cache
+    from crawlers.press_crawler import fetch_all_press_releases
+    import tempfile
+
+    if args.mode == 'record' and cassette_path(args.name).exists():
+        os.remove(cassette_path(args.name))
+    cassette = transport.set_mode(args.mode, args.name)
+    if args.mode == 'replay':
+        cassette.set_latency('*', args.latency, args.jitter)
+        for host, seconds in _parse_host_latency(args.host).items():
+            cassette.set_latency(host, seconds, args.jitter)
+        cassette.use_recorded_latency = args.recorded_latency
+
+    # 기록과 재생이 같은 요청을 보내도록 빈 HTTP 캐시에서 전체 페이지를 수집
+    with tempfile.TemporaryDirectory(prefix='cassette_http_cache_') as cache_dir:
+        previous = set_cache(HttpCache(cache_dir))
+        try:
+            start = time.perf_counter()
+            items = fetch_all_press_releases(max_pages=args.pages, incremental=False)
+            elapsed = time.perf_counter() - start
+        finally:
+            set_cache(previous)
+
+    print(f"{args.mode}: {len(items)}개 항목, {elapsed:.2f}초, 카세트 {cassette.path} ({len(cassette)}개 요청)")
+    print(transport.format_stats())
+
+
+if __name__ == "__main__":
+    main()
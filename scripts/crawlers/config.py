@@ -5,20 +5,34 @@ URL, 헤더, 타임아웃 등 공통 설정 정의
 
 import os
 import json
-from datetime import datetime, timedelta
+import logging
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # 기본 경로 설정
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = BASE_DIR / "data"
 LOG_DIR = BASE_DIR / "logs"
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+CRAWL_STATE_FILE = DATA_DIR / "crawl_state.json"
+ITEM_DB_PATH = DATA_DIR / "items.db"
+CASSETTE_DIR = DATA_DIR / "cassettes"
+ATTACHMENT_DIR = DATA_DIR / "attachments"
 
-# 디렉토리가 없으면 생성
-os.makedirs(DATA_DIR, exist_ok=True)
-os.makedirs(LOG_DIR, exist_ok=True)
+# 수집 날짜 기준 시간대 (모든 날짜는 KST ISO 8601 문자열로 저장)
+KST = timezone(timedelta(hours=9), 'KST')
+
+# 검색 기간 설정 (기본: 3개월)
+LOOKBACK_DAYS = 90
+
+# 증분 수집 시 기관별 최대 탐색 페이지 수 (신규 게시물이 한 페이지를 넘칠 때만 사용)
+MAX_PRESS_PAGES = 5
+
+
+def get_start_date() -> datetime:
+    """검색 시작 날짜 (호출 시점 기준으로 계산, KST)"""
+    return datetime.now(KST) - timedelta(days=LOOKBACK_DAYS)
 
-# 검색 시작 날짜 설정 (기본: 3개월 전)
-START_DATE = datetime.now() - timedelta(days=90)
 
 # 기본 헤더 설정
 DEFAULT_HEADERS = {
@@ -28,28 +42,95 @@ DEFAULT_HEADERS = {
 }
 
 # 타임아웃 설정
-TIMEOUT = 30  # 초
-
-# URL 설정
-URLS = {
-    'fsc': {
-        'base': 'https://www.fsc.go.kr',
-        'list': 'https://www.fsc.go.kr/no010101?curPage={page}'
-    },
-    'fss': {
-        'base': 'https://www.fss.or.kr',
-        'list': 'https://www.fss.or.kr/fss/bbs/B0000188/list.do?menuNo=200218&bbsId=B0000188&pageIndex={page}'
-    },
-    'bok': {
-        'base': 'https://www.bok.or.kr',
-        'list': 'https://www.bok.or.kr/portal/bbs/B0000338/list.do?menuNo=200761&pageIndex={page}'
-    },
-    'msit': {
-        'base': 'https://www.msit.go.kr',
-        'list': 'https://www.msit.go.kr/bbs/list.do?sCode=user&mId=129&mPid=112&bbsSeqNo=94&pageIndex={page}'
-    }
+TIMEOUT = 30  # 초 (응답 대기)
+CONNECT_TIMEOUT = 5  # 초 (연결 수립, 내려간 호스트에서 오래 기다리지 않도록 짧게)
+
+# 호스트별 최대 동시 요청 수
+MAX_CONCURRENCY_PER_HOST = 2
+
+# 커넥션 풀을 유지할 최대 호스트 수
+HTTP_MAX_HOSTS = 10
+
+# 호스트별 요청 속도 제한 (초당 요청 수, 순간 허용량), '*'는 나머지 호스트 기본값
+HOST_RATE_LIMITS = {
+    '*': (2.0, 4),
 }
 
+# 재시도 설정 (연결 오류, 시간 초과, 아래 상태 코드는 지수 백오프 + 지터로 재시도)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_MAX_ATTEMPTS = 3  # 첫 요청 포함 최대 시도 횟수
+RETRY_BACKOFF_BASE = 0.5  # 초
+RETRY_BACKOFF_MAX = 10  # 초
+
+# 서킷 브레이커 설정 (연속 실패 시 쿨다운 동안 해당 호스트 요청 생략)
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN = 300  # 초
+
+# HTTP 전송 모드: live(실제 요청), record(실제 요청 + 카세트 기록), replay(카세트 재생, 네트워크 사용 안 함)
+HTTP_MODE = os.environ.get('SCOPE_HTTP_MODE', 'live')
+HTTP_CASSETTE = os.environ.get('SCOPE_HTTP_CASSETTE', 'default')
+
+# 재생 시 호스트별 인위적 지연 (초, 지연 ± 지터), '*'는 나머지 호스트 기본값
+REPLAY_LATENCY = {
+    '*': (0.0, 0.0),
+}
+
+# 스케줄러 메트릭 엔드포인트 (Prometheus 텍스트 형식, 포트 0이면 사용 안 함)
+METRICS_HOST = os.environ.get('SCOPE_METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.environ.get('SCOPE_METRICS_PORT', '9108'))
+
+# 보도자료 소스(URL, 선택자 등)는 crawlers/sources.py의 SOURCES 레지스트리에 정의
+
+# 뉴스 크롤링용 브라우저 풀 설정
+BROWSER_POOL_SIZE = 3  # 동시에 유지할 브라우저 수
+BROWSER_MAX_PAGES = 20  # 브라우저 하나가 처리할 최대 페이지 수 (초과 시 재시작)
+
+# 스케줄 방식: fixed(매시 정해진 분에 전체 수집), adaptive(소스별 게시 패턴에 따라 간격 조정)
+SCHEDULE_MODE = os.environ.get('SCOPE_SCHEDULE_MODE', 'fixed')
+
+# 스케줄러 작업 실행 설정 (보도자료는 기관별 작업, 뉴스는 하나의 작업)
+JOB_MAX_WORKERS = 8  # 동시에 실행할 최대 작업 수
+JOB_TIMEOUT_PRESS = 300  # 기관별 보도자료 작업 마감 시간 (초)
+JOB_TIMEOUT_NEWS = 900  # 뉴스 작업 마감 시간 (초)
+JOB_CANCEL_GRACE = 10  # 마감 후 작업이 정리되기를 기다리는 시간 (초)
+
+# 적응형 폴링 설정 (간격 단위: 분)
+POLL_MIN_INTERVAL = 10  # 게시가 잦은 시간대의 최소 간격
+POLL_MAX_INTERVAL = 240  # 한산한 시간대(야간, 주말)의 최대 간격
+POLL_DEFAULT_INTERVAL = 60  # 이력이 부족한 소스의 기본 간격
+POLL_TARGET_ITEMS = 0.25  # 다음 폴링까지 쌓일 것으로 기대하는 신규 게시물 수
+POLL_IDLE_BACKOFF = 1.5  # 게시가 기대되던 폴링이 연속으로 비었을 때 목표치 증가 배율
+POLL_HISTORY_DAYS = 28  # 게시 패턴을 학습할 이력 기간
+POLL_MIN_HISTORY = 5  # 패턴 학습에 필요한 최소 게시물 수
+
+# 보도자료 상세 페이지 수집 설정
+DETAIL_MAX_WORKERS = 4  # 동시에 받을 상세 페이지 수 (호스트별 제한은 HOST_RATE_LIMITS 적용)
+DETAIL_SUMMARY_CHARS = 200  # 본문 앞부분으로 만드는 요약 길이
+DETAIL_MAX_BODY_CHARS = 20000  # 저장할 본문 최대 길이
+
+# 보도자료 첨부파일 수집 설정
+ATTACHMENT_EXTENSIONS = ('pdf', 'hwp', 'hwpx', 'txt')  # 받아서 텍스트를 추출할 형식 (확장자를 모르면 받은 뒤 판별)
+ATTACHMENT_MAX_BYTES = 50 * 1024 * 1024  # 첨부파일 하나의 최대 크기 (초과하면 받지 않음)
+ATTACHMENT_CHUNK_SIZE = 64 * 1024  # 스트리밍 저장 단위 (바이트)
+ATTACHMENT_DOWNLOAD_WORKERS = 4  # 동시에 받을 첨부파일 수
+ATTACHMENT_EXTRACT_WORKERS = 2  # 텍스트 추출 프로세스 수
+
+# 요약·태그 생성 설정 (OpenAI 호환 Chat Completions 엔드포인트, 키와 주소가 모두 없으면 사용 안 함)
+# 로컬 호환 서버(vLLM, Ollama 등)를 쓸 때는 SCOPE_SUMMARY_API_BASE만 지정하면 됨
+SUMMARY_API_BASE = os.environ.get('SCOPE_SUMMARY_API_BASE', '')
+SUMMARY_API_KEY = os.environ.get('OPENAI_API_KEY', '')
+SUMMARY_MODEL = os.environ.get('SCOPE_SUMMARY_MODEL', 'gpt-4o')
+SUMMARY_TIMEOUT = 120  # 요청 하나의 응답 대기 시간 (초)
+SUMMARY_BATCH_ITEMS = 10  # 요청 하나에 묶는 최대 아이템 수
+SUMMARY_BATCH_CHARS = 12000  # 요청 하나에 넣는 최대 본문 길이 (문자)
+SUMMARY_ITEM_CHARS = 3000  # 아이템 하나에서 보내는 최대 본문 길이 (문자)
+SUMMARY_MAX_WORKERS = 2  # 동시에 보내는 요청 수
+SUMMARY_MAX_CHARS = 200  # 요약 최대 길이
+SUMMARY_MAX_TAGS = 5  # 아이템당 추가할 최대 태그 수
+
+# 뉴스 중복 판정 기준 (제목 토큰 자카드 유사도, 이상이면 같은 기사)
+NEWS_DUP_THRESHOLD = 0.6
+
 # 뉴스 검색 키워드 설정
 NEWS_KEYWORDS = [
     '신한은행',
@@ -60,9 +141,48 @@ NEWS_KEYWORDS = [
     '금융 사기'
 ]
 
+# 태그 분류 사전 (대표 태그: 동의어·표기 변형 목록)
+# NEWS_KEYWORDS는 동의어 없이 자동으로 포함되며, 공백이 있는 용어는 붙여 쓴 표기도 함께 찾음
+TAXONOMY = {
+    '보이스피싱': ['보이스 피싱', '전화금융사기', '전기통신금융사기', '메신저피싱', '스미싱'],
+    '금융 사기': ['금융사기', '불법사금융', '대출사기'],
+    '금융소비자보호': ['금융소비자 보호', '금융소비자보호법', '금소법', '소비자보호'],
+    '디지털금융': ['디지털 금융', '전자금융', '모바일뱅킹', '인터넷뱅킹'],
+    '장애인 금융': ['장애인'],
+    '금융취약계층': ['금융 취약계층', '취약계층', '고령층', '디지털 소외'],
+    '핀테크': ['fintech'],
+    '마이데이터': ['mydata', '본인신용정보관리업'],
+    '가상자산': ['가상화폐', '암호화폐', '스테이블코인', '디지털자산'],
+    '기준금리': ['기준 금리', '금리 인상', '금리 인하', '금리 동결', '통화정책'],
+    '가계부채': ['가계 부채', '가계대출', 'DSR', '총부채원리금상환비율'],
+    '부동산 PF': ['PF 대출', '프로젝트파이낸싱'],
+    '인터넷전문은행': ['인터넷은행', '카카오뱅크', '케이뱅크', '토스뱅크'],
+    '금융위원회': ['금융위'],
+    '금융감독원': ['금감원'],
+    '한국은행': ['한은'],
+    '과학기술정보통신부': ['과기정통부', '과기부'],
+    '신한은행': ['신한금융', '신한금융지주'],
+}
+TAG_MAX_PER_ITEM = 5  # 분류 사전으로 아이템에 추가할 최대 태그 수
+
+# 로깅 설정 함수 (임포트할 때가 아니라 실행 진입점에서 호출)
+def setup_logging(name):
+    """LOG_DIR/<name>_<날짜>.log 파일과 콘솔로 로그 출력 (이미 설정되어 있으면 그대로 둠)"""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    log_file = LOG_DIR / f"{name}_{datetime.now().strftime('%Y%m%d')}.log"
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
 # 데이터 저장 함수
 def save_data(data, filename):
     """데이터를 JSON 파일로 저장"""
+    os.makedirs(DATA_DIR, exist_ok=True)
     filepath = DATA_DIR / filename
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
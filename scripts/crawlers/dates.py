@@ -0,0 +1,170 @@
+"""
+날짜 문자열 정규화
+
+보도자료 게시판의 절대 날짜("2024.06.01", "2024년 6월 1일"), 네이버의 상대 시간("3시간 전", "어제"),
+구글 뉴스의 ISO 8601 / RFC 2822 시각을 하나의 정규식으로 분기하여 KST 기준 ISO 문자열로 변환합니다.
+문자열 해석 결과는 캐시하므로 같은 표기가 반복되는 목록 페이지에서는 한 번만 해석합니다.
+해석할 수 없는 입력은 현재 시각으로 대체하지 않고 None을 반환하며 실패 목록에 기록합니다.
+"""
+
+import os
+import re
+import sys
+import logging
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import KST
+
+logger = logging.getLogger('dates')
+
+# 형식별 분기 정규식 (매치된 그룹 이름으로 해석 함수를 고름)
+_DATE_PATTERN = re.compile(r'''
+    ^\s*(?:
+        (?P<iso>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?\s*(?:Z|[+-]\d{2}:?\d{2})?)
+      | (?P<ymd>(?P<y>\d{4}|\d{2})\s*[-./년]\s*(?P<m>\d{1,2})\s*[-./월]\s*(?P<d>\d{1,2})\s*일?\s*\.?
+            (?:\s*\(?[월화수목금토일]\)?)?
+            (?:\s*(?P<ampm>오전|오후)?\s*(?P<H>\d{1,2}):(?P<M>\d{2})(?::(?P<S>\d{2}))?)?)
+      | (?P<rel>(?P<amount>\d+)\s*(?P<unit>초|분|시간|일|주|개월|달|년)\s*전)
+      | (?P<word>방금\s*전?|오늘|어제|그제|그저께)
+      | (?P<rfc>[A-Za-z]{3},\s*\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{2}:\d{2}(?::\d{2})?\s+\S+)
+    )\s*$
+''', re.VERBOSE)
+
+_RELATIVE_UNITS = {
+    '초': timedelta(seconds=1),
+    '분': timedelta(minutes=1),
+    '시간': timedelta(hours=1),
+    '일': timedelta(days=1),
+    '주': timedelta(weeks=1),
+    '개월': timedelta(days=30),
+    '달': timedelta(days=30),
+    '년': timedelta(days=365),
+}
+
+# 날짜만 바뀌는 표현 (일 단위로 자정 기준)
+_DAY_WORDS = {'오늘': 0, '어제': 1, '그제': 2, '그저께': 2}
+
+# 해석 결과: ('abs', datetime) 또는 ('rel', timedelta) 또는 ('day', 며칠 전)
+Parsed = Tuple[str, object]
+
+_failures: Counter = Counter()
+_failures_lock = threading.Lock()
+
+
+def _to_kst(dt: datetime) -> datetime:
+    """시간대가 없으면 KST로 간주, 있으면 KST로 변환"""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=KST)
+    return dt.astimezone(KST)
+
+
+def _parse_ymd(match) -> datetime:
+    year = int(match.group('y'))
+    if year < 100:
+        year += 2000
+    hour = int(match.group('H') or 0)
+    if match.group('ampm') == '오후' and hour < 12:
+        hour += 12
+    elif match.group('ampm') == '오전' and hour == 12:
+        hour = 0
+    return datetime(year, int(match.group('m')), int(match.group('d')),
+                    hour, int(match.group('M') or 0), int(match.group('S') or 0), tzinfo=KST)
+
+
+def _parse_iso(text: str) -> datetime:
+    text = text.strip().replace(' ', 'T', 1)
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    elif re.search(r'[+-]\d{4}$', text):
+        text = text[:-2] + ':' + text[-2:]
+    return _to_kst(datetime.fromisoformat(text))
+
+
+@lru_cache(maxsize=4096)
+def _parse(text: str) -> Optional[Parsed]:
+    """문자열을 현재 시각과 무관한 해석 결과로 변환 (실패 시 None)"""
+    match = _DATE_PATTERN.match(text)
+    if not match:
+        return None
+    kind = match.lastgroup
+    try:
+        if kind == 'iso':
+            return 'abs', _parse_iso(match.group('iso'))
+        if kind == 'ymd':
+            return 'abs', _parse_ymd(match)
+        if kind == 'rel':
+            return 'rel', int(match.group('amount')) * _RELATIVE_UNITS[match.group('unit')]
+        if kind == 'word':
+            word = match.group('word')
+            if word.startswith('방금'):
+                return 'rel', timedelta(0)
+            return 'day', _DAY_WORDS[word]
+        if kind == 'rfc':
+            return 'abs', _to_kst(parsedate_to_datetime(match.group('rfc')))
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return None
+
+
+def _resolve(parsed: Parsed, now: datetime) -> datetime:
+    kind, value = parsed
+    if kind == 'abs':
+        return value
+    if kind == 'rel':
+        return now - value
+    day = now - timedelta(days=value)
+    return day.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _record_failure(text: str):
+    with _failures_lock:
+        _failures[text] += 1
+    logger.warning(f"날짜 해석 실패: {text!r}")
+
+
+def parse_datetime(text: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """날짜 문자열을 KST 시각으로 변환 (해석할 수 없으면 None, 상대 시간은 now 기준)"""
+    if not text or not text.strip():
+        _record_failure(text or '')
+        return None
+    parsed = _parse(text)
+    if parsed is None:
+        _record_failure(text)
+        return None
+    return _resolve(parsed, _to_kst(now) if now else datetime.now(KST))
+
+
+def normalize_date(text: str, now: Optional[datetime] = None) -> Optional[str]:
+    """날짜 문자열을 KST ISO 8601 문자열로 변환 (해석할 수 없으면 None)"""
+    dt = parse_datetime(text, now)
+    return dt.isoformat() if dt else None
+
+
+def normalize_dates(texts: Iterable[str], now: Optional[datetime] = None) -> List[Optional[str]]:
+    """여러 날짜 문자열을 같은 기준 시각으로 한 번에 변환 (같은 문자열은 한 번만 해석)"""
+    now = _to_kst(now) if now else datetime.now(KST)
+    results: Dict[str, Optional[str]] = {}
+    output = []
+    for text in texts:
+        if text not in results:
+            results[text] = normalize_date(text, now)
+        output.append(results[text])
+    return output
+
+
+def get_failures() -> Dict[str, int]:
+    """해석에 실패한 입력과 횟수"""
+    with _failures_lock:
+        return dict(_failures)
+
+
+def reset_failures():
+    with _failures_lock:
+        _failures.clear()
@@ -0,0 +1,230 @@
+"""
+뉴스 중복 제거
+
+같은 기사가 네이버(언론사 URL)와 구글 뉴스(news.google.com 리다이렉트 URL)에서 각각 수집되는 경우를
+걸러냅니다. URL은 추적 파라미터를 제거하고 구글 리다이렉트를 원래 주소로 풀어 정규화하고,
+제목은 MinHash 서명을 밴드별로 색인(LSH)하여 토큰 자카드 유사도가 기준 이상인 기사를 한 묶음으로 봅니다.
+아이템마다 밴드 수만큼의 버킷 조회만 하므로 전체 처리 시간은 아이템 수에 비례합니다.
+"""
+
+import os
+import re
+import sys
+import base64
+import random
+import hashlib
+import logging
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import NEWS_DUP_THRESHOLD
+from crawlers.search import tokenize
+
+logger = logging.getLogger('dedup')
+
+# 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'referrer', 'cmpid',
+}
+TRACKING_PREFIXES = ('utm_', 'ga_', 'oc_')
+
+GOOGLE_NEWS_HOSTS = {'news.google.com'}
+GOOGLE_REDIRECT_HOSTS = {'www.google.com', 'google.com', 'www.google.co.kr', 'google.co.kr'}
+
+# MinHash LSH 설정 (밴드 20개 × 3행: 자카드 0.6인 쌍이 후보로 잡힐 확률 약 99%)
+MINHASH_BANDS = 20
+MINHASH_ROWS = 3
+MINHASH_PRIME = (1 << 61) - 1
+# 버킷마다 비교할 최근 대표 아이템 수 (같은 주제 기사가 몰려도 아이템당 비교 횟수를 상수로 유지)
+MAX_BUCKET_CANDIDATES = 16
+_rng = random.Random(20240601)
+_MINHASH_PARAMS = [
+    (_rng.randrange(1, MINHASH_PRIME), _rng.randrange(0, MINHASH_PRIME))
+    for _ in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+
+_URL_IN_BYTES = re.compile(rb'https?://[\x21-\x7e]+')
+# 제목 앞뒤의 [속보], [단독], (종합2보) 같은 말머리
+_TITLE_MARKERS = re.compile(r'^\s*(?:[\[【<〈][^\]】>〉]{1,10}[\]】>〉]\s*)+|\s*\((?:종합|상보|속보)[^)]{0,5}\)\s*$')
+
+
+def _decode_google_article(article_id: str) -> Optional[str]:
+    """구글 뉴스 기사 ID(base64 인코딩된 protobuf)에서 원래 URL 추출 (실패 시 None)"""
+    try:
+        data = base64.urlsafe_b64decode(article_id + '=' * (-len(article_id) % 4))
+    except (ValueError, TypeError):
+        return None
+    match = _URL_IN_BYTES.search(data)
+    if not match:
+        return None
+    url, start = match.group(0), match.start()
+    # URL 앞의 protobuf 길이 접두사(varint)로 뒤에 붙은 다른 필드를 잘라냄
+    if start >= 2 and data[start - 2] & 0x80:
+        length = (data[start - 2] & 0x7f) | (data[start - 1] << 7)
+    else:
+        length = data[start - 1] if start >= 1 else 0
+    if 0 < length < len(url):
+        url = url[:length]
+    return url.decode('ascii', errors='ignore')
+
+
+def resolve_redirect(url: str) -> str:
+    """구글 뉴스/검색 리다이렉트 URL을 원래 기사 URL로 변환 (풀 수 없으면 그대로)"""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+
+    if host in GOOGLE_NEWS_HOSTS:
+        segments = [segment for segment in parts.path.split('/') if segment]
+        if len(segments) >= 2 and segments[-2] in ('articles', 'read'):
+            decoded = _decode_google_article(segments[-1])
+            if decoded:
+                return decoded
+        return url
+
+    if host in GOOGLE_REDIRECT_HOSTS and parts.path == '/url':
+        params = dict(parse_qsl(parts.query))
+        target = params.get('url') or params.get('q')
+        if target and target.startswith(('http://', 'https://')):
+            return target
+
+    return url
+
+
+def _is_tracking_param(key: str) -> bool:
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+def clean_url(url: str) -> str:
+    """리다이렉트를 풀고 추적 파라미터와 프래그먼트를 제거한 URL (그대로 접속 가능한 주소)"""
+    if not url:
+        return url
+    parts = urlsplit(resolve_redirect(url.strip()))
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not _is_tracking_param(key)]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+def canonicalize_url(url: str) -> str:
+    """비교용 정규화 URL (clean_url에 더해 http/https, www./m. 접두사, 파라미터 순서 차이 무시)"""
+    if not url:
+        return url
+    parts = urlsplit(clean_url(url))
+    host = parts.netloc.lower()
+    if host.endswith(':443') or host.endswith(':80'):
+        host = host.rsplit(':', 1)[0]
+    if host.startswith('www.'):
+        host = host[4:]
+    if host.startswith('m.') and host.count('.') >= 2:
+        host = host[2:]
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(('https', host, parts.path.rstrip('/') or '/', query, ''))
+
+
+def normalize_title(title: str) -> str:
+    """말머리와 (종합) 표기를 떼어낸 비교용 제목"""
+    title = unicodedata.normalize('NFKC', title or '')
+    return _TITLE_MARKERS.sub('', title).strip()
+
+
+@lru_cache(maxsize=65536)
+def _token_signature(token: str) -> Tuple[int, ...]:
+    """토큰 하나의 해시 함수별 값 (자주 나오는 바이그램은 캐시에서 재사용)"""
+    x = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+    return tuple((a * x + b) % MINHASH_PRIME for a, b in _MINHASH_PARAMS)
+
+
+def title_shingles(title: str) -> FrozenSet[str]:
+    """제목의 토큰 집합 (한글 음절 바이그램, 영문/숫자 단어)"""
+    return frozenset(tokenize(title))
+
+
+def minhash(shingles: FrozenSet[str]) -> List[int]:
+    """토큰 집합의 MinHash 서명 (서명 값이 같을 확률 = 두 집합의 자카드 유사도)"""
+    return list(map(min, zip(*(_token_signature(token) for token in shingles))))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """정규화 URL 완전 일치와 제목 자카드 유사도로 중복 묶음을 찾는 색인
+
+    MinHash 서명을 MINHASH_ROWS개씩 밴드로 나누어 버킷에 색인하고(LSH), 같은 버킷에 걸린
+    후보만 실제 토큰 집합의 자카드 유사도로 확인합니다.
+    """
+
+    def __init__(self, threshold: float = NEWS_DUP_THRESHOLD):
+        self.threshold = threshold
+        self._urls: Dict[str, int] = {}
+        self._buckets: Dict[tuple, List[int]] = defaultdict(list)
+        self._shingles: List[FrozenSet[str]] = []
+
+    @staticmethod
+    def _band_keys(signature: List[int]):
+        for band in range(MINHASH_BANDS):
+            yield (band,) + tuple(signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS])
+
+    def find(self, url: str, shingles: FrozenSet[str], signature: Optional[List[int]]) -> Optional[int]:
+        """이미 등록된 같은 묶음의 대표 번호 반환 (없으면 None)"""
+        if url in self._urls:
+            return self._urls[url]
+        if not signature:
+            return None
+        checked = set()
+        for key in self._band_keys(signature):
+            for cluster in reversed(self._buckets.get(key, [])[-MAX_BUCKET_CANDIDATES:]):
+                if cluster in checked:
+                    continue
+                checked.add(cluster)
+                if jaccard(shingles, self._shingles[cluster]) >= self.threshold:
+                    return cluster
+        return None
+
+    def add(self, url: str, shingles: FrozenSet[str], signature: Optional[List[int]]) -> int:
+        """새 대표 아이템 등록 후 묶음 번호 반환"""
+        cluster = len(self._shingles)
+        self._shingles.append(shingles)
+        self._urls[url] = cluster
+        if signature:
+            for key in self._band_keys(signature):
+                self._buckets[key].append(cluster)
+        return cluster
+
+    def check(self, url: str, title: str) -> bool:
+        """처음 보는 기사면 등록하고 True, 기존 묶음의 중복이면 URL만 묶음에 추가하고 False"""
+        shingles = title_shingles(title)
+        signature = minhash(shingles) if shingles else None
+        cluster = self.find(url, shingles, signature)
+        if cluster is None:
+            self.add(url, shingles, signature)
+            return True
+        self._urls.setdefault(url, cluster)
+        return False
+
+
+def dedup_news(items: Iterable, threshold: Optional[float] = None) -> Iterator:
+    """정규화 URL과 제목 유사도로 중복을 거르고 각 묶음의 첫 아이템만 yield
+
+    대표 아이템의 url은 리다이렉트와 추적 파라미터를 걷어낸 주소로 바꿔, 구글 경로로 먼저 수집된 기사도
+    언론사 URL로 저장되게 합니다.
+    """
+    index = NearDuplicateIndex(NEWS_DUP_THRESHOLD if threshold is None else threshold)
+    total = kept = 0
+    for item in items:
+        total += 1
+        if not index.check(canonicalize_url(item.url), normalize_title(item.title)):
+            continue
+        item.url = clean_url(item.url)
+        kept += 1
+        yield item
+    logger.info(f"뉴스 중복 제거: {total}개 중 {kept}개 유지 ({total - kept}개 중복)")
@@ -0,0 +1,119 @@
+"""
+보도자료 상세 페이지 수집
+
+목록에서 찾은 보도자료의 상세 페이지를 동시에 받아 본문 텍스트와 첨부파일 링크를 추출하고,
+본문 앞부분으로 요약(summary)을 채웁니다.
+상세 페이지 원문 해시(contentHash)를 함께 저장하여, 저장소에 이미 본문이 있는 게시물은 다시 요청하지 않고
+다시 받은 페이지도 해시가 같으면 HTTP 캐시에 저장해 둔 추출 결과를 그대로 사용합니다.
+"""
+
+import os
+import sys
+import re
+import logging
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import DETAIL_MAX_WORKERS, DETAIL_SUMMARY_CHARS, DETAIL_MAX_BODY_CHARS
+from crawlers.models import SourceItem
+from crawlers.http_cache import get_cache
+from crawlers.sources import SOURCES, get_detail_parser
+from crawlers.store import ItemStore, get_store
+from crawlers.metrics import DETAIL_PAGES, SOURCE_ERRORS
+
+logger = logging.getLogger('detail')
+
+# 상세 정보로 채우는 아이템 필드
+DETAIL_FIELDS = ('summary', 'body', 'attachments', 'contentHash')
+
+
+def make_summary(body: str, limit: int = DETAIL_SUMMARY_CHARS) -> str:
+    """본문 앞부분으로 만든 한 단락 요약 (limit자 초과 시 말줄임)"""
+    text = re.sub(r'\s+', ' ', body).strip()
+    if len(text) <= limit:
+        return text
+    return text[:limit].rstrip() + '…'
+
+
+def fetch_detail(key: str, url: str) -> Tuple[Dict[str, Any], str]:
+    """상세 페이지를 받아 (상세 정보, 처리 결과) 반환 (원문 해시가 같으면 저장된 추출 결과 재사용)"""
+    cache = get_cache()
+    page = cache.get(url)
+    if page.unchanged and page.items:
+        return page.items[0], 'unchanged'
+
+    parsed = get_detail_parser(key).parse(page.text, url)
+    body = parsed.body[:DETAIL_MAX_BODY_CHARS]
+    detail = {
+        'summary': make_summary(body) if body else None,
+        'body': body,
+        'attachments': parsed.attachments,
+        'contentHash': page.content_hash,
+    }
+    cache.store_items(url, page.content_hash, [detail])
+    return detail, 'parsed'
+
+
+def apply_detail(item: SourceItem, detail: Dict[str, Any]) -> SourceItem:
+    """상세 정보를 아이템에 반영 (본문이 비어 있으면 기존 요약 유지)"""
+    for name in DETAIL_FIELDS:
+        value = detail.get(name)
+        if value is not None:
+            setattr(item, name, value)
+    return item
+
+
+def enrich_details(items: Iterable[SourceItem], max_workers: int = DETAIL_MAX_WORKERS,
+                   store: Optional[ItemStore] = None) -> Iterator[SourceItem]:
+    """보도자료 아이템마다 상세 페이지 정보를 채워 완료되는 순서대로 yield
+
+    저장소에 원문 해시가 있는 게시물은 저장된 상세 정보를 복사하고 요청하지 않으며,
+    상세 페이지 수집에 실패한 아이템은 목록 정보만으로 그대로 내보냅니다.
+    동시에 진행하는 요청은 max_workers의 두 배까지로 제한하여 입력을 한꺼번에 읽어 들이지 않습니다.
+    """
+    store = store or get_store()
+    keys = {spec.name: key for key, spec in SOURCES.items()}
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='detail')
+    pending: Dict[Future, Tuple[SourceItem, str]] = {}
+
+    def finish(done: Set[Future]) -> Iterator[SourceItem]:
+        for future in done:
+            item, key = pending.pop(future)
+            try:
+                detail, result = future.result()
+                apply_detail(item, detail)
+                DETAIL_PAGES.inc(source=key, result=result)
+            except Exception as e:
+                logger.error(f"{item.source} 상세 페이지 수집 오류 ({item.url}): {str(e)}")
+                DETAIL_PAGES.inc(source=key, result='error')
+                SOURCE_ERRORS.inc(source=key, stage='detail')
+                traceback.print_exc()
+            yield item
+
+    try:
+        for item in items:
+            key = keys.get(item.source)
+            if key is None or item.contentHash:
+                yield item
+                continue
+
+            stored = store.get_items([item.url]).get(item.url)
+            if stored and stored.get('contentHash'):
+                DETAIL_PAGES.inc(source=key, result='stored')
+                yield apply_detail(item, stored)
+                continue
+
+            pending[executor.submit(fetch_detail, key, item.url)] = (item, key)
+            if len(pending) >= max_workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finish(done)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from finish(done)
+    finally:
+        # 중간에 멈추면(마감 시간 초과 등) 아직 시작하지 않은 요청은 취소
+        executor.shutdown(wait=False, cancel_futures=True)
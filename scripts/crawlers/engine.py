@@ -0,0 +1,94 @@
+"""
+비동기 크롤링 엔진
+
+asyncio를 사용하여 여러 기관과 페이지를 동시에 수집합니다.
+호스트별 동시 요청 수는 세마포어로 제한합니다.
+"""
+
+import os
+import sys
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import MAX_CONCURRENCY_PER_HOST
+
+logger = logging.getLogger('engine')
+
+# (호스트, 실행 함수, 인자) 형식의 작업 정의
+CrawlJob = Tuple[str, Callable[..., Any], tuple]
+
+
+class CrawlEngine:
+    """호스트별 동시 요청 수를 제한하는 비동기 크롤링 엔진"""
+
+    def __init__(self, per_host_limit: Optional[int] = None, max_workers: Optional[int] = None):
+        self.per_host_limit = per_host_limit or MAX_CONCURRENCY_PER_HOST
+        self.max_workers = max_workers
+
+    async def _run_job(self, executor: ThreadPoolExecutor, semaphore: asyncio.Semaphore,
+                       func: Callable[..., Any], args: tuple) -> Any:
+        """세마포어 범위 안에서 블로킹 함수를 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            return await loop.run_in_executor(executor, func, *args)
+
+    async def _run_all(self, jobs: List[CrawlJob],
+                       on_result: Optional[Callable[[int, Any], None]] = None) -> List[Any]:
+        """모든 작업을 동시에 실행하고 입력 순서대로 결과 반환
+
+        on_result가 주어지면 작업이 끝나는 순서대로 (작업 순번, 결과)로 호출합니다.
+        """
+        hosts = {host for host, _, _ in jobs}
+        semaphores: Dict[str, asyncio.Semaphore] = {
+            host: asyncio.Semaphore(self.per_host_limit) for host in hosts
+        }
+        max_workers = self.max_workers or max(1, len(hosts) * self.per_host_limit)
+
+        async def run_indexed(index: int, host: str, func: Callable[..., Any], args: tuple) -> Any:
+            try:
+                result = await self._run_job(executor, semaphores[host], func, args)
+            except Exception as e:
+                logger.error(f"크롤링 작업 오류 ({host}, {func.__name__}{args}): {str(e)}")
+                result = e
+            if on_result is not None:
+                on_result(index, result)
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='crawl') as executor:
+            tasks = [
+                run_indexed(index, host, func, args)
+                for index, (host, func, args) in enumerate(jobs)
+            ]
+            return await asyncio.gather(*tasks)
+
+    def iter_results(self, jobs: List[CrawlJob]) -> Iterator[Tuple[int, Any]]:
+        """작업이 끝나는 순서대로 (작업 순번, 결과)를 yield
+
+        이벤트 루프는 별도 스레드에서 실행되므로, 호출자는 전체 작업이 끝나기 전에
+        먼저 끝난 결과부터 처리할 수 있습니다.
+        """
+        if not jobs:
+            return
+        results: Queue = Queue()
+        done = object()
+
+        def run_loop():
+            try:
+                asyncio.run(self._run_all(jobs, on_result=lambda index, result: results.put((index, result))))
+            finally:
+                results.put(done)
+
+        thread = threading.Thread(target=run_loop, name='crawl-engine', daemon=True)
+        thread.start()
+        while True:
+            entry = results.get()
+            if entry is done:
+                break
+            yield entry
+        thread.join()
@@ -0,0 +1,163 @@
+"""
+조건부 GET 디스크 캐시
+
+게시판 목록 페이지의 ETag / Last-Modified 검증자와 본문을 DATA_DIR 아래에 저장하고,
+다음 요청 시 If-None-Match / If-Modified-Since 헤더를 전송합니다.
+304 응답이거나 본문 해시가 이전과 같으면 저장해 둔 파싱 결과를 그대로 재사용합니다.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import HTTP_CACHE_DIR
+from crawlers.transport import fetch
+
+logger = logging.getLogger('http_cache')
+
+
+@dataclass
+class CachedPage:
+    """캐시를 거친 응답"""
+    url: str
+    body: bytes
+    encoding: str
+    content_hash: str
+    unchanged: bool
+    items: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def text(self) -> str:
+        """본문 문자열"""
+        return self.body.decode(self.encoding or 'utf-8', errors='replace')
+
+
+def _write_atomic(path: Path, data: bytes):
+    """임시 파일에 쓴 뒤 이름을 바꿔 원자적으로 저장"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class HttpCache:
+    """URL별 검증자, 본문, 파싱 결과를 저장하는 디스크 캐시"""
+
+    def __init__(self, cache_dir: Path = HTTP_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _paths(self, url: str):
+        """URL에 대응하는 메타데이터/본문 파일 경로"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _load_meta(self, url: str) -> Dict[str, Any]:
+        """저장된 메타데이터 로드 (없거나 손상되었으면 빈 딕셔너리)"""
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return {}
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"캐시 메타데이터 로드 실패 ({url}): {str(e)}")
+            return {}
+
+    def _save_meta(self, url: str, meta: Dict[str, Any]):
+        meta_path, _ = self._paths(url)
+        _write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    def get(self, url: str) -> CachedPage:
+        """조건부 GET 요청 수행"""
+        meta = self._load_meta(url)
+        _, body_path = self._paths(url)
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        response = fetch(url, headers=headers)
+
+        if response.status_code == 304 and meta:
+            logger.info(f"변경 없음 (304): {url}")
+            with open(body_path, 'rb') as f:
+                body = f.read()
+            return CachedPage(
+                url=url,
+                body=body,
+                encoding=meta.get('encoding') or 'utf-8',
+                content_hash=meta['content_hash'],
+                unchanged=True,
+                items=meta.get('items')
+            )
+
+        response.raise_for_status()
+        body = response.content
+        content_hash = hashlib.sha256(body).hexdigest()
+        unchanged = bool(meta) and meta.get('content_hash') == content_hash
+        if unchanged:
+            logger.info(f"변경 없음 (동일 해시): {url}")
+
+        new_meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'encoding': response.encoding,
+            'content_hash': content_hash,
+            'items': meta.get('items') if unchanged else None,
+        }
+        if not unchanged:
+            _write_atomic(body_path, body)
+        self._save_meta(url, new_meta)
+
+        return CachedPage(
+            url=url,
+            body=body,
+            encoding=response.encoding or 'utf-8',
+            content_hash=content_hash,
+            unchanged=unchanged,
+            items=new_meta['items']
+        )
+
+    def store_items(self, url: str, content_hash: str, items: List[Dict[str, Any]]):
+        """본문 해시에 대응하는 파싱 결과 저장"""
+        meta = self._load_meta(url)
+        if not meta or meta.get('content_hash') != content_hash:
+            return
+        meta['items'] = items
+        self._save_meta(url, meta)
+
+
+# 모듈 공용 캐시 (최초 사용 시 생성)
+_cache: Optional[HttpCache] = None
+
+
+def get_cache() -> HttpCache:
+    """공용 HTTP 캐시 반환"""
+    global _cache
+    if _cache is None:
+        _cache = HttpCache()
+    return _cache
+
+
+def set_cache(cache: Optional[HttpCache]) -> Optional[HttpCache]:
+    """공용 HTTP 캐시 교체 (이전 캐시 반환, None이면 다음 사용 시 기본 캐시 생성)"""
+    global _cache
+    previous, _cache = _cache, cache
+    return previous
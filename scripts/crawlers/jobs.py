@@ -0,0 +1,118 @@
+"""
+마감 시간이 있는 작업 실행
+
+스케줄러 작업을 별도 스레드에서 실행하고 마감 시간까지만 기다립니다.
+마감을 넘기면 취소 플래그를 세우고(run_pipeline 등 체크포인트에서 JobCancelled 발생),
+on_timeout 콜백으로 멈춘 자원(예: 응답 없는 브라우저)을 정리한 뒤 작업 슬롯을 돌려줍니다.
+유예 시간 안에 끝나지 않아 분리한 작업 스레드가 아직 살아 있으면 같은 이름의 작업은 실행하지 않습니다.
+"""
+
+import os
+import sys
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import JOB_CANCEL_GRACE
+
+logger = logging.getLogger('jobs')
+
+_local = threading.local()
+
+# 마감 후 분리된 작업 스레드 (작업 이름별)
+_detached: Dict[str, threading.Thread] = {}
+_detached_lock = threading.Lock()
+
+
+class JobCancelled(Exception):
+    """마감 시간 초과 또는 취소로 중단된 작업"""
+
+
+class JobStillRunning(Exception):
+    """이전 실행의 분리된 작업 스레드가 아직 끝나지 않아 건너뛴 작업"""
+
+
+class JobContext:
+    """실행 중인 작업의 이름, 마감 시각, 취소 플래그"""
+
+    def __init__(self, name: str, timeout: Optional[float] = None):
+        self.name = name
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.cancelled = threading.Event()
+
+    def remaining(self) -> Optional[float]:
+        """마감까지 남은 시간 (초, 마감이 없으면 None)"""
+        return None if self.deadline is None else max(0.0, self.deadline - time.monotonic())
+
+    def check(self):
+        """취소되었거나 마감이 지났으면 JobCancelled 발생"""
+        if self.cancelled.is_set() or (self.deadline is not None and time.monotonic() >= self.deadline):
+            raise JobCancelled(f"작업 '{self.name}' 중단 (마감 시간 초과 또는 취소)")
+
+
+def current_job() -> Optional[JobContext]:
+    """현재 스레드에서 실행 중인 작업 (작업 밖이면 None)"""
+    return getattr(_local, 'job', None)
+
+
+def check_cancelled():
+    """작업 안에서 호출되면 취소 여부 확인 (작업 밖에서는 아무것도 하지 않음)"""
+    job = current_job()
+    if job is not None:
+        job.check()
+
+
+def run_with_deadline(name: str, func: Callable, *args, timeout: Optional[float] = None,
+                      on_timeout: Optional[Callable[[], None]] = None, default: Any = None, **kwargs) -> Any:
+    """func를 작업 스레드에서 실행하고 결과 반환
+
+    timeout초 안에 끝나지 않으면 취소하고 JobCancelled를 발생시키며,
+    같은 이름의 이전 실행이 분리된 채 아직 돌고 있으면 실행하지 않고 JobStillRunning을 발생시킵니다.
+    """
+    with _detached_lock:
+        previous = _detached.get(name)
+        if previous is not None:
+            if previous.is_alive():
+                raise JobStillRunning(f"작업 '{name}'의 이전 실행이 아직 끝나지 않아 이번 실행을 건너뜁니다.")
+            del _detached[name]
+
+    job = JobContext(name, timeout)
+    outcome = {}
+
+    def target():
+        _local.job = job
+        try:
+            outcome['result'] = func(*args, **kwargs)
+        except JobCancelled as e:
+            logger.warning(str(e))
+        except BaseException as e:
+            outcome['error'] = e
+        finally:
+            _local.job = None
+
+    worker = threading.Thread(target=target, name=f'job-{name}', daemon=True)
+    worker.start()
+    worker.join(timeout)
+
+    if worker.is_alive():
+        logger.error(f"작업 '{name}' 마감 시간 {timeout:.0f}초 초과 - 취소")
+        job.cancelled.set()
+        if on_timeout is not None:
+            try:
+                on_timeout()
+            except Exception as e:
+                logger.error(f"작업 '{name}' 취소 처리 오류: {str(e)}")
+        worker.join(JOB_CANCEL_GRACE)
+        if worker.is_alive():
+            # 스레드는 강제로 멈출 수 없으므로 남겨 두고 슬롯만 반환 (다음 체크포인트에서 중단됨)
+            logger.error(f"작업 '{name}'가 취소 후 {JOB_CANCEL_GRACE}초 안에 끝나지 않아 분리합니다.")
+            with _detached_lock:
+                _detached[name] = worker
+        raise JobCancelled(f"작업 '{name}' 마감 시간 초과")
+
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome.get('result', default)
@@ -0,0 +1,284 @@
+"""
+크롤러 메트릭 (Prometheus 텍스트 형식)
+
+기관/호스트/단계별 카운터와 히스토그램을 프로세스 메모리에 모으고,
+스케줄러 프로세스에서 작은 HTTP 서버로 /metrics 경로에 노출합니다.
+prometheus_client 없이 텍스트 노출 형식(0.0.4)만 구현합니다.
+
+사용 예:
+    from crawlers.metrics import FETCH_SECONDS
+    FETCH_SECONDS.observe(0.42, host='www.fsc.go.kr')
+"""
+
+import os
+import sys
+import math
+import logging
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import METRICS_HOST, METRICS_PORT
+
+logger = logging.getLogger('metrics')
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _Metric:
+    """레이블별 값을 가진 메트릭 공통 부분"""
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} 레이블 불일치: {sorted(labels)} (필요: {list(self.labels)})")
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """증가만 하는 누적 값"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        # 레이블 없는 메트릭은 처음부터 0으로 노출
+        self._values: Dict[LabelValues, float] = {} if self.labels else {(): 0}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}" for key, value in values]
+
+
+class Gauge(Counter):
+    """임의로 설정하는 현재 값"""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """구간별 누적 관측 횟수와 합계"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 → (구간별 횟수, 합계, 전체 횟수)
+        self._values: Dict[LabelValues, List] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            if index < len(self.buckets):
+                state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        lines = []
+        for key, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labels, key, ('le', _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, ('le', '+Inf'))} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {count}")
+        return lines
+
+
+class Registry:
+    """이름별 메트릭 모음"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labels))
+
+
+def gauge(name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labels))
+
+
+def histogram(name: str, documentation: str, labels: Sequence[str] = (),
+              buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labels, buckets))
+
+
+# HTTP 전송 (호스트별)
+FETCH_SECONDS = histogram('scope_fetch_seconds', 'HTTP 요청 소요 시간 (재시도·대기 포함, 초)', ['host'])
+FETCH_BYTES = counter('scope_fetch_bytes_total', '수신한 응답 본문 크기 (바이트)', ['host'])
+FETCH_ERRORS = counter('scope_fetch_errors_total', '예외로 끝난 HTTP 요청 수', ['host'])
+FETCH_RETRIES = counter('scope_fetch_retries_total', '재시도한 HTTP 요청 수', ['host'])
+FETCH_SKIPPED = counter('scope_fetch_skipped_total', '서킷 브레이커가 열려 생략한 요청 수', ['host'])
+RATE_LIMIT_WAIT = counter('scope_rate_limit_wait_seconds_total', '호스트별 속도 제한으로 대기한 시간 (초)', ['host'])
+BREAKER_OPEN = gauge('scope_circuit_open', '서킷 브레이커 열림 여부 (1: 열림)', ['host'])
+
+# 기관/소스별 수집 단계
+SOURCE_FETCH_SECONDS = histogram('scope_source_fetch_seconds', '목록 페이지 수신 시간 (캐시 검증 포함, 초)', ['source'])
+SOURCE_PARSE_SECONDS = histogram('scope_source_parse_seconds', '목록 페이지 파싱 시간 (초)', ['source'],
+                                 buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
+SOURCE_PAGES = counter('scope_source_pages_total', '처리한 목록 페이지 수 (result: parsed/unchanged/error)',
+                       ['source', 'result'])
+SOURCE_ITEMS = counter('scope_source_items_total', '목록 페이지에서 찾은 아이템 수', ['source'])
+SOURCE_ERRORS = counter('scope_source_errors_total', '수집 단계별 오류 수', ['source', 'stage'])
+DETAIL_PAGES = counter('scope_detail_pages_total', '처리한 상세 페이지 수 (result: parsed/unchanged/stored/error)',
+                       ['source', 'result'])
+ATTACHMENTS = counter('scope_attachments_total',
+                      '처리한 첨부파일 수 (result: downloaded/reused/extracted/skipped/unsupported/error)',
+                      ['source', 'result'])
+ATTACHMENT_BYTES = counter('scope_attachment_bytes_total', '받은 첨부파일 바이트 수', ['source'])
+SUMMARY_REQUESTS = counter('scope_summary_requests_total', '요약 엔드포인트 요청 수 (result: success/error)', ['result'])
+SUMMARY_SECONDS = histogram('scope_summary_request_seconds', '요약 요청 하나의 응답 시간 (초)',
+                            buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0, 120.0))
+SUMMARY_ITEMS = counter('scope_summary_items_total', '요약 처리한 아이템 수 (result: cached/summarized/failed)', ['result'])
+NEWS_PATHS = counter('scope_news_fetch_path_total', '뉴스 수집 경로 (path: fast/fallback)', ['source', 'path'])
+BROWSER_LAUNCHES = counter('scope_browser_launches_total', '브라우저 실행 횟수')
+
+# 스케줄러 작업별
+ITEMS_NEW = counter('scope_items_new_total', '저장소에 새로 추가된 아이템 수', ['job', 'source'])
+ITEMS_CHANGED = counter('scope_items_changed_total', '내용이 바뀐 아이템 수', ['job', 'source'])
+JOB_SECONDS = histogram('scope_job_seconds', '스케줄러 작업 소요 시간 (초)', ['job'],
+                        buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600))
+JOB_RUNS = counter('scope_job_runs_total', '스케줄러 작업 실행 수 (result: success/empty/error)', ['job', 'result'])
+JOB_TIMEOUTS = counter('scope_job_timeouts_total', '마감 시간을 넘겨 취소된 작업 수', ['job'])
+JOB_SKIPPED = counter('scope_job_skipped_total', '이전 실행이 분리된 채 아직 돌고 있어 건너뛴 작업 수', ['job'])
+POLL_INTERVAL = gauge('scope_poll_interval_seconds', '적응형 스케줄의 다음 폴링 간격 (초)', ['feed'])
+JOB_LAST_SUCCESS = gauge('scope_job_last_success_timestamp_seconds', '마지막 성공 시각 (유닉스 시간)', ['job'])
+
+
+def record_upserts(job: str, upserted, source_labels: Optional[Dict[str, str]] = None) -> None:
+    """upsert 결과의 신규/변경 아이템 수를 출처별로 기록 (source_labels: 아이템 source 값 → 레이블)"""
+    source_labels = source_labels or {}
+    for metric, items in ((ITEMS_NEW, upserted.new), (ITEMS_CHANGED, upserted.changed)):
+        for item in items:
+            source = item.get('source') or 'unknown'
+            metric.inc(job=job, source=source_labels.get(source, source))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def start_http_server(port: int = METRICS_PORT, host: str = METRICS_HOST) -> Optional[ThreadingHTTPServer]:
+    """백그라운드 스레드에서 /metrics 엔드포인트 시작 (port가 0 이하면 사용 안 함)"""
+    global _server
+    if _server is not None or port <= 0:
+        return _server
+    try:
+        _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        logger.error(f"메트릭 서버 시작 오류 ({host}:{port}): {str(e)}")
+        return None
+    _server.daemon_threads = True
+    threading.Thread(target=_server.serve_forever, name='metrics-server', daemon=True).start()
+    logger.info(f"메트릭 엔드포인트 시작: http://{host}:{_server.server_address[1]}/metrics")
+    return _server
+
+
+def stop_http_server():
+    """메트릭 엔드포인트 종료"""
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
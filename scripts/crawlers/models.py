@@ -3,13 +3,74 @@
 TypeScript 타입과 일치하는 Python 클래스 정의
 """
 
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
-from typing import List, Optional
+import sys
+import json
+from dataclasses import dataclass, field, fields
+from json.encoder import encode_basestring
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+from crawlers.dates import normalize_date
 
-@dataclass
-class SourceItem:
+# Python 3.10 이상에서는 __slots__ 클래스로 생성 (인스턴스 __dict__ 없음)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _encode_value(value: Any) -> str:
+    """필드 값을 JSON 문자열로 인코딩 (모델 필드에 쓰이는 str/bool/None/문자열 목록만 직접 처리)"""
+    if value.__class__ is str:
+        return encode_basestring(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if value.__class__ is list and all(element.__class__ is str for element in value):
+        return '[' + ','.join(map(encode_basestring, value)) + ']'
+    return json.dumps(value, ensure_ascii=False)
+
+
+class _ItemMixin:
+    """모델 공용 직렬화 메서드 (필드 이름은 TypeScript 타입과 동일)"""
+
+    __slots__ = ()
+    _field_names: tuple = ()
+    _json_keys: tuple = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """모델을 딕셔너리로 변환 (목록 필드는 얕은 복사)"""
+        data = {}
+        for name in self._field_names:
+            value = getattr(self, name)
+            data[name] = list(value) if value.__class__ is list else value
+        return data
+
+    def to_json(self) -> str:
+        """딕셔너리를 거치지 않고 JSON 문자열로 직접 변환"""
+        return '{' + ','.join(
+            key + _encode_value(getattr(self, name))
+            for name, key in zip(self._field_names, self._json_keys)
+        ) + '}'
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """딕셔너리에서 모델 생성 (모르는 키는 무시)"""
+        try:
+            return cls(**data)
+        except TypeError:
+            return cls(**{name: data[name] for name in cls._field_names if name in data})
+
+
+def _bind_fields(cls):
+    """필드 이름과 JSON 키 접두사('"name":')를 클래스에 미리 계산해 둠"""
+    cls._field_names = tuple(f.name for f in fields(cls))
+    cls._json_keys = tuple(encode_basestring(name) + ':' for name in cls._field_names)
+    return cls
+
+
+@_bind_fields
+@dataclass(**_DATACLASS_OPTIONS)
+class SourceItem(_ItemMixin):
     """보도자료 아이템 모델"""
     id: str
     title: str
@@ -22,14 +83,14 @@ class SourceItem:
     type: str = "source"
     organization: Optional[str] = None
     memo: Optional[str] = None
-
-    def to_dict(self):
-        """모델을 딕셔너리로 변환"""
-        return asdict(self)
+    body: Optional[str] = None  # 상세 페이지 본문 텍스트
+    attachments: List[Dict[str, str]] = field(default_factory=list)  # 첨부파일 (name, url)
+    contentHash: Optional[str] = None  # 상세 페이지 원문 해시
 
 
-@dataclass
-class NewsItem:
+@_bind_fields
+@dataclass(**_DATACLASS_OPTIONS)
+class NewsItem(_ItemMixin):
     """뉴스 아이템 모델"""
     id: str
     title: str
@@ -44,32 +105,32 @@ class NewsItem:
     type: str = "news"
     imageUrl: Optional[str] = None
 
-    def to_dict(self):
-        """모델을 딕셔너리로 변환"""
-        return asdict(self)
+
+Item = Union[SourceItem, NewsItem]
+ITEM_TYPES = {'source': SourceItem, 'news': NewsItem}
+
+
+def item_from_dict(data: Dict[str, Any]) -> Item:
+    """type 필드에 맞는 모델로 변환"""
+    return ITEM_TYPES[data.get('type', 'source')].from_dict(data)
+
+
+def encode_jsonl(items: Iterable[Item]) -> bytes:
+    """아이템 목록을 JSON Lines 바이트로 인코딩"""
+    return ''.join(item.to_json() + '\n' for item in items).encode('utf-8')
+
+
+def decode_jsonl(data: Union[bytes, str]) -> List[Item]:
+    """JSON Lines 바이트를 모델 목록으로 디코딩"""
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return [item_from_dict(json.loads(line)) for line in data.splitlines() if line.strip()]
 
 
 # 날짜 처리 및 ID 생성 유틸리티 함수
-def parse_date(date_str: str) -> str:
-    """다양한 형식의 날짜 문자열을 ISO 형식으로 변환"""
-    formats = [
-        "%Y-%m-%d",
-        "%Y.%m.%d",
-        "%Y/%m/%d",
-        "%Y년 %m월 %d일",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y.%m.%d %H:%M:%S",
-    ]
-    
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(date_str.strip(), fmt)
-            return dt.isoformat()
-        except ValueError:
-            continue
-    
-    # 모든 형식이 실패하면 현재 시간 반환
-    return datetime.now().isoformat()
+def parse_date(date_str: str) -> Optional[str]:
+    """다양한 형식의 날짜 문자열을 KST ISO 형식으로 변환 (해석할 수 없으면 None)"""
+    return normalize_date(date_str)
 
 
 def generate_id(source: str, date_str: str, counter: int = 0) -> str:
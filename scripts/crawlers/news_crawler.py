@@ -1,7 +1,8 @@
 """
 네이버 뉴스 및 구글 뉴스 크롤러
 
-Selenium을 사용하여 네이버 뉴스와 구글 뉴스에서 관련 기사를 수집합니다.
+HTTP 직접 수집(news_fetcher)을 먼저 시도하고, 기대한 마크업이 없을 때만
+Selenium 브라우저 풀을 사용하여 네이버 뉴스와 구글 뉴스에서 관련 기사를 수집합니다.
 """
 
 import os
@@ -9,236 +10,104 @@ import sys
 import time
 import logging
 import traceback
-import re
+import threading
 from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Iterator, List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 상위 경로 추가하여 모듈 임포트 가능하게 설정
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from crawlers.config import NEWS_KEYWORDS, DEFAULT_HEADERS, TIMEOUT, save_data, LOG_DIR
-from crawlers.models import NewsItem, parse_date, generate_id
-
-# 로깅 설정
-log_file = LOG_DIR / f"news_crawler_{datetime.now().strftime('%Y%m%d')}.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger('news_crawler')
-
+from crawlers.config import NEWS_KEYWORDS, BROWSER_POOL_SIZE, DATA_DIR, setup_logging
+from crawlers.models import NewsItem, generate_id
+from crawlers.dates import normalize_date
+from crawlers.browser_pool import get_pool
+from crawlers.news_fetcher import fetch_naver_news, fetch_google_news, parse_naver_html, extract_keywords
+from crawlers.pipeline import JsonArraySink, run_pipeline
+from crawlers.dedup import dedup_news
+from crawlers.metrics import NEWS_PATHS, SOURCE_ERRORS, SOURCE_ITEMS
 
-def setup_driver():
-    """셀레니움 웹드라이버 설정"""
-    try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument(f"user-agent={DEFAULT_HEADERS['User-Agent']}")
-        
-        # 언어 설정
-        chrome_options.add_argument("--lang=ko-KR")
-        
-        # 로깅 레벨 설정
-        chrome_options.add_argument("--log-level=3")
-        
-        # ChromeDriverManager를 사용하여 최신 드라이버 자동 설치
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # 페이지 로드 타임아웃 설정
-        driver.set_page_load_timeout(TIMEOUT)
-        
-        logger.info("셀레니움 웹드라이버 설정 완료")
-        return driver
-        
-    except Exception as e:
-        logger.error(f"셀레니움 웹드라이버 설정 오류: {str(e)}")
-        traceback.print_exc()
-        return None
+logger = logging.getLogger('news_crawler')
 
 
-def scrape_naver_news(keyword: str, page: int = 1, max_items: int = 10) -> List[NewsItem]:
-    """네이버 뉴스 스크래핑"""
+def scrape_naver_news_browser(keyword: str, page: int = 1, max_items: int = 10) -> List[NewsItem]:
+    """네이버 뉴스 스크래핑 (Selenium 브라우저 사용)"""
     logger.info(f"네이버 뉴스 스크래핑 시작 (키워드: {keyword}, 페이지: {page})")
     items = []
-    driver = None
     
     try:
-        driver = setup_driver()
-        if not driver:
-            return []
-            
+        # Selenium은 브라우저로 대체 수집할 때만 임포트
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         # 검색어 인코딩 및 URL 생성
         encoded_keyword = keyword.replace(' ', '+')
         start_index = (page - 1) * 10 + 1
         url = f"https://search.naver.com/search.naver?where=news&query={encoded_keyword}&start={start_index}"
         
         logger.info(f"네이버 뉴스 URL: {url}")
-        driver.get(url)
-        
-        # 페이지 로딩 대기
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".list_news"))
-        )
-        
-        # 추가 로딩을 위해 스크롤
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
+        with get_pool().driver() as driver:
+            driver.get(url)
+            
+            # 페이지 로딩 대기
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".list_news"))
+            )
+            
+            # 추가 로딩을 위해 스크롤
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            time.sleep(2)
+            page_source = driver.page_source
         
         # HTML 파싱
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        news_items = soup.select(".list_news .bx")
-        
-        counter = 0
-        for idx, item in enumerate(news_items):
-            if counter >= max_items:
-                break
-                
-            try:
-                # 광고 또는 파워링크 제외
-                if item.select_one(".link_ad"):
-                    continue
-                
-                # 제목 및 URL 추출
-                title_element = item.select_one(".news_tit")
-                if not title_element:
-                    continue
-                    
-                title = title_element.text.strip()
-                url = title_element.get('href')
-                if not title or not url:
-                    continue
-                
-                # 언론사 추출
-                publisher_element = item.select_one(".info.press")
-                publisher = publisher_element.text.strip() if publisher_element else "네이버 뉴스"
-                
-                # 요약 추출
-                summary_element = item.select_one(".dsc_txt")
-                summary = summary_element.text.strip() if summary_element else ""
-                
-                # 이미지 URL 추출
-                img_element = item.select_one("img.thumb")
-                image_url = img_element.get('src') if img_element else None
-                
-                # 시간 추출 (네이버는 주로 "X일 전", "X시간 전" 형식)
-                time_element = item.select_one(".info.time")
-                date_text = time_element.text.strip() if time_element else ""
-                
-                # 현재 날짜로 설정 (실제로는 상대 시간을 계산해야 함)
-                current_time = datetime.now()
-                
-                # 상대 시간을 계산
-                if "분 전" in date_text:
-                    minutes = int(re.search(r'(\d+)분 전', date_text).group(1))
-                    date_iso = (current_time - timedelta(minutes=minutes)).isoformat()
-                elif "시간 전" in date_text:
-                    hours = int(re.search(r'(\d+)시간 전', date_text).group(1))
-                    date_iso = (current_time - timedelta(hours=hours)).isoformat()
-                elif "일 전" in date_text:
-                    days = int(re.search(r'(\d+)일 전', date_text).group(1))
-                    date_iso = (current_time - timedelta(days=days)).isoformat()
-                else:
-                    # 날짜 형식을 파싱할 수 없으면 현재 시간 사용
-                    date_iso = current_time.isoformat()
-                
-                # 키워드 추출 (제목에서 주요 단어)
-                keywords = [keyword]
-                title_words = title.split()
-                for word in title_words:
-                    if len(word) > 1 and word not in keywords and len(keywords) < 5:
-                        keywords.append(word)
-                
-                # 태그 생성
-                tags = keywords[:3]
-                
-                # ID 생성
-                item_id = generate_id('naver', date_iso, idx)
-                
-                # 아이템 생성
-                news_item = NewsItem(
-                    id=item_id,
-                    title=title,
-                    source='네이버 뉴스',
-                    publisher=publisher,
-                    date=date_iso,
-                    url=url,
-                    summary=summary,
-                    tags=tags,
-                    keywords=keywords,
-                    isScrapped=False,
-                    imageUrl=image_url
-                )
-                
-                items.append(news_item)
-                counter += 1
-                
-            except Exception as e:
-                logger.error(f"네이버 뉴스 아이템 파싱 오류: {str(e)}")
-                traceback.print_exc()
-                continue
+        items = parse_naver_html(page_source, keyword, max_items) or []
         
         logger.info(f"네이버 뉴스 스크래핑 완료: {len(items)}개 항목")
         return items
         
     except Exception as e:
         logger.error(f"네이버 뉴스 스크래핑 오류: {str(e)}")
+        SOURCE_ERRORS.inc(source='naver', stage='browser')
         traceback.print_exc()
         return []
-        
-    finally:
-        if driver:
-            driver.quit()
 
 
-def scrape_google_news(keyword: str, page: int = 1, max_items: int = 10) -> List[NewsItem]:
-    """구글 뉴스 스크래핑"""
+def scrape_google_news_browser(keyword: str, page: int = 1, max_items: int = 10) -> List[NewsItem]:
+    """구글 뉴스 스크래핑 (Selenium 브라우저 사용)"""
     logger.info(f"구글 뉴스 스크래핑 시작 (키워드: {keyword}, 페이지: {page})")
     items = []
-    driver = None
     
     try:
-        driver = setup_driver()
-        if not driver:
-            return []
-            
+        # Selenium은 브라우저로 대체 수집할 때만 임포트
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         # 검색어 인코딩 및 URL 생성
         encoded_keyword = keyword.replace(' ', '+')
         url = f"https://news.google.com/search?q={encoded_keyword}&hl=ko&gl=KR&ceid=KR:ko"
         
         logger.info(f"구글 뉴스 URL: {url}")
-        driver.get(url)
-        
-        # 페이지 로딩 대기
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "article"))
-        )
-        
-        # 페이지 스크롤을 위한 로직
-        # 첫 페이지는 기본적으로 로드되므로 2페이지부터는 스크롤이 필요
-        if page > 1:
-            for _ in range(page - 1):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)  # 스크롤 후 로딩 대기
+        with get_pool().driver() as driver:
+            driver.get(url)
+            
+            # 페이지 로딩 대기
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "article"))
+            )
+            
+            # 페이지 스크롤을 위한 로직
+            # 첫 페이지는 기본적으로 로드되므로 2페이지부터는 스크롤이 필요
+            if page > 1:
+                for _ in range(page - 1):
+                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    time.sleep(2)  # 스크롤 후 로딩 대기
+            page_source = driver.page_source
         
         # HTML 파싱
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = BeautifulSoup(page_source, 'html.parser')
         news_items = soup.select("article")
         
         counter = 0
@@ -271,10 +140,9 @@ def scrape_google_news(keyword: str, page: int = 1, max_items: int = 10) -> List
                 time_element = item.select_one("div[data-n-tid] time")
                 date_text = time_element.get('datetime') if time_element else ""
                 
-                if date_text:
-                    date_iso = date_text
-                else:
-                    date_iso = datetime.now().isoformat()
+                date_iso = normalize_date(date_text)
+                if date_iso is None:
+                    continue
                 
                 # 요약은 구글 뉴스에서 제공되지 않음
                 summary = f"{title} - {publisher}"
@@ -284,11 +152,7 @@ def scrape_google_news(keyword: str, page: int = 1, max_items: int = 10) -> List
                 image_url = img_element.get('src') if img_element else None
                 
                 # 키워드 추출
-                keywords = [keyword]
-                title_words = title.split()
-                for word in title_words:
-                    if len(word) > 1 and word not in keywords and len(keywords) < 5:
-                        keywords.append(word)
+                keywords = extract_keywords(keyword, title)
                 
                 # 태그 생성
                 tags = keywords[:3]
@@ -324,48 +188,108 @@ def scrape_google_news(keyword: str, page: int = 1, max_items: int = 10) -> List
         
     except Exception as e:
         logger.error(f"구글 뉴스 스크래핑 오류: {str(e)}")
+        SOURCE_ERRORS.inc(source='google', stage='browser')
         traceback.print_exc()
         return []
-        
-    finally:
-        if driver:
-            driver.quit()
 
 
-def fetch_all_news(max_items_per_source: int = 10) -> List[NewsItem]:
-    """모든 키워드에 대해 뉴스 수집"""
-    logger.info(f"모든 키워드 뉴스 스크래핑 시작 (키워드 수: {len(NEWS_KEYWORDS)})")
-    all_items = []
-    
+# 수집 경로 통계 (fast: HTTP 직접 수집, fallback: 브라우저 사용)
+_path_stats: Counter = Counter()
+_path_stats_lock = threading.Lock()
+
+
+def _record_path(source: str, path: str):
+    with _path_stats_lock:
+        _path_stats[(source, path)] += 1
+    NEWS_PATHS.inc(source=source, path=path)
+
+
+def get_fetch_stats() -> Dict[str, Dict[str, int]]:
+    """소스별 HTTP 직접 수집/브라우저 대체 횟수"""
+    with _path_stats_lock:
+        stats: Dict[str, Dict[str, int]] = {}
+        for (source, path), count in _path_stats.items():
+            stats.setdefault(source, {'fast': 0, 'fallback': 0})[path] = count
+        return stats
+
+
+def reset_fetch_stats():
+    """수집 경로 통계 초기화"""
+    with _path_stats_lock:
+        _path_stats.clear()
+
+
+def _scrape_with_fallback(source: str, fast_fetch: Callable, browser_scrape: Callable,
+                          keyword: str, page: int, max_items: int) -> List[NewsItem]:
+    """HTTP 직접 수집을 먼저 시도하고, 기대한 마크업이 없으면 브라우저로 대체"""
     try:
+        items = fast_fetch(keyword, page, max_items)
+    except Exception as e:
+        logger.warning(f"{source} 뉴스 HTTP 수집 오류 (키워드: {keyword}): {str(e)}")
+        SOURCE_ERRORS.inc(source=source, stage='fetch')
+        items = None
+    
+    if items is not None:
+        _record_path(source, 'fast')
+        logger.info(f"{source} 뉴스 HTTP 수집 완료 (키워드: {keyword}): {len(items)}개 항목")
+    else:
+        _record_path(source, 'fallback')
+        logger.info(f"{source} 뉴스 HTTP 응답에 결과 마크업이 없어 브라우저로 수집 (키워드: {keyword})")
+        items = browser_scrape(keyword, page, max_items)
+    SOURCE_ITEMS.inc(len(items), source=source)
+    return items
+
+
+def scrape_naver_news(keyword: str, page: int = 1, max_items: int = 10) -> List[NewsItem]:
+    """네이버 뉴스 스크래핑 (HTTP 우선, 실패 시 브라우저)"""
+    return _scrape_with_fallback('naver', fetch_naver_news, scrape_naver_news_browser,
+                                 keyword, page, max_items)
+
+
+def scrape_google_news(keyword: str, page: int = 1, max_items: int = 10) -> List[NewsItem]:
+    """구글 뉴스 스크래핑 (RSS 우선, 실패 시 브라우저)"""
+    return _scrape_with_fallback('google', fetch_google_news, scrape_google_news_browser,
+                                 keyword, page, max_items)
+
+
+def iter_news(max_items_per_source: int = 10, max_workers: Optional[int] = None) -> Iterator[NewsItem]:
+    """모든 키워드에 대해 뉴스를 수집하며 작업이 끝나는 순서대로 yield (중복 제거/정렬 안 함)"""
+    logger.info(f"모든 키워드 뉴스 스크래핑 시작 (키워드 수: {len(NEWS_KEYWORDS)})")
+    reset_fetch_stats()
+    count = 0
+
+    jobs = {}
+    with ThreadPoolExecutor(max_workers=max_workers or BROWSER_POOL_SIZE,
+                            thread_name_prefix='news') as executor:
         for keyword in NEWS_KEYWORDS:
-            logger.info(f"키워드 '{keyword}' 뉴스 스크래핑 시작")
-            
-            # 네이버 뉴스 스크래핑
-            naver_items = scrape_naver_news(keyword, page=1, max_items=max_items_per_source)
-            all_items.extend(naver_items)
-            
-            # 구글 뉴스 스크래핑
-            google_items = scrape_google_news(keyword, page=1, max_items=max_items_per_source)
-            all_items.extend(google_items)
-            
-            logger.info(f"키워드 '{keyword}' 뉴스 스크래핑 완료: {len(naver_items) + len(google_items)}개 항목")
-            
-            # 중복 제거 (URL 기준)
-            unique_urls = set()
-            unique_items = []
-            
-            for item in all_items:
-                if item.url not in unique_urls:
-                    unique_urls.add(item.url)
-                    unique_items.append(item)
-            
-            all_items = unique_items
+            for scraper in (scrape_naver_news, scrape_google_news):
+                future = executor.submit(scraper, keyword, 1, max_items_per_source)
+                jobs[future] = (scraper, keyword)
+
+        for future in as_completed(jobs):
+            scraper, keyword = jobs[future]
+            try:
+                items = future.result()
+            except Exception as e:
+                logger.error(f"키워드 '{keyword}' {scraper.__name__} 오류: {str(e)}")
+                continue
+            logger.info(f"키워드 '{keyword}' {scraper.__name__} 완료: {len(items)}개 항목")
+            count += len(items)
+            yield from items
+
+    pool = get_pool()
+    logger.info(f"모든 키워드 뉴스 스크래핑 완료: 총 {count}개 항목 "
+                f"(브라우저 실행 {pool.launches}회, 교체 {pool.recycles}회)")
+    logger.info(f"수집 경로 통계 (HTTP/브라우저 대체): {get_fetch_stats()}")
+
+
+def fetch_all_news(max_items_per_source: int = 10, max_workers: Optional[int] = None) -> List[NewsItem]:
+    """모든 키워드에 대해 뉴스 수집 (URL·제목 유사도 기준 중복 제거 후 날짜 내림차순 정렬)"""
+    try:
+        all_items = list(dedup_news(iter_news(max_items_per_source, max_workers)))
         
         # 날짜 기준 내림차순 정렬
         all_items.sort(key=lambda x: x.date, reverse=True)
-        
-        logger.info(f"모든 키워드 뉴스 스크래핑 완료: 총 {len(all_items)}개 항목")
         return all_items
         
     except Exception as e:
@@ -375,13 +299,9 @@ def fetch_all_news(max_items_per_source: int = 10) -> List[NewsItem]:
 
 
 if __name__ == "__main__":
-    # 직접 실행 시 테스트
-    results = fetch_all_news(max_items_per_source=5)
-    
-    # 결과 저장
-    if results:
-        filename = f"news_items_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        saved_path = save_data([item.to_dict() for item in results], filename)
-        logger.info(f"뉴스 저장 완료: {saved_path} ({len(results)}개 항목)")
-    else:
-        logger.warning("저장할 뉴스가 없습니다.") 
\ No newline at end of file
+    # 직접 실행 시 테스트 (수집되는 대로 파일에 기록)
+    setup_logging('news_crawler')
+    filename = f"news_items_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    sink = JsonArraySink(DATA_DIR / filename)
+    count = run_pipeline(dedup_news(iter_news(max_items_per_source=5)), [sink])
+    logger.info(f"뉴스 저장 완료: {sink.path} ({count}개 항목)")
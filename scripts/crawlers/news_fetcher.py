@@ -0,0 +1,201 @@
+"""
+브라우저 없이 동작하는 뉴스 수집기
+
+네이버 뉴스 검색 결과 HTML과 구글 뉴스 RSS를 공용 HTTP 세션으로 직접 요청하여
+Selenium 경로와 같은 NewsItem 객체를 생성합니다.
+응답에 기대한 마크업이 없으면 None을 반환하여 호출자가 브라우저 경로로 넘어가게 합니다.
+"""
+
+import os
+import sys
+import logging
+import traceback
+import xml.etree.ElementTree as ET
+from bs4 import BeautifulSoup
+from datetime import datetime
+from typing import List, Optional
+from urllib.parse import quote_plus
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import KST
+from crawlers.dates import normalize_date
+from crawlers.models import NewsItem, generate_id
+from crawlers.tagger import get_tagger
+from crawlers.transport import fetch
+
+logger = logging.getLogger('news_fetcher')
+
+NAVER_SEARCH_URL = "https://search.naver.com/search.naver?where=news&query={query}&start={start}"
+GOOGLE_RSS_URL = "https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
+
+
+def extract_keywords(keyword: str, title: str, summary: str = '', limit: int = 5) -> List[str]:
+    """검색 키워드와 제목·요약에서 찾은 분류 사전 태그로 키워드 목록 생성"""
+    keywords = [keyword] + get_tagger().tag_text(title, summary, limit=limit)
+    return list(dict.fromkeys(keywords))[:limit]
+
+
+def parse_naver_html(html: str, keyword: str, max_items: int = 10) -> Optional[List[NewsItem]]:
+    """네이버 뉴스 검색 결과 HTML 파싱 (결과 목록 마크업이 없으면 None)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    if not soup.select_one(".list_news"):
+        return None
+    
+    news_items = soup.select(".list_news .bx")
+    items = []
+    
+    # 상대 시간("3시간 전")은 페이지마다 같은 기준 시각으로 계산
+    now = datetime.now(KST)
+    counter = 0
+    for idx, item in enumerate(news_items):
+        if counter >= max_items:
+            break
+            
+        try:
+            # 광고 또는 파워링크 제외
+            if item.select_one(".link_ad"):
+                continue
+            
+            # 제목 및 URL 추출
+            title_element = item.select_one(".news_tit")
+            if not title_element:
+                continue
+                
+            title = title_element.text.strip()
+            url = title_element.get('href')
+            if not title or not url:
+                continue
+            
+            # 언론사 추출
+            publisher_element = item.select_one(".info.press")
+            publisher = publisher_element.text.strip() if publisher_element else "네이버 뉴스"
+            
+            # 요약 추출
+            summary_element = item.select_one(".dsc_txt")
+            summary = summary_element.text.strip() if summary_element else ""
+            
+            # 이미지 URL 추출
+            img_element = item.select_one("img.thumb")
+            image_url = img_element.get('src') if img_element else None
+            
+            # 시간 추출 (네이버는 주로 "X일 전", "X시간 전" 형식)
+            time_element = item.select_one(".info.time")
+            date_text = time_element.text.strip() if time_element else ""
+            
+            date_iso = normalize_date(date_text, now)
+            if date_iso is None:
+                continue
+            
+            # 키워드 추출 (제목·요약에서 분류 사전 태그)
+            keywords = extract_keywords(keyword, title, summary)
+            
+            # 태그 생성
+            tags = keywords[:3]
+            
+            # ID 생성
+            item_id = generate_id('naver', date_iso, idx)
+            
+            # 아이템 생성
+            news_item = NewsItem(
+                id=item_id,
+                title=title,
+                source='네이버 뉴스',
+                publisher=publisher,
+                date=date_iso,
+                url=url,
+                summary=summary,
+                tags=tags,
+                keywords=keywords,
+                isScrapped=False,
+                imageUrl=image_url
+            )
+            
+            items.append(news_item)
+            counter += 1
+            
+        except Exception as e:
+            logger.error(f"네이버 뉴스 아이템 파싱 오류: {str(e)}")
+            traceback.print_exc()
+            continue
+    
+    return items
+
+
+def fetch_naver_news(keyword: str, page: int = 1, max_items: int = 10) -> Optional[List[NewsItem]]:
+    """네이버 뉴스 검색 결과를 HTTP로 직접 수집 (마크업이 없으면 None)"""
+    start_index = (page - 1) * 10 + 1
+    url = NAVER_SEARCH_URL.format(query=quote_plus(keyword), start=start_index)
+    
+    response = fetch(url)
+    response.raise_for_status()
+    return parse_naver_html(response.text, keyword, max_items)
+
+
+def parse_google_rss(xml_data: bytes, keyword: str, page: int = 1, max_items: int = 10) -> Optional[List[NewsItem]]:
+    """구글 뉴스 RSS 파싱 (채널 요소가 없으면 None)"""
+    try:
+        root = ET.fromstring(xml_data)
+    except ET.ParseError:
+        return None
+    
+    channel = root.find('channel')
+    if channel is None:
+        return None
+    
+    items = []
+    entries = channel.findall('item')
+    offset = (page - 1) * max_items
+    
+    for idx, entry in enumerate(entries[offset:], start=offset):
+        if len(items) >= max_items:
+            break
+        
+        try:
+            title = (entry.findtext('title') or '').strip()
+            url = (entry.findtext('link') or '').strip()
+            if not title or not url:
+                continue
+            
+            # 언론사 추출 (RSS 제목은 "제목 - 언론사" 형식)
+            publisher = (entry.findtext('source') or '').strip() or "구글 뉴스"
+            suffix = f" - {publisher}"
+            if title.endswith(suffix):
+                title = title[:-len(suffix)].strip()
+            
+            # 시간 추출
+            date_iso = normalize_date(entry.findtext('pubDate') or '')
+            if date_iso is None:
+                continue
+            
+            keywords = extract_keywords(keyword, title)
+            
+            items.append(NewsItem(
+                id=generate_id('google', date_iso, idx),
+                title=title,
+                source='구글 뉴스',
+                publisher=publisher,
+                date=date_iso,
+                url=url,
+                summary=f"{title} - {publisher}",
+                tags=keywords[:3],
+                keywords=keywords,
+                isScrapped=False,
+                imageUrl=None
+            ))
+            
+        except Exception as e:
+            logger.error(f"구글 뉴스 RSS 아이템 파싱 오류: {str(e)}")
+            traceback.print_exc()
+            continue
+    
+    return items
+
+
+def fetch_google_news(keyword: str, page: int = 1, max_items: int = 10) -> Optional[List[NewsItem]]:
+    """구글 뉴스 RSS를 HTTP로 직접 수집 (RSS 형식이 아니면 None)"""
+    url = GOOGLE_RSS_URL.format(query=quote_plus(keyword))
+    
+    response = fetch(url)
+    response.raise_for_status()
+    return parse_google_rss(response.content, keyword, page, max_items)
@@ -0,0 +1,125 @@
+"""
+스트리밍 수집 파이프라인
+
+스크래퍼가 yield한 아이템을 중복 제거·가공 단계 → 싱크(sink)로 하나씩 흘려보냅니다.
+싱크는 아이템을 받는 즉시(또는 작은 배치 단위로) 기록하므로, 전체 크롤링이 끝나기 전에
+출력이 시작되고 대량 백필 중에도 메모리 사용량이 일정하게 유지됩니다.
+"""
+
+import os
+import sys
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, Optional
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.store import ItemStore, UpsertResult
+from crawlers.jobs import check_cancelled
+
+logger = logging.getLogger('pipeline')
+
+
+# 파이프라인 단계
+
+def dedup(items: Iterable, key: Callable[[Any], Hashable] = lambda item: item.url) -> Iterator:
+    """이미 지나간 키(기본: URL)의 아이템을 건너뜀"""
+    seen = set()
+    for item in items:
+        item_key = key(item)
+        if item_key in seen:
+            continue
+        seen.add(item_key)
+        yield item
+
+
+# 싱크
+
+def _to_json(item: Any) -> str:
+    """모델은 딕셔너리를 거치지 않고 바로 JSON으로 인코딩"""
+    if hasattr(item, 'to_json'):
+        return item.to_json()
+    return json.dumps(item, ensure_ascii=False)
+
+
+class Sink:
+    """파이프라인 출력 대상 (write는 아이템 모델 또는 딕셔너리를 하나씩 받음)"""
+
+    def write(self, item: Any):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class JsonArraySink(Sink):
+    """아이템을 JSON 배열로 스트리밍 기록 (완료 시 임시 파일을 원래 경로로 교체)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        os.makedirs(self.path.parent, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix='.tmp')
+        self._file = os.fdopen(fd, 'w', encoding='utf-8')
+        self._file.write('[')
+        self.count = 0
+
+    def write(self, item: Any):
+        self._file.write(',\n  ' if self.count else '\n  ')
+        self._file.write(_to_json(item))
+        self.count += 1
+
+    def close(self):
+        self._file.write('\n]\n' if self.count else ']\n')
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+
+class StoreSink(Sink):
+    """아이템을 batch_size개씩 저장소에 upsert"""
+
+    def __init__(self, store: ItemStore, batch_size: int = 100):
+        self.store = store
+        self.batch_size = batch_size
+        self.result = UpsertResult()
+        self._batch: List[Any] = []
+
+    def _flush(self):
+        if not self._batch:
+            return
+        result = self.store.upsert_items(self._batch)
+        self.result.new.extend(result.new)
+        self.result.changed.extend(result.changed)
+        self.result.unchanged += result.unchanged
+        self._batch = []
+
+    def write(self, item: Any):
+        self._batch.append(item)
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def close(self):
+        self._flush()
+
+
+def run_pipeline(items: Iterable, sinks: List[Sink], limit: Optional[int] = None) -> int:
+    """아이템을 모든 싱크에 기록하고 처리 건수 반환 (직렬화 방식은 싱크마다 결정)"""
+    count = 0
+    try:
+        for item in items:
+            # 스케줄러 작업으로 실행 중이면 마감 시간 초과 시 여기서 중단
+            check_cancelled()
+            for sink in sinks:
+                sink.write(item)
+            count += 1
+            if limit and count >= limit:
+                break
+    finally:
+        for sink in sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                logger.error(f"싱크 종료 오류 ({type(sink).__name__}): {str(e)}")
+    logger.info(f"파이프라인 처리 완료: {count}개 항목")
+    return count
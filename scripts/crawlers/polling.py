@@ -0,0 +1,181 @@
+"""
+소스별 적응형 폴링 간격
+
+저장소의 최초 수집 시각(first_seen)으로 소스마다 요일·시간대별 신규 게시 빈도를 학습하고,
+다음 폴링까지 기대 신규 게시물 수가 목표치에 도달하는 간격을 계산합니다.
+평소 게시가 몰리는 시간대에는 POLL_MIN_INTERVAL까지 짧아지고, 야간·주말에는 POLL_MAX_INTERVAL까지 길어지며,
+게시가 기대되던 폴링이 연속으로 비면 목표치를 높여 점점 덜 자주 폴링합니다.
+"""
+
+import os
+import sys
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import (
+    KST, POLL_MIN_INTERVAL, POLL_MAX_INTERVAL, POLL_DEFAULT_INTERVAL, POLL_TARGET_ITEMS,
+    POLL_IDLE_BACKOFF, POLL_HISTORY_DAYS, POLL_MIN_HISTORY
+)
+from crawlers.sources import SOURCES
+from crawlers.store import ItemStore, get_store
+
+logger = logging.getLogger('polling')
+
+HOURS_PER_WEEK = 7 * 24
+
+# 연속 유휴 시 목표치 증가 상한 (POLL_IDLE_BACKOFF ** n)
+MAX_IDLE_FACTOR = 8.0
+
+# 학습 결과를 다시 계산하는 주기
+PROFILE_REFRESH = timedelta(hours=6)
+
+
+def _to_kst(value: str) -> Optional[datetime]:
+    """저장소 시각 문자열 → KST datetime (시간대 없는 값은 로컬 시각으로 간주)"""
+    try:
+        return datetime.fromisoformat(value).astimezone(KST)
+    except (TypeError, ValueError):
+        return None
+
+
+def _slot(when: datetime) -> int:
+    """요일·시간대 칸 번호 (월요일 0시 = 0)"""
+    when = when.astimezone(KST)
+    return when.weekday() * 24 + when.hour
+
+
+class PublishProfile:
+    """요일·시간대(168칸)별 시간당 기대 신규 게시물 수"""
+
+    def __init__(self, rates: List[float], total: int):
+        self.rates = rates
+        self.total = total
+
+    @classmethod
+    def from_timestamps(cls, timestamps: Iterable[str], now: Optional[datetime] = None,
+                        history_days: int = POLL_HISTORY_DAYS) -> 'PublishProfile':
+        """최초 수집 시각 목록으로 학습
+
+        수집 시각은 실제 게시보다 최대 폴링 간격만큼 늦으므로 앞뒤 한 시간에 나누어 반영하고,
+        관측이 적은 칸은 전체 평균 쪽으로 당겨(평활화) 한 번의 우연한 게시에 과민하게 반응하지 않게 합니다.
+        """
+        now = now or datetime.now(KST)
+        since = now - timedelta(days=history_days)
+        counts = [0.0] * HOURS_PER_WEEK
+        total = 0
+        for value in timestamps:
+            when = _to_kst(value)
+            if when is None or when < since or when > now:
+                continue
+            slot = _slot(when)
+            counts[(slot - 1) % HOURS_PER_WEEK] += 0.25
+            counts[slot] += 0.5
+            counts[(slot + 1) % HOURS_PER_WEEK] += 0.25
+            total += 1
+
+        weeks = max(history_days / 7, 1.0)
+        mean = total / (HOURS_PER_WEEK * weeks)
+        rates = [(count + mean) / (weeks + 1) for count in counts]
+        return cls(rates, total)
+
+    def rate(self, when: datetime) -> float:
+        """해당 시각의 시간당 기대 신규 게시물 수"""
+        return self.rates[_slot(when)]
+
+    def expected(self, start: datetime, minutes: float) -> float:
+        """start부터 minutes분 동안 기대 신규 게시물 수"""
+        expected, when, remaining = 0.0, start, minutes
+        while remaining > 0:
+            to_next_hour = 60 - when.minute - when.second / 60
+            step = min(remaining, to_next_hour)
+            expected += self.rate(when) * step / 60
+            when += timedelta(minutes=step)
+            remaining -= step
+        return expected
+
+    def peak_hours(self, count: int = 3) -> List[Tuple[str, int]]:
+        """게시가 가장 많은 요일·시간대 (로그 출력용)"""
+        days = '월화수목금토일'
+        top = sorted(range(HOURS_PER_WEEK), key=lambda slot: self.rates[slot], reverse=True)[:count]
+        return [(days[slot // 24], slot % 24) for slot in top]
+
+
+class AdaptivePoller:
+    """피드(보도자료 기관 또는 뉴스)별 다음 폴링 간격 계산"""
+
+    def __init__(self, store: Optional[ItemStore] = None,
+                 min_interval: float = POLL_MIN_INTERVAL, max_interval: float = POLL_MAX_INTERVAL,
+                 target: float = POLL_TARGET_ITEMS, backoff: float = POLL_IDLE_BACKOFF):
+        self.store = store
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target = target
+        self.backoff = backoff
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, Tuple[datetime, PublishProfile]] = {}
+        self._idle: Dict[str, int] = {}
+        self._expected: Dict[str, float] = {}
+
+    @staticmethod
+    def feeds() -> List[str]:
+        """폴링 대상 피드 (보도자료 소스 키 + 'news')"""
+        return list(SOURCES) + ['news']
+
+    def _history(self, feed: str, since: datetime) -> List[str]:
+        store = self.store or get_store()
+        # first_seen은 시간대 없는 로컬 시각으로 저장되어 있음
+        since_text = since.astimezone().replace(tzinfo=None).isoformat()
+        if feed == 'news':
+            return store.first_seen_times(item_type='news', since=since_text)
+        return store.first_seen_times(item_type='source', source=SOURCES[feed].name, since=since_text)
+
+    def profile(self, feed: str, now: Optional[datetime] = None) -> PublishProfile:
+        """피드의 게시 패턴 (PROFILE_REFRESH마다 저장소에서 다시 학습)"""
+        now = now or datetime.now(KST)
+        with self._lock:
+            cached = self._profiles.get(feed)
+        if cached and now - cached[0] < PROFILE_REFRESH:
+            return cached[1]
+
+        profile = PublishProfile.from_timestamps(
+            self._history(feed, now - timedelta(days=POLL_HISTORY_DAYS)), now
+        )
+        with self._lock:
+            self._profiles[feed] = (now, profile)
+        logger.info(f"{feed} 게시 패턴 학습: 최근 {POLL_HISTORY_DAYS}일 {profile.total}개, "
+                    f"주요 시간대 {', '.join(f'{day} {hour}시' for day, hour in profile.peak_hours())}")
+        return profile
+
+    def record(self, feed: str, new_items: int):
+        """폴링 결과 반영
+
+        게시가 기대되던 구간이었는데 신규 게시물이 없을 때만 유휴 횟수를 늘립니다.
+        야간처럼 원래 한산한 구간의 빈 폴링은 세지 않으므로 다음 게시 시간대에는 다시 자주 폴링합니다.
+        """
+        with self._lock:
+            if new_items:
+                self._idle[feed] = 0
+            elif self._expected.get(feed, 0.0) >= self.target:
+                self._idle[feed] = self._idle.get(feed, 0) + 1
+
+    def next_interval(self, feed: str, now: Optional[datetime] = None) -> timedelta:
+        """기대 신규 게시물 수가 목표치에 도달하는 가장 짧은 간격 (최소~최대 간격 사이)"""
+        now = now or datetime.now(KST)
+        profile = self.profile(feed, now)
+        if profile.total < POLL_MIN_HISTORY:
+            return timedelta(minutes=POLL_DEFAULT_INTERVAL)
+
+        idle = self._idle.get(feed, 0)
+        target = self.target * min(self.backoff ** idle, MAX_IDLE_FACTOR)
+        minutes = self.min_interval
+        expected = profile.expected(now, minutes)
+        while minutes < self.max_interval and expected < target:
+            minutes += self.min_interval
+            expected = profile.expected(now, minutes)
+        with self._lock:
+            self._expected[feed] = expected
+        return timedelta(minutes=min(minutes, self.max_interval))
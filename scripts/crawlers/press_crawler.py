@@ -1,382 +1,222 @@
 """
 금융위, 금감원, 한국은행, 과학기술정보통신부 보도자료 크롤러
 
-requests와 BeautifulSoup4를 사용하여 각 기관의 보도자료를 수집합니다.
+공용 HTTP 세션(transport)으로 목록 페이지를 받고, 소스 명세(sources)로 컴파일한
+lxml 파서를 사용하여 각 기관의 보도자료를 수집합니다.
 """
 
 import os
 import sys
+import time
 import logging
-import requests
 import traceback
-from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Optional
 
 # 상위 경로 추가하여 모듈 임포트 가능하게 설정
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from crawlers.config import URLS, DEFAULT_HEADERS, TIMEOUT, START_DATE, save_data, LOG_DIR
-from crawlers.models import SourceItem, parse_date, generate_id
-
-# 로깅 설정
-log_file = LOG_DIR / f"press_crawler_{datetime.now().strftime('%Y%m%d')}.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
+from crawlers.config import MAX_PRESS_PAGES, get_start_date, DATA_DIR, setup_logging
+from crawlers.models import SourceItem, generate_id
+from crawlers.dates import parse_datetime
+from crawlers.engine import CrawlEngine
+from crawlers.transport import format_stats
+from crawlers.http_cache import get_cache
+from crawlers.state import CrawlState
+from crawlers.sources import SOURCES, get_parser
+from crawlers.pipeline import JsonArraySink, run_pipeline
+from crawlers.detail import enrich_details
+from crawlers.metrics import (
+    SOURCE_ERRORS, SOURCE_FETCH_SECONDS, SOURCE_ITEMS, SOURCE_PAGES, SOURCE_PARSE_SECONDS
 )
+
 logger = logging.getLogger('press_crawler')
 
 
-def scrape_fsc(page: int = 1) -> List[SourceItem]:
-    """금융위원회 보도자료 스크래핑"""
-    logger.info(f"금융위원회 보도자료 스크래핑 시작 (페이지: {page})")
-    items = []
+def iter_page_items(key: str, html: str, start_date: Optional[datetime] = None) -> Iterator[SourceItem]:
+    """목록 페이지 HTML에서 보도자료 아이템 생성 (start_date 이전 게시물은 제외)"""
+    spec = SOURCES[key]
+    for row in get_parser(key).parse(html):
+        try:
+            detail_url = f"{spec.base_url}{row.href}"
+            date = parse_datetime(row.date_text)
+            if date is None:
+                continue
+            date_iso = date.isoformat()
+            
+            # 날짜 필터링
+            if start_date is not None and date < start_date:
+                continue
+            
+            # ID 생성 (게시물 ID가 없으면 행 순번 사용)
+            item_id = generate_id(key, date_iso, row.post_id or row.index)
+            
+            # 아이템 생성
+            yield SourceItem(
+                id=item_id,
+                title=row.title,
+                source=spec.name,
+                organization=spec.name,
+                date=date_iso,
+                url=detail_url,
+                summary=f"{row.title} - {spec.name} 보도자료",
+                tags=list(spec.tags)
+            )
+            
+        except Exception as e:
+            logger.error(f"{spec.name} 아이템 파싱 오류: {str(e)}")
+            SOURCE_ERRORS.inc(source=key, stage='item')
+            traceback.print_exc()
+            continue
+
+
+def iter_source(key: str, page: int = 1) -> Iterator[SourceItem]:
+    """소스 명세(SOURCES)에 따라 기관 보도자료 목록 페이지 스크래핑 (파싱하는 대로 yield)"""
+    spec = SOURCES[key]
+    logger.info(f"{spec.name} 보도자료 스크래핑 시작 (페이지: {page})")
     
+    stage = 'fetch'
     try:
-        url = URLS['fsc']['list'].format(page=page)
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=TIMEOUT)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        rows = soup.select('.boardList tbody tr')
-        
-        for idx, row in enumerate(rows):
-            try:
-                # 공지사항 제외
-                notice_tag = row.select_one('.important, .notice')
-                if notice_tag:
-                    continue
-                
-                # 제목 및 URL 추출
-                title_element = row.select_one('.title a')
-                if not title_element:
-                    continue
-                    
-                title = title_element.text.strip()
-                if not title:
-                    continue
-                
-                href = title_element.get('href')
-                if not href:
-                    continue
-                    
-                detail_url = f"{URLS['fsc']['base']}{href}"
-                
-                # 날짜 추출
-                date_cell = row.select_one('td.date, td:nth-child(5)')
-                if not date_cell:
-                    continue
-                    
-                date_text = date_cell.text.strip()
-                date_iso = parse_date(date_text)
-                
-                # 날짜 필터링
-                if datetime.fromisoformat(date_iso.replace('Z', '+00:00')) < START_DATE:
-                    continue
-                
-                # ID 생성
-                item_id = generate_id('fsc', date_iso, idx)
-                
-                # 아이템 생성
-                item = SourceItem(
-                    id=item_id,
-                    title=title,
-                    source='금융위원회',
-                    organization='금융위원회',
-                    date=date_iso,
-                    url=detail_url,
-                    summary=f"{title} - 금융위원회 보도자료",
-                    tags=['금융위원회', '보도자료']
-                )
-                
-                items.append(item)
-                
-            except Exception as e:
-                logger.error(f"금융위원회 아이템 파싱 오류: {str(e)}")
-                traceback.print_exc()
-                continue
-        
-        logger.info(f"금융위원회 보도자료 스크래핑 완료: {len(items)}개 항목")
-        return items
+        url = spec.list_url.format(page=page)
+        start = time.perf_counter()
+        cached = get_cache().get(url)
+        SOURCE_FETCH_SECONDS.observe(time.perf_counter() - start, source=key)
+        
+        # 목록이 바뀌지 않았으면 이전 파싱 결과 재사용
+        if cached.unchanged and cached.items is not None:
+            logger.info(f"{spec.name} 보도자료 목록 변경 없음 - 파싱 생략 (페이지: {page})")
+            SOURCE_PAGES.inc(source=key, result='unchanged')
+            # 파싱한 뒤 검색 기간이 지났을 수 있으므로 캐시된 아이템에도 같은 날짜 필터 적용
+            start_date = get_start_date()
+            items = [SourceItem.from_dict(item) for item in cached.items
+                     if datetime.fromisoformat(item['date']) >= start_date]
+            SOURCE_ITEMS.inc(len(items), source=key)
+            yield from items
+            return
+        
+        stage = 'parse'
+        start = time.perf_counter()
+        items = list(iter_page_items(key, cached.text, get_start_date()))
+        SOURCE_PARSE_SECONDS.observe(time.perf_counter() - start, source=key)
         
     except Exception as e:
-        logger.error(f"금융위원회 보도자료 스크래핑 오류: {str(e)}")
+        logger.error(f"{spec.name} 보도자료 스크래핑 오류: {str(e)}")
         traceback.print_exc()
-        return []
+        SOURCE_PAGES.inc(source=key, result='error')
+        SOURCE_ERRORS.inc(source=key, stage=stage)
+        return
+    
+    SOURCE_PAGES.inc(source=key, result='parsed')
+    SOURCE_ITEMS.inc(len(items), source=key)
+    
+    parsed = []
+    for item in items:
+        parsed.append(item.to_dict())
+        yield item
+    
+    get_cache().store_items(url, cached.content_hash, parsed)
+    logger.info(f"{spec.name} 보도자료 스크래핑 완료: {len(parsed)}개 항목")
+
+
+def scrape_source(key: str, page: int = 1) -> List[SourceItem]:
+    """소스 명세(SOURCES)에 따라 기관 보도자료 목록 페이지 스크래핑"""
+    return list(iter_source(key, page))
+
+
+def scrape_fsc(page: int = 1) -> List[SourceItem]:
+    """금융위원회 보도자료 스크래핑"""
+    return scrape_source('fsc', page)
 
 
 def scrape_fss(page: int = 1) -> List[SourceItem]:
     """금융감독원 보도자료 스크래핑"""
-    logger.info(f"금융감독원 보도자료 스크래핑 시작 (페이지: {page})")
-    items = []
-    
-    try:
-        url = URLS['fss']['list'].format(page=page)
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=TIMEOUT)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        rows = soup.select('.boardList tbody tr')
-        
-        for idx, row in enumerate(rows):
-            try:
-                # 공지사항 제외
-                notice_tag = row.select_one('.noticeTag')
-                if notice_tag:
-                    continue
-                
-                # 제목 및 URL 추출
-                title_element = row.select_one('.title a')
-                if not title_element:
-                    continue
-                    
-                title = title_element.text.strip()
-                if not title:
-                    continue
-                
-                href = title_element.get('href')
-                if not href:
-                    continue
-                    
-                detail_url = f"{URLS['fss']['base']}{href}"
-                
-                # ID 추출
-                id_match = href.split('nttId=')
-                id_suffix = id_match[1].split('&')[0] if len(id_match) > 1 else str(idx)
-                
-                # 날짜 추출
-                date_cell = row.select_one('td:nth-child(5)')
-                if not date_cell:
-                    continue
-                    
-                date_text = date_cell.text.strip()
-                date_iso = parse_date(date_text)
-                
-                # 날짜 필터링
-                if datetime.fromisoformat(date_iso.replace('Z', '+00:00')) < START_DATE:
-                    continue
-                
-                # ID 생성
-                item_id = generate_id('fss', date_iso, id_suffix)
-                
-                # 아이템 생성
-                item = SourceItem(
-                    id=item_id,
-                    title=title,
-                    source='금융감독원',
-                    organization='금융감독원',
-                    date=date_iso,
-                    url=detail_url,
-                    summary=f"{title} - 금융감독원 보도자료",
-                    tags=['금융감독원', '보도자료']
-                )
-                
-                items.append(item)
-                
-            except Exception as e:
-                logger.error(f"금융감독원 아이템 파싱 오류: {str(e)}")
-                traceback.print_exc()
-                continue
-        
-        logger.info(f"금융감독원 보도자료 스크래핑 완료: {len(items)}개 항목")
-        return items
-        
-    except Exception as e:
-        logger.error(f"금융감독원 보도자료 스크래핑 오류: {str(e)}")
-        traceback.print_exc()
-        return []
+    return scrape_source('fss', page)
 
 
 def scrape_bok(page: int = 1) -> List[SourceItem]:
     """한국은행 보도자료 스크래핑"""
-    logger.info(f"한국은행 보도자료 스크래핑 시작 (페이지: {page})")
-    items = []
-    
-    try:
-        url = URLS['bok']['list'].format(page=page)
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=TIMEOUT)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        rows = soup.select('.bbs-list table tbody tr')
-        
-        for idx, row in enumerate(rows):
-            try:
-                # 공지사항 제외
-                notice_tag = row.select_one('.noti')
-                if notice_tag:
-                    continue
-                
-                # 제목 및 URL 추출
-                title_element = row.select_one('.bbs-subj a')
-                if not title_element:
-                    continue
-                    
-                title = title_element.text.strip()
-                if not title:
-                    continue
-                
-                href = title_element.get('href')
-                if not href:
-                    continue
-                    
-                detail_url = f"{URLS['bok']['base']}{href}"
-                
-                # ID 추출
-                id_match = href.split('nttId=')
-                id_suffix = id_match[1].split('&')[0] if len(id_match) > 1 else str(idx)
-                
-                # 날짜 추출
-                date_cell = row.select_one('.bbs-date')
-                if not date_cell:
-                    continue
-                    
-                date_text = date_cell.text.strip()
-                date_iso = parse_date(date_text)
-                
-                # 날짜 필터링
-                if datetime.fromisoformat(date_iso.replace('Z', '+00:00')) < START_DATE:
-                    continue
-                
-                # ID 생성
-                item_id = generate_id('bok', date_iso, id_suffix)
-                
-                # 아이템 생성
-                item = SourceItem(
-                    id=item_id,
-                    title=title,
-                    source='한국은행',
-                    organization='한국은행',
-                    date=date_iso,
-                    url=detail_url,
-                    summary=f"{title} - 한국은행 보도자료",
-                    tags=['한국은행', '보도자료']
-                )
-                
-                items.append(item)
-                
-            except Exception as e:
-                logger.error(f"한국은행 아이템 파싱 오류: {str(e)}")
-                traceback.print_exc()
-                continue
-        
-        logger.info(f"한국은행 보도자료 스크래핑 완료: {len(items)}개 항목")
-        return items
-        
-    except Exception as e:
-        logger.error(f"한국은행 보도자료 스크래핑 오류: {str(e)}")
-        traceback.print_exc()
-        return []
+    return scrape_source('bok', page)
 
 
 def scrape_msit(page: int = 1) -> List[SourceItem]:
     """과학기술정보통신부 보도자료 스크래핑"""
-    logger.info(f"과학기술정보통신부 보도자료 스크래핑 시작 (페이지: {page})")
+    return scrape_source('msit', page)
+
+
+def crawl_source(key: str, max_pages: int = MAX_PRESS_PAGES, state: Optional[CrawlState] = None) -> List[SourceItem]:
+    """기관별 증분 수집
+    
+    첫 페이지부터 읽다가 이미 수집한 게시물에 도달하면 멈추고,
+    페이지 전체가 신규 게시물이면(게시물이 몰린 경우) 다음 페이지까지 따라갑니다.
+    """
     items = []
     
-    try:
-        url = URLS['msit']['list'].format(page=page)
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=TIMEOUT)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        rows = soup.select('.pblancList table tbody tr')
-        
-        for idx, row in enumerate(rows):
-            try:
-                # 공지사항 제외
-                notice_tag = row.select_one('.noti, .notice')
-                if notice_tag:
-                    continue
-                
-                # 제목 및 URL 추출
-                title_element = row.select_one('.subj a')
-                if not title_element:
-                    continue
-                    
-                title = title_element.text.strip()
-                if not title:
-                    continue
-                
-                href = title_element.get('href')
-                if not href:
-                    continue
-                    
-                detail_url = f"{URLS['msit']['base']}{href}"
-                
-                # ID 추출
-                id_match = href.split('nttSeqNo=')
-                id_suffix = id_match[1].split('&')[0] if len(id_match) > 1 else str(idx)
-                
-                # 날짜 추출
-                date_cell = row.select_one('.date')
-                if not date_cell:
-                    continue
-                    
-                date_text = date_cell.text.strip()
-                date_iso = parse_date(date_text)
-                
-                # 날짜 필터링
-                if datetime.fromisoformat(date_iso.replace('Z', '+00:00')) < START_DATE:
-                    continue
-                
-                # ID 생성
-                item_id = generate_id('msit', date_iso, id_suffix)
-                
-                # 아이템 생성
-                item = SourceItem(
-                    id=item_id,
-                    title=title,
-                    source='과학기술정보통신부',
-                    organization='과학기술정보통신부',
-                    date=date_iso,
-                    url=detail_url,
-                    summary=f"{title} - 과학기술정보통신부 보도자료",
-                    tags=['과학기술정보통신부', '보도자료', 'ICT']
-                )
-                
-                items.append(item)
-                
-            except Exception as e:
-                logger.error(f"과학기술정보통신부 아이템 파싱 오류: {str(e)}")
-                traceback.print_exc()
-                continue
-        
-        logger.info(f"과학기술정보통신부 보도자료 스크래핑 완료: {len(items)}개 항목")
-        return items
-        
-    except Exception as e:
-        logger.error(f"과학기술정보통신부 보도자료 스크래핑 오류: {str(e)}")
-        traceback.print_exc()
-        return []
+    for page in range(1, max_pages + 1):
+        page_items = scrape_source(key, page)
+        if not page_items:
+            break
+        items.extend(page_items)
+        
+        if state is None:
+            continue
+        
+        # 이미 수집한 게시물이 보이면 더 깊이 탐색할 필요 없음
+        new_items = [item for item in page_items if not state.is_known(key, item)]
+        if len(new_items) < len(page_items):
+            logger.info(f"{key} 기존 게시물 도달 - {page}페이지에서 탐색 종료 (신규 {len(new_items)}개)")
+            break
+    
+    if state is not None:
+        state.update(key, items)
+    return items
 
 
-def fetch_all_press_releases(max_pages: int = 3) -> List[SourceItem]:
-    """모든 기관의 보도자료 수집"""
-    logger.info(f"모든 기관 보도자료 스크래핑 시작 (최대 페이지: {max_pages})")
-    all_items = []
+def iter_press_releases(max_pages: int = 3, per_host_limit: Optional[int] = None,
+                        incremental: bool = True, sources: Optional[Iterable[str]] = None) -> Iterator[SourceItem]:
+    """모든 기관(또는 sources에 지정한 기관)의 보도자료를 작업이 끝나는 순서대로 yield (정렬하지 않음)
+    
+    incremental이 True이면 저장된 high-water mark를 기준으로 기관별 탐색 깊이를 정하고,
+    False이면 각 기관의 1페이지부터 max_pages까지 모두 수집합니다.
+    """
+    specs = {key: SOURCES[key] for key in sources} if sources is not None else SOURCES
+    logger.info(f"{'모든 기관' if sources is None else ', '.join(specs)} 보도자료 스크래핑 시작 (최대 페이지: {max_pages})")
+    count = 0
+    
+    if incremental:
+        # 기관별로 동시에, 기관 내부에서는 페이지를 순서대로 탐색
+        state = CrawlState()
+        jobs = [
+            (spec.host, crawl_source, (key, max_pages, state))
+            for key, spec in specs.items()
+        ]
+    else:
+        # 각 기관 첫 페이지부터 max_pages까지 동시에 스크래핑
+        state = None
+        jobs = [
+            (spec.host, scrape_source, (key, page))
+            for page in range(1, max_pages + 1)
+            for key, spec in specs.items()
+        ]
+    
+    for _, result in CrawlEngine(per_host_limit=per_host_limit).iter_results(jobs):
+        if isinstance(result, list):
+            count += len(result)
+            yield from result
+    
+    if state is not None:
+        state.save()
     
+    logger.info(f"{'모든 기관' if sources is None else ', '.join(specs)} 보도자료 스크래핑 완료: 총 {count}개 항목")
+    logger.info(f"HTTP 연결 통계: {format_stats()}")
+
+
+def fetch_all_press_releases(max_pages: int = 3, per_host_limit: Optional[int] = None,
+                             incremental: bool = True) -> List[SourceItem]:
+    """모든 기관의 보도자료 수집 (날짜 내림차순 정렬)"""
     try:
-        # 각 기관 첫 페이지부터 max_pages까지 스크래핑
-        for page in range(1, max_pages + 1):
-            fsc_items = scrape_fsc(page)
-            fss_items = scrape_fss(page)
-            bok_items = scrape_bok(page)
-            msit_items = scrape_msit(page)
-            
-            all_items.extend(fsc_items)
-            all_items.extend(fss_items)
-            all_items.extend(bok_items)
-            all_items.extend(msit_items)
+        all_items = list(iter_press_releases(max_pages, per_host_limit, incremental))
         
         # 날짜 기준 내림차순 정렬
         all_items.sort(key=lambda x: x.date, reverse=True)
-        
-        logger.info(f"모든 기관 보도자료 스크래핑 완료: 총 {len(all_items)}개 항목")
         return all_items
         
     except Exception as e:
@@ -386,13 +226,9 @@ def fetch_all_press_releases(max_pages: int = 3) -> List[SourceItem]:
 
 
 if __name__ == "__main__":
-    # 직접 실행 시 테스트
-    results = fetch_all_press_releases(max_pages=1)
-    
-    # 결과 저장
-    if results:
-        filename = f"press_releases_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        saved_path = save_data([item.to_dict() for item in results], filename)
-        logger.info(f"보도자료 저장 완료: {saved_path} ({len(results)}개 항목)")
-    else:
-        logger.warning("저장할 보도자료가 없습니다.") 
\ No newline at end of file
+    # 직접 실행 시 테스트 (수집되는 대로 파일에 기록)
+    setup_logging('press_crawler')
+    filename = f"press_releases_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    sink = JsonArraySink(DATA_DIR / filename)
+    count = run_pipeline(enrich_details(iter_press_releases(max_pages=1)), [sink])
+    logger.info(f"보도자료 저장 완료: {sink.path} ({count}개 항목)")
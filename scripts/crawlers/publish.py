@@ -0,0 +1,274 @@
+"""
+최신 데이터 게시 및 변경분(delta) 로그
+
+latest_*.json 스냅샷은 임시 파일에 쓴 뒤 이름을 바꿔 원자적으로 교체하므로
+읽는 쪽에서 절반만 쓰인 파일을 보지 않습니다.
+새로 수집되었거나 내용이 바뀐 아이템은 순번(seq)이 붙은 추가 전용 JSONL 로그에 기록하여,
+읽는 쪽은 "커서 N 이후의 변경분"만 읽을 수 있습니다.
+스케줄러와 CLI(요약, 태그 재계산)가 동시에 게시할 수 있으므로 게시와 로그 추가는 파일 잠금 안에서 하고,
+순번은 잠금을 잡은 뒤 파일 끝에서 다시 읽어 이어 붙입니다.
+
+사용 예:
+    python -m scripts.crawlers.publish news_items --after 120
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import DATA_DIR
+
+logger = logging.getLogger('publish')
+
+MANIFEST_FILE = DATA_DIR / "publish_manifest.json"
+
+# 아이템 유형별 게시 종류 (latest_<종류>.json, delta_<종류>.jsonl)
+PUBLISH_KINDS = {'source': 'press_releases', 'news': 'news_items'}
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = 2):
+    """JSON을 같은 디렉토리의 임시 파일에 쓴 뒤 rename으로 원자적으로 교체"""
+    path = Path(path)
+    os.makedirs(path.parent, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def file_lock(path: Path):
+    """잠금 파일로 다른 프로세스(및 스레드)와 배타 구간 확보 (잠금을 얻을 때까지 대기)"""
+    path = Path(path)
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK은 10초 동안 얻지 못하면 OSError
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class DeltaLog:
+    """순번이 붙은 추가 전용 변경분 로그 (한 줄에 한 항목)"""
+
+    def __init__(self, kind: str, data_dir: Path = DATA_DIR):
+        self.kind = kind
+        self.path = Path(data_dir) / f"delta_{kind}.jsonl"
+        self.lock_path = Path(data_dir) / f"delta_{kind}.lock"
+        self._lock = threading.Lock()
+        self._last_seq = self._read_last_seq()
+
+    @property
+    def last_seq(self) -> int:
+        """이 프로세스가 마지막으로 확인한 순번 (다른 프로세스가 이후에 추가했을 수 있음)"""
+        return self._last_seq
+
+    def _read_last_seq(self) -> int:
+        """파일 끝에서 마지막 완전한 줄의 순번 조회"""
+        if not self.path.exists():
+            return 0
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            block = 4096
+            while end > 0:
+                start = max(0, end - block)
+                f.seek(start)
+                chunk = f.read(end - start)
+                lines = chunk.rstrip(b'\n').split(b'\n')
+                for line in reversed(lines if start == 0 else lines[1:]):
+                    try:
+                        return json.loads(line)['seq']
+                    except (ValueError, KeyError):
+                        continue
+                if start == 0:
+                    break
+                block *= 2
+        return 0
+
+    def append(self, items: Iterable[Dict[str, Any]], op: str = 'upsert') -> int:
+        """아이템을 변경분으로 기록하고 마지막 순번 반환 (다른 프로세스의 기록 뒤에 이어지도록 잠금 안에서 순번 재확인)"""
+        with self._lock, file_lock(self.lock_path):
+            now = datetime.now().isoformat()
+            seq = self._last_seq = self._read_last_seq()
+            lines = []
+            for item in items:
+                seq += 1
+                lines.append(json.dumps({'seq': seq, 'op': op, 'at': now, 'item': item},
+                                        ensure_ascii=False))
+            if not lines:
+                return self._last_seq
+
+            os.makedirs(self.path.parent, exist_ok=True)
+            with open(self.path, 'a+b') as f:
+                # 이전 기록이 중간에 끊겼으면 새 줄에서 시작
+                if f.tell() > 0:
+                    f.seek(f.tell() - 1)
+                    if f.read(1) != b'\n':
+                        lines.insert(0, '')
+                f.write(('\n'.join(lines) + '\n').encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+            self._last_seq = seq
+            return seq
+
+    def _offset_after(self, f, cursor: int) -> int:
+        """순번이 cursor 이하인 줄을 건너뛴 줄 시작 위치 (이진 탐색, 결과 이후 몇 줄은 호출자가 거름)"""
+        f.seek(0, os.SEEK_END)
+        low, high = 0, f.tell()
+        while low < high:
+            mid = (low + high) // 2
+            f.seek(mid)
+            if mid > 0:
+                f.readline()  # 줄 중간이면 다음 줄 시작으로 이동
+            line = f.readline() if f.tell() < high else b''
+            try:
+                seq = json.loads(line)['seq'] if line.endswith(b'\n') else None
+            except (ValueError, KeyError):
+                seq = None
+            if seq is not None and seq <= cursor:
+                low = f.tell()
+            else:
+                high = mid
+        return low
+
+    def read_after(self, cursor: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """cursor 이후의 변경분과 다음 커서 반환"""
+        if not self.path.exists():
+            return [], cursor
+
+        entries = []
+        next_cursor = cursor
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset_after(f, cursor))
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # 기록 중인 마지막 줄은 다음에 읽음
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # 중간에 끊긴 기록
+                if entry['seq'] <= cursor:
+                    continue
+                entries.append(entry)
+                next_cursor = entry['seq']
+                if limit and len(entries) >= limit:
+                    break
+        return entries, next_cursor
+
+
+def _update_manifest(kind: str, snapshot: Path, seq: int, count: int):
+    """종류별 최신 스냅샷과 그 시점의 delta 순번 기록 (여러 종류가 한 파일을 쓰므로 잠금 안에서 읽고 씀)"""
+    with file_lock(MANIFEST_FILE.with_suffix('.lock')):
+        manifest: Dict[str, Any] = {}
+        if MANIFEST_FILE.exists():
+            try:
+                with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+        manifest[kind] = {
+            'snapshot': snapshot.name,
+            'seq': seq,
+            'count': count,
+            'published_at': datetime.now().isoformat(),
+        }
+        atomic_write_json(MANIFEST_FILE, manifest)
+
+
+_logs: Dict[str, DeltaLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_delta_log(kind: str) -> DeltaLog:
+    """종류별 공용 delta 로그 반환"""
+    with _logs_lock:
+        if kind not in _logs:
+            _logs[kind] = DeltaLog(kind, DATA_DIR)
+        return _logs[kind]
+
+
+def publish(kind: str, load_snapshot: Callable[[], List[Dict[str, Any]]],
+            changed_items: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+    """변경분을 로그에 추가하고 latest_{kind}.json 스냅샷을 원자적으로 교체, (delta 순번, 스냅샷 항목 수) 반환
+
+    변경분 → 스냅샷 → 매니페스트 순서로 기록하므로, 매니페스트의 seq 이후 변경분만
+    읽으면 스냅샷과 합쳐 최신 상태를 얻을 수 있습니다.
+    다른 프로세스의 게시와 섞이지 않도록 종류별 잠금 안에서 스냅샷을 읽어(load_snapshot) 씁니다.
+    """
+    with file_lock(DATA_DIR / f"publish_{kind}.lock"):
+        seq = get_delta_log(kind).append(changed_items)
+        snapshot_items = load_snapshot()
+        snapshot = DATA_DIR / f"latest_{kind}.json"
+        atomic_write_json(snapshot, snapshot_items)
+        _update_manifest(kind, snapshot, seq, len(snapshot_items))
+    logger.info(f"{snapshot.name} 게시 완료: {len(snapshot_items)}개 항목, delta seq {seq}")
+    return seq, len(snapshot_items)
+
+
+def republish(store, changed_items: List[Dict[str, Any]]) -> Dict[str, int]:
+    """저장소에서 바뀐 아이템을 검색 색인에 반영하고 유형별 최신 파일 다시 게시 (CLI 일괄 갱신 후 사용, 종류별 seq 반환)"""
+    from crawlers.search import SearchIndex
+
+    if not changed_items:
+        return {}
+    SearchIndex(store).index_items(changed_items)
+    seqs = {}
+    for item_type, kind in PUBLISH_KINDS.items():
+        items = [data for data in changed_items if data.get('type') == item_type]
+        if items:
+            seqs[kind], _ = publish(kind, lambda item_type=item_type: store.latest_items(item_type), items)
+    return seqs
+
+
+def main(argv: Optional[List[str]] = None):
+    """delta 로그 조회 CLI"""
+    parser = argparse.ArgumentParser(description='변경분(delta) 로그 조회')
+    parser.add_argument('kind', choices=['press_releases', 'news_items'], help='데이터 종류')
+    parser.add_argument('--after', type=int, default=0, help='이 순번 이후의 변경분만 조회')
+    parser.add_argument('--limit', type=int, help='최대 항목 수')
+    args = parser.parse_args(argv)
+
+    entries, next_cursor = get_delta_log(args.kind).read_after(args.after, args.limit)
+    print(json.dumps({'entries': entries, 'next': next_cursor}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
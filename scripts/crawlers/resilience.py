@@ -0,0 +1,210 @@
+"""
+호스트별 요청 제한, 재시도, 서킷 브레이커
+
+- 토큰 버킷: 호스트마다 초당 요청 수와 순간 허용량(burst)을 제한합니다.
+- 재시도: 연결 오류, 시간 초과, 재시도 가능한 상태 코드(429, 5xx)는 지수 백오프 + 지터로 다시 요청합니다.
+  Retry-After 헤더가 있으면 그 시간 이상 기다립니다.
+- 서킷 브레이커: 연속 실패가 임계치를 넘은 호스트는 쿨다운 동안 요청하지 않고 바로 실패 처리하며,
+  쿨다운 후 한 번 시험 요청이 성공하면 다시 정상 상태로 돌아갑니다.
+"""
+
+import os
+import sys
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import (
+    HOST_RATE_LIMITS, RETRY_STATUSES, RETRY_MAX_ATTEMPTS, RETRY_BACKOFF_BASE, RETRY_BACKOFF_MAX,
+    BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN
+)
+from crawlers.metrics import BREAKER_OPEN, FETCH_RETRIES, FETCH_SKIPPED, RATE_LIMIT_WAIT
+
+logger = logging.getLogger('resilience')
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """서킷 브레이커가 열려 있어 요청하지 않은 호스트 (일반 연결 오류와 같은 경로로 처리됨)"""
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 하나를 사용 (부족하면 채워질 때까지 대기), 대기한 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰을 먼저 예약하여 대기 중인 다른 스레드와 순서를 지킴
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커 (closed → open → half-open → closed)"""
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, cooldown: float = BREAKER_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return 'open'
+        return 'half-open'
+
+    def allow(self) -> bool:
+        """요청 허용 여부 (half-open 상태에서는 시험 요청 하나만 허용)"""
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> bool:
+        """실패 기록, 이번 실패로 브레이커가 열렸으면 True"""
+        with self._lock:
+            self.failures += 1
+            was_trial, self._trial = self._trial, False
+            if was_trial or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
+class HostGuard:
+    """호스트 하나의 토큰 버킷과 서킷 브레이커"""
+
+    def __init__(self, host: str):
+        self.host = host
+        rate, burst = HOST_RATE_LIMITS.get(host, HOST_RATE_LIMITS['*'])
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker()
+
+
+_guards: Dict[str, HostGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_guard(host: str) -> HostGuard:
+    """호스트별 공용 HostGuard 반환"""
+    guard = _guards.get(host)
+    if guard is None:
+        with _guards_lock:
+            guard = _guards.setdefault(host, HostGuard(host))
+    return guard
+
+
+def get_breaker_states() -> Dict[str, Tuple[str, int]]:
+    """호스트별 (브레이커 상태, 연속 실패 횟수)"""
+    with _guards_lock:
+        guards = list(_guards.values())
+    return {guard.host: (guard.breaker.state, guard.breaker.failures) for guard in guards}
+
+
+def _retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 시간(초)"""
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """attempt번째 재시도 전 대기 시간 (지수 백오프 + full jitter, Retry-After 이상)"""
+    delay = random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_BACKOFF_MAX))
+    return delay
+
+
+def call_with_retry(host: str, send: Callable[[], requests.Response],
+                    max_attempts: int = RETRY_MAX_ATTEMPTS) -> requests.Response:
+    """호스트 제한과 브레이커를 적용하여 send() 실행
+
+    재시도 가능한 상태 코드가 끝까지 이어지면 마지막 응답을 그대로 반환하고(호출자가 raise_for_status),
+    연결 오류가 끝까지 이어지면 마지막 예외를 다시 발생시킵니다.
+    """
+    guard = get_guard(host)
+    for attempt in range(max_attempts):
+        if not guard.breaker.allow():
+            FETCH_SKIPPED.inc(host=host)
+            raise CircuitOpenError(f"{host} 서킷 브레이커 열림 (연속 실패 {guard.breaker.failures}회) - 요청 생략")
+
+        waited = guard.bucket.acquire()
+        if waited:
+            RATE_LIMIT_WAIT.inc(waited, host=host)
+
+        response, error = None, None
+        try:
+            response = send()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+
+        if error is None and response.status_code not in RETRY_STATUSES:
+            guard.breaker.record_success()
+            BREAKER_OPEN.set(0, host=host)
+            return response
+
+        if guard.breaker.record_failure():
+            BREAKER_OPEN.set(1, host=host)
+            logger.error(f"{host} 서킷 브레이커 열림: 연속 실패 {guard.breaker.failures}회, "
+                         f"{guard.breaker.cooldown:.0f}초 동안 요청 생략")
+
+        reason = str(error) if error is not None else f"HTTP {response.status_code}"
+        if attempt + 1 >= max_attempts or guard.breaker.state != 'closed':
+            logger.warning(f"{host} 요청 실패 ({reason}) - 재시도 중단 (시도 {attempt + 1}회)")
+            if error is not None:
+                raise error
+            return response
+
+        delay = backoff_delay(attempt, _retry_after(response))
+        if response is not None:
+            # 스트리밍 응답은 닫아야 커넥션이 풀로 돌아감 (pool_block이라 안 닫으면 같은 호스트 요청이 멈춤)
+            response.close()
+        FETCH_RETRIES.inc(host=host)
+        logger.warning(f"{host} 요청 실패 ({reason}) - {delay:.1f}초 후 재시도 ({attempt + 1}/{max_attempts - 1})")
+        time.sleep(delay)
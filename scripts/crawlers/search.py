@@ -0,0 +1,204 @@
+"""
+크롤링 아이템 전문 검색 색인
+
+띄어쓰기 없이 쓰이는 한국어를 위해 한글은 음절 바이그램으로, 영문/숫자는 단어 단위로 토큰화한 뒤
+SQLite FTS5 테이블(items.db)에 증분 색인합니다. 검색 결과는 bm25 점수 순으로 반환합니다.
+
+사용 예:
+    python -m scripts.crawlers.search 보이스피싱 --type news --limit 10
+    python -m scripts.crawlers.search --rebuild
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import logging
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.store import ItemStore, get_store
+
+logger = logging.getLogger('search')
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title,
+    summary,
+    tags,
+    tokenize = 'unicode61'
+);
+CREATE TABLE IF NOT EXISTS items_fts_map (
+    url TEXT PRIMARY KEY,
+    fts_rowid INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_fts_map_rowid ON items_fts_map (fts_rowid);
+"""
+
+# 컬럼 가중치 (title, summary, tags)
+BM25_WEIGHTS = (3.0, 1.0, 2.0)
+
+_WORD_PATTERN = re.compile(r'[가-힣]+|[^\W_가-힣]+', re.UNICODE)
+_HANGUL_PATTERN = re.compile(r'[가-힣]')
+
+
+def _word_tokens(word: str) -> List[str]:
+    """단어 하나를 토큰으로 변환 (한글은 음절 바이그램)"""
+    if not _HANGUL_PATTERN.match(word):
+        return [word]
+    if len(word) == 1:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def tokenize_terms(text: str) -> List[List[str]]:
+    """텍스트를 단어별 토큰 목록으로 변환"""
+    if not text:
+        return []
+    normalized = unicodedata.normalize('NFKC', text).lower()
+    return [_word_tokens(word) for word in _WORD_PATTERN.findall(normalized)]
+
+
+def tokenize(text: str) -> List[str]:
+    """텍스트를 색인용 토큰 목록으로 변환"""
+    return [token for tokens in tokenize_terms(text) for token in tokens]
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """검색어를 FTS5 MATCH 식으로 변환 (단어별 바이그램 구문을 AND로 결합)"""
+    phrases = []
+    for tokens in tokenize_terms(query):
+        phrase = ' '.join(token.replace('"', '""') for token in tokens)
+        phrases.append(f'"{phrase}"')
+    return ' AND '.join(phrases) if phrases else None
+
+
+class SearchIndex:
+    """아이템 저장소에 붙는 FTS5 색인"""
+
+    def __init__(self, store: Optional[ItemStore] = None):
+        self.store = store or get_store()
+        with self.store._lock:
+            self.store.conn.executescript(FTS_SCHEMA)
+
+    @staticmethod
+    def _columns(data: Dict[str, Any]):
+        return (
+            ' '.join(tokenize(data.get('title') or '')),
+            ' '.join(tokenize(data.get('summary') or '')),
+            ' '.join(tokenize(' '.join(data.get('tags') or []))),
+        )
+
+    def index_items(self, items: Iterable[Dict[str, Any]]) -> int:
+        """아이템 색인 추가/갱신 (URL 기준, 배치 처리)"""
+        batch = {data['url']: self._columns(data) for data in items}
+        if not batch:
+            return 0
+
+        with self.store._lock, self.store.conn:
+            conn = self.store.conn
+            # 요약·태그 CLI가 스케줄러와 동시에 색인할 수 있으므로 쓰기 잠금을 먼저 잡고 rowid 계산
+            conn.execute("BEGIN IMMEDIATE")
+            urls = list(batch)
+            stale = []
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                stale.extend(
+                    (row['fts_rowid'],) for row in conn.execute(
+                        f"SELECT fts_rowid FROM items_fts_map WHERE url IN ({placeholders})", chunk
+                    )
+                )
+            conn.executemany("DELETE FROM items_fts WHERE rowid = ?", stale)
+
+            next_rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM items_fts").fetchone()[0] + 1
+            rows = [(next_rowid + offset, url) + columns for offset, (url, columns) in enumerate(batch.items())]
+            conn.executemany(
+                "INSERT INTO items_fts (rowid, title, summary, tags) VALUES (?, ?, ?, ?)",
+                [(row[0],) + row[2:] for row in rows]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO items_fts_map (url, fts_rowid) VALUES (?, ?)",
+                [(row[1], row[0]) for row in rows]
+            )
+
+        logger.info(f"검색 색인 갱신: {len(batch)}개 항목")
+        return len(batch)
+
+    def rebuild(self) -> int:
+        """저장소 전체로 색인 재구성"""
+        with self.store._lock, self.store.conn:
+            self.store.conn.execute("DELETE FROM items_fts")
+            self.store.conn.execute("DELETE FROM items_fts_map")
+        return self.index_items(self.store.query())
+
+    def search(self, query: str, item_type: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """검색어와 일치하는 아이템을 관련도 순으로 반환 (_score 포함)"""
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        # 유형 조건이 없으면 색인에서 상위 결과만 먼저 고른 뒤 본문과 조인
+        weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+        params: List[Any] = [match]
+        if item_type:
+            sql = (
+                f"SELECT items.data, bm25(items_fts, {weights}) AS score FROM items_fts "
+                "JOIN items_fts_map ON items_fts_map.fts_rowid = items_fts.rowid "
+                "JOIN items ON items.url = items_fts_map.url "
+                "WHERE items_fts MATCH ? AND items.type = ? ORDER BY score LIMIT ?"
+            )
+            params.extend([item_type, limit])
+        else:
+            sql = (
+                "SELECT items.data, ranked.score FROM ("
+                f"SELECT rowid, bm25(items_fts, {weights}) AS score FROM items_fts "
+                "WHERE items_fts MATCH ? ORDER BY score LIMIT ?"
+                ") AS ranked "
+                "JOIN items_fts_map ON items_fts_map.fts_rowid = ranked.rowid "
+                "JOIN items ON items.url = items_fts_map.url ORDER BY ranked.score"
+            )
+            params.append(limit)
+
+        with self.store._lock:
+            rows = self.store.conn.execute(sql, params).fetchall()
+
+        results = []
+        for row in rows:
+            data = json.loads(row['data'])
+            data['_score'] = -row['score']
+            results.append(data)
+        return results
+
+
+def main(argv: Optional[List[str]] = None):
+    """검색 CLI"""
+    parser = argparse.ArgumentParser(description='크롤링 아이템 전문 검색')
+    parser.add_argument('query', nargs='?', help='검색어')
+    parser.add_argument('--type', choices=['source', 'news'], help='아이템 유형')
+    parser.add_argument('--limit', type=int, default=20, help='최대 결과 수')
+    parser.add_argument('--rebuild', action='store_true', help='저장소 전체로 색인 재구성')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    index = SearchIndex()
+    if args.rebuild:
+        print(f"색인 재구성 완료: {index.rebuild()}개 항목")
+    if not args.query:
+        return
+
+    results = index.search(args.query, item_type=args.type, limit=args.limit)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for data in results:
+        print(f"{data['_score']:7.2f}  {data['date'][:10]}  [{data['source']}] {data['title']}")
+        print(f"         {data['url']}")
+    print(f"총 {len(results)}개 결과")
+
+
+if __name__ == "__main__":
+    main()
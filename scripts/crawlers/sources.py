@@ -0,0 +1,308 @@
+"""
+보도자료 소스 명세 레지스트리
+
+기관별 게시판 목록 페이지의 구조(테이블 영역, 행/제목/날짜 XPath, 게시물 ID 파라미터, 태그)를
+SourceSpec으로 선언하고, 이를 lxml XPath 기반 목록 파서로 한 번만 컴파일하여 사용합니다.
+상세 페이지는 명세의 본문/첨부파일 XPath로 추출하고, 맞는 요소가 없으면 텍스트 밀도로 본문을 추정합니다.
+새 기관을 추가할 때는 SOURCES에 명세 하나만 등록하면 됩니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urljoin, urlsplit
+
+from lxml import etree, html as lxml_html
+
+
+def has_class(name: str) -> str:
+    """CSS 클래스 선택자에 해당하는 XPath 조건식"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+@dataclass
+class SourceSpec:
+    """게시판 목록 페이지 명세"""
+    key: str
+    name: str
+    base_url: str
+    list_url: str
+    region_class: str  # 목록 테이블을 감싸는 요소의 class (이 영역만 파싱)
+    row_xpath: str
+    title_xpath: str  # 행 기준 제목 링크
+    date_xpath: str  # 행 기준 날짜 셀
+    notice_xpath: Optional[str] = None  # 행 기준 공지사항 표식
+    id_param: Optional[str] = None  # 상세 URL에서 게시물 ID를 담은 쿼리 파라미터
+    tags: Tuple[str, ...] = field(default_factory=tuple)
+    body_xpath: Optional[str] = None  # 상세 페이지 본문 영역 (문서 기준)
+    attachment_xpath: Optional[str] = None  # 상세 페이지 첨부파일 링크 (문서 기준)
+
+    @property
+    def host(self) -> str:
+        """동시 요청 제한에 사용하는 호스트 키"""
+        return self.base_url
+
+
+@dataclass
+class ListRow:
+    """목록 페이지에서 추출한 게시물 행"""
+    index: int
+    title: str
+    href: str
+    date_text: str
+    post_id: Optional[str]
+
+
+class ListPageParser:
+    """SourceSpec을 컴파일한 목록 페이지 파서"""
+
+    def __init__(self, spec: SourceSpec):
+        self.spec = spec
+        self._rows = etree.XPath(spec.row_xpath)
+        self._title = etree.XPath(spec.title_xpath)
+        self._date = etree.XPath(spec.date_xpath)
+        self._notice = etree.XPath(spec.notice_xpath) if spec.notice_xpath else None
+        self._id_pattern = re.compile(rf"{re.escape(spec.id_param)}=([^&#]+)") if spec.id_param else None
+        self._region_pattern = re.compile(
+            r'<\w+[^>]*\sclass="(?:[^"]*\s)?' + re.escape(spec.region_class) + r'(?:\s[^"]*)?"'
+        )
+
+    def extract_region(self, html: str) -> str:
+        """목록 테이블 영역만 잘라냄 (영역을 찾지 못하면 전체 문서)"""
+        match = self._region_pattern.search(html)
+        if not match:
+            return html
+        end = html.find('</table>', match.end())
+        if end < 0:
+            return html[match.start():]
+        return html[match.start():end + len('</table>')]
+
+    def parse(self, html: str) -> List[ListRow]:
+        """목록 페이지에서 게시물 행 추출 (공지사항 제외)"""
+        fragment = self.extract_region(html)
+        if not fragment.strip():
+            return []
+        root = lxml_html.fromstring(fragment)
+
+        rows = []
+        for idx, row in enumerate(self._rows(root)):
+            if self._notice is not None and self._notice(row):
+                continue
+
+            title_elements = self._title(row)
+            if not title_elements:
+                continue
+            title_element = title_elements[0]
+            title = title_element.text_content().strip()
+            href = title_element.get('href')
+            if not title or not href:
+                continue
+
+            date_cells = self._date(row)
+            if not date_cells:
+                continue
+
+            post_id = None
+            if self._id_pattern is not None:
+                match = self._id_pattern.search(href)
+                post_id = match.group(1) if match else None
+
+            rows.append(ListRow(
+                index=idx,
+                title=title,
+                href=href,
+                date_text=date_cells[0].text_content().strip(),
+                post_id=post_id
+            ))
+        return rows
+
+
+@dataclass
+class DetailPage:
+    """상세 페이지에서 추출한 본문과 첨부파일"""
+    body: str
+    attachments: List[Dict[str, str]] = field(default_factory=list)
+
+
+# 첨부파일로 보는 링크 (다운로드 경로 또는 문서 확장자)
+ATTACHMENT_PATTERN = re.compile(
+    r'(?:file_?down|download|atchFile|\.(?:pdf|hwpx?|docx?|xlsx?|pptx?|zip)(?:$|[?#&]))', re.IGNORECASE
+)
+
+# 본문 추출 전에 제거할 요소
+_NOISE_TAGS = ('script', 'style', 'noscript', 'nav', 'header', 'footer', 'form', 'iframe')
+
+# 줄바꿈으로 취급할 블록 요소
+_BLOCK_TAGS = {'p', 'div', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'table', 'section', 'article', 'dd', 'dt'}
+
+# 본문 후보로 세는 최소 텍스트 길이
+_MIN_BLOCK_TEXT = 25
+
+
+def _own_text(element) -> str:
+    """자식 요소를 제외한 요소 자신의 텍스트"""
+    parts = [element.text or '']
+    parts.extend(child.tail or '' for child in element)
+    return ''.join(parts).strip()
+
+
+def _main_block(root):
+    """텍스트가 가장 많이 모인 요소 (문단 텍스트 길이를 부모에 그대로, 조부모에 절반 누적)"""
+    scores: Dict = {}
+    for element in root.iter():
+        if not isinstance(element.tag, str) or element.tag == 'a':
+            continue
+        length = len(_own_text(element))
+        if length < _MIN_BLOCK_TEXT:
+            continue
+        scores[element] = scores.get(element, 0) + length
+        parent = element.getparent()
+        if parent is not None:
+            scores[parent] = scores.get(parent, 0) + length
+            grandparent = parent.getparent()
+            if grandparent is not None:
+                scores[grandparent] = scores.get(grandparent, 0) + length / 2
+    return max(scores, key=scores.get) if scores else root
+
+
+def _block_text(element) -> str:
+    """블록 요소와 <br>을 줄바꿈으로 바꾼 정리된 텍스트"""
+    for node in element.iter():
+        if node.tag == 'br' or node.tag in _BLOCK_TAGS:
+            node.tail = '\n' + (node.tail or '')
+    lines = (re.sub(r'[ \t\r\xa0\u3000]+', ' ', line).strip() for line in element.text_content().split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class DetailPageParser:
+    """SourceSpec의 상세 페이지 XPath를 컴파일한 파서"""
+
+    def __init__(self, spec: SourceSpec):
+        self.spec = spec
+        self._body = etree.XPath(spec.body_xpath) if spec.body_xpath else None
+        self._attachments = etree.XPath(spec.attachment_xpath) if spec.attachment_xpath else None
+
+    def _attachment_links(self, root) -> List:
+        links = self._attachments(root) if self._attachments is not None else []
+        if links:
+            return links
+        return [a for a in root.iter('a')
+                if ATTACHMENT_PATTERN.search(a.get('href') or '') or ATTACHMENT_PATTERN.search(a.text_content())]
+
+    def parse(self, html: str, url: str) -> DetailPage:
+        """상세 페이지에서 본문 텍스트와 첨부파일 목록 추출"""
+        if not html.strip():
+            return DetailPage(body='')
+        root = lxml_html.fromstring(html)
+        etree.strip_elements(root, *_NOISE_TAGS, with_tail=False)
+
+        attachments, seen = [], set()
+        for link in self._attachment_links(root):
+            href = (link.get('href') or '').strip()
+            if not href or href.startswith(('javascript:', '#', 'mailto:')):
+                continue
+            file_url = urljoin(url, href)
+            if file_url in seen:
+                continue
+            seen.add(file_url)
+            name = link.text_content().strip() or unquote(urlsplit(file_url).path.rsplit('/', 1)[-1])
+            attachments.append({'name': name, 'url': file_url})
+
+        bodies = self._body(root) if self._body is not None else []
+        body = _block_text(bodies[0]) if bodies else _block_text(_main_block(root))
+        return DetailPage(body=body, attachments=attachments)
+
+
+# 기관별 보도자료 게시판 명세
+SOURCES: Dict[str, SourceSpec] = {}
+_parsers: Dict[str, ListPageParser] = {}
+_detail_parsers: Dict[str, DetailPageParser] = {}
+
+
+def register_source(spec: SourceSpec):
+    """소스 명세 등록 (같은 키가 있으면 교체)"""
+    SOURCES[spec.key] = spec
+    _parsers.pop(spec.key, None)
+    _detail_parsers.pop(spec.key, None)
+
+
+def get_parser(key: str) -> ListPageParser:
+    """소스 키에 해당하는 컴파일된 파서 반환"""
+    parser = _parsers.get(key)
+    if parser is None or parser.spec is not SOURCES[key]:
+        parser = ListPageParser(SOURCES[key])
+        _parsers[key] = parser
+    return parser
+
+
+def get_detail_parser(key: str) -> DetailPageParser:
+    """소스 키에 해당하는 컴파일된 상세 페이지 파서 반환"""
+    parser = _detail_parsers.get(key)
+    if parser is None or parser.spec is not SOURCES[key]:
+        parser = DetailPageParser(SOURCES[key])
+        _detail_parsers[key] = parser
+    return parser
+
+
+register_source(SourceSpec(
+    key='fsc',
+    name='금융위원회',
+    base_url='https://www.fsc.go.kr',
+    list_url='https://www.fsc.go.kr/no010101?curPage={page}',
+    region_class='boardList',
+    row_xpath=f"descendant-or-self::*[{has_class('boardList')}]//tbody/tr",
+    title_xpath=f".//*[{has_class('title')}]//a",
+    date_xpath=f"(./td[{has_class('date')}] | ./td[5])",
+    notice_xpath=f".//*[{has_class('important')} or {has_class('notice')}]",
+    tags=('금융위원회', '보도자료'),
+    body_xpath=f"//*[{has_class('board-view-wrap')}]//*[{has_class('cont')}]",
+    attachment_xpath=f"//*[{has_class('file-list')}]//a"
+))
+
+register_source(SourceSpec(
+    key='fss',
+    name='금융감독원',
+    base_url='https://www.fss.or.kr',
+    list_url='https://www.fss.or.kr/fss/bbs/B0000188/list.do?menuNo=200218&bbsId=B0000188&pageIndex={page}',
+    region_class='boardList',
+    row_xpath=f"descendant-or-self::*[{has_class('boardList')}]//tbody/tr",
+    title_xpath=f".//*[{has_class('title')}]//a",
+    date_xpath="./td[5]",
+    notice_xpath=f".//*[{has_class('noticeTag')}]",
+    id_param='nttId',
+    tags=('금융감독원', '보도자료'),
+    body_xpath=f"//*[{has_class('bd-view')}]//*[{has_class('dbdata')}]",
+    attachment_xpath=f"//*[{has_class('bd-view')}]//*[{has_class('file-list')}]//a"
+))
+
+register_source(SourceSpec(
+    key='bok',
+    name='한국은행',
+    base_url='https://www.bok.or.kr',
+    list_url='https://www.bok.or.kr/portal/bbs/B0000338/list.do?menuNo=200761&pageIndex={page}',
+    region_class='bbs-list',
+    row_xpath=f"descendant-or-self::*[{has_class('bbs-list')}]//table//tbody/tr",
+    title_xpath=f".//*[{has_class('bbs-subj')}]//a",
+    date_xpath=f".//*[{has_class('bbs-date')}]",
+    notice_xpath=f".//*[{has_class('noti')}]",
+    id_param='nttId',
+    tags=('한국은행', '보도자료'),
+    body_xpath=f"//*[{has_class('bbs-view')}]//*[{has_class('dbdata')}]",
+    attachment_xpath=f"//*[{has_class('bbs-view')}]//*[{has_class('addfile')}]//a"
+))
+
+register_source(SourceSpec(
+    key='msit',
+    name='과학기술정보통신부',
+    base_url='https://www.msit.go.kr',
+    list_url='https://www.msit.go.kr/bbs/list.do?sCode=user&mId=129&mPid=112&bbsSeqNo=94&pageIndex={page}',
+    region_class='pblancList',
+    row_xpath=f"descendant-or-self::*[{has_class('pblancList')}]//table//tbody/tr",
+    title_xpath=f".//*[{has_class('subj')}]//a",
+    date_xpath=f".//*[{has_class('date')}]",
+    notice_xpath=f".//*[{has_class('noti')} or {has_class('notice')}]",
+    id_param='nttSeqNo',
+    tags=('과학기술정보통신부', '보도자료', 'ICT'),
+    body_xpath=f"//*[{has_class('view_cont')}]",
+    attachment_xpath=f"//*[{has_class('down_file')}]//a"
+))
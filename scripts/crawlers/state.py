@@ -0,0 +1,94 @@
+"""
+증분 크롤링 상태 저장소
+
+기관(소스)별로 가장 최근에 본 게시물 날짜와 URL 목록(high-water mark)을 저장하여
+다음 실행에서 이미 수집한 게시물에 도달하면 페이지 탐색을 멈출 수 있게 합니다.
+"""
+
+import os
+import sys
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Set
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import CRAWL_STATE_FILE
+
+logger = logging.getLogger('state')
+
+# 소스별로 기억할 최근 게시물 URL 수
+MAX_SEEN_URLS = 500
+
+# 같은 프로세스에서 여러 상태 객체가 동시에 저장할 때 사용하는 잠금
+_save_lock = threading.Lock()
+
+
+class CrawlState:
+    """소스별 high-water mark 저장소"""
+
+    def __init__(self, path: Path = CRAWL_STATE_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Any]] = self._load()
+        self._updated: Set[str] = set()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """상태 파일 로드 (없거나 손상되었으면 빈 상태)"""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"크롤링 상태 로드 실패: {str(e)}")
+            return {}
+
+    def has_state(self, source: str) -> bool:
+        """해당 소스를 이전에 수집한 적이 있는지 여부"""
+        return source in self._data
+
+    def is_known(self, source: str, item) -> bool:
+        """이미 수집한 게시물인지 확인 (URL 또는 high-water 날짜 기준)"""
+        entry = self._data.get(source)
+        if not entry:
+            return False
+        if item.url in entry.get('seen_urls', ()):
+            return True
+        last_date = entry.get('last_date')
+        return bool(last_date) and item.date[:10] < last_date[:10]
+
+    def update(self, source: str, items: Iterable):
+        """새로 본 게시물로 high-water mark 갱신"""
+        items = list(items)
+        with self._lock:
+            entry = self._data.setdefault(source, {'last_date': None, 'seen_urls': []})
+            seen = entry['seen_urls']
+            seen_set = set(seen)
+            for item in sorted(items, key=lambda x: x.date):
+                if item.url not in seen_set:
+                    seen.append(item.url)
+                    seen_set.add(item.url)
+                if not entry['last_date'] or item.date > entry['last_date']:
+                    entry['last_date'] = item.date
+            entry['seen_urls'] = seen[-MAX_SEEN_URLS:]
+            entry['updated_at'] = datetime.now().isoformat()
+            self._updated.add(source)
+
+    def save(self):
+        """상태 파일 저장 (임시 파일 작성 후 교체)
+        
+        기관별 작업이 각자 상태를 저장할 수 있으므로, 파일의 최신 내용에 이 객체가 갱신한 소스만 덮어씁니다.
+        """
+        with _save_lock, self._lock:
+            data = self._load()
+            data.update({source: self._data[source] for source in self._updated})
+            os.makedirs(self.path.parent, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            self._data.update(data)
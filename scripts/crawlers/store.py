@@ -0,0 +1,362 @@
+"""
+SQLite 아이템 저장소
+
+보도자료와 뉴스 아이템을 URL 기준으로 중복 없이 저장합니다.
+실행마다 배치 upsert로 최초/최종 수집 시각을 갱신하고,
+latest_*.json은 저장소에서 조회한(materialized) 결과로 게시합니다.
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import ITEM_DB_PATH, get_start_date
+
+logger = logging.getLogger('store')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    url TEXT PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    source TEXT NOT NULL,
+    date TEXT NOT NULL,
+    title TEXT NOT NULL,
+    data TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_type_date ON items (type, date DESC);
+CREATE INDEX IF NOT EXISTS idx_items_source_date ON items (source, date DESC);
+CREATE INDEX IF NOT EXISTS idx_items_last_seen ON items (last_seen);
+
+CREATE TABLE IF NOT EXISTS item_tags (
+    url TEXT NOT NULL REFERENCES items (url) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (url, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_item_tags_tag ON item_tags (tag);
+
+CREATE TABLE IF NOT EXISTS attachments (
+    item_url TEXT NOT NULL,
+    url TEXT NOT NULL,
+    name TEXT,
+    kind TEXT,
+    sha256 TEXT,
+    size INTEGER,
+    path TEXT,
+    text_path TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (item_url, url)
+);
+CREATE INDEX IF NOT EXISTS idx_attachments_url ON attachments (url);
+CREATE INDEX IF NOT EXISTS idx_attachments_sha256 ON attachments (sha256);
+
+CREATE TABLE IF NOT EXISTS summaries (
+    input_hash TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    model TEXT,
+    created_at TEXT NOT NULL
+);
+"""
+
+# 첨부파일 레코드 컬럼
+ATTACHMENT_COLUMNS = ('item_url', 'url', 'name', 'kind', 'sha256', 'size', 'path', 'text_path', 'status', 'error')
+
+# 변경 여부 판단에 사용하는 내용 필드 (수집 시각마다 달라지는 date 등은 제외)
+CONTENT_FIELDS = ('title', 'summary', 'url', 'tags', 'publisher', 'organization', 'imageUrl')
+
+
+def content_hash(data: Dict[str, Any]) -> str:
+    """아이템 내용 해시"""
+    payload = json.dumps([data.get(name) for name in CONTENT_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class UpsertResult:
+    """배치 upsert 결과 (새 아이템/내용이 바뀐 아이템의 데이터)"""
+    new: List[Dict[str, Any]] = field(default_factory=list)
+    changed: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: int = 0
+
+
+class ItemStore:
+    """URL 기준 아이템 저장소"""
+
+    def __init__(self, path: Path = ITEM_DB_PATH):
+        self.path = Path(path)
+        os.makedirs(self.path.parent, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self._migrate_attachments()
+        self.conn.executescript(SCHEMA)
+
+    def _migrate_attachments(self):
+        """예전 첨부파일 테이블(아이템 ID로 연결)을 아이템 URL로 연결하는 테이블로 변환
+
+        아이템 ID는 수집할 때마다 새로 만들어지고 저장소에서 충돌 시 바뀌므로 URL로 연결합니다.
+        """
+        columns = [row['name'] for row in self.conn.execute("PRAGMA table_info(attachments)")]
+        if 'item_id' not in columns:
+            return
+        self.conn.executescript("""
+            DROP INDEX IF EXISTS idx_attachments_url;
+            DROP INDEX IF EXISTS idx_attachments_sha256;
+            ALTER TABLE attachments RENAME TO attachments_by_id;
+        """)
+        self.conn.executescript(SCHEMA)
+        fields = ', '.join(f"a.{name}" for name in ATTACHMENT_COLUMNS[1:])
+        with self.conn:
+            migrated = self.conn.execute(
+                f"INSERT OR IGNORE INTO attachments ({', '.join(ATTACHMENT_COLUMNS)}, updated_at) "
+                f"SELECT items.url, {fields}, a.updated_at FROM attachments_by_id a JOIN items ON items.id = a.item_id"
+            ).rowcount
+            self.conn.execute("DROP TABLE attachments_by_id")
+        logger.info(f"첨부파일 레코드 {migrated}개를 아이템 URL 기준으로 변환했습니다.")
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def _unique_id(self, item_id: str, url: str, taken: set) -> str:
+        """다른 URL이 이미 같은 ID를 사용 중이면 URL 해시를 덧붙인 ID 반환"""
+        if item_id not in taken:
+            row = self.conn.execute("SELECT url FROM items WHERE id = ?", (item_id,)).fetchone()
+            if row is None or row['url'] == url:
+                return item_id
+        return f"{item_id}-{hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]}"
+
+    def _fetch_existing(self, urls: List[str]) -> Dict[str, sqlite3.Row]:
+        """URL 목록에 해당하는 기존 행 조회"""
+        existing = {}
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT url, id, date, content_hash FROM items WHERE url IN ({placeholders})", chunk
+            ):
+                existing[row['url']] = row
+        return existing
+
+    def upsert_items(self, items: Iterable) -> UpsertResult:
+        """아이템 배치 upsert (URL 기준, 기존 아이템은 최초 ID와 날짜 유지)"""
+        result = UpsertResult()
+        now = datetime.now().isoformat()
+
+        # 같은 배치 안의 중복 URL은 마지막 아이템만 사용
+        batch: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            data = item.to_dict() if hasattr(item, 'to_dict') else dict(item)
+            batch[data['url']] = data
+
+        with self._lock, self.conn:
+            existing = self._fetch_existing(list(batch))
+            inserts, updates, touches, tags = [], [], [], []
+            taken_ids = set()
+
+            for url, data in batch.items():
+                digest = content_hash(data)
+                row = existing.get(url)
+
+                if row is None:
+                    data['id'] = self._unique_id(data['id'], url, taken_ids)
+                    taken_ids.add(data['id'])
+                    inserts.append((url, data['id'], data['type'], data['source'], data['date'],
+                                    data['title'], json.dumps(data, ensure_ascii=False), digest,
+                                    now, now, now))
+                    result.new.append(data)
+                elif row['content_hash'] != digest:
+                    # 최초 수집 시 ID와 날짜 유지 (상대 시간 표기는 실행마다 정밀도가 달라짐)
+                    data['id'] = row['id']
+                    data['date'] = row['date']
+                    updates.append((data['title'], json.dumps(data, ensure_ascii=False), digest,
+                                    now, now, url))
+                    result.changed.append(data)
+                else:
+                    touches.append((now, url))
+                    result.unchanged += 1
+                    continue
+
+                tags.extend((url, tag) for tag in data.get('tags') or [])
+
+            self.conn.executemany(
+                "INSERT INTO items (url, id, type, source, date, title, data, content_hash, "
+                "first_seen, last_seen, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                inserts
+            )
+            self.conn.executemany(
+                "UPDATE items SET title = ?, data = ?, content_hash = ?, last_seen = ?, "
+                "updated_at = ? WHERE url = ?",
+                updates
+            )
+            self.conn.executemany("UPDATE items SET last_seen = ? WHERE url = ?", touches)
+            self.conn.executemany("DELETE FROM item_tags WHERE url = ?", [(u[-1],) for u in updates])
+            self.conn.executemany("INSERT OR IGNORE INTO item_tags (url, tag) VALUES (?, ?)", tags)
+
+        logger.info(f"아이템 저장 완료: 신규 {len(result.new)}개, 변경 {len(result.changed)}개, "
+                    f"변경 없음 {result.unchanged}개")
+        return result
+
+    def query(self, item_type: Optional[str] = None, source: Optional[str] = None,
+              tag: Optional[str] = None, since: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """조건에 맞는 아이템을 날짜 내림차순으로 조회"""
+        sql = "SELECT items.data FROM items"
+        conditions, params = [], []
+        if tag:
+            sql += " JOIN item_tags ON item_tags.url = items.url"
+            conditions.append("item_tags.tag = ?")
+            params.append(tag)
+        if item_type:
+            conditions.append("items.type = ?")
+            params.append(item_type)
+        if source:
+            conditions.append("items.source = ?")
+            params.append(source)
+        if since:
+            conditions.append("items.date >= ?")
+            params.append(since)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY items.date DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def first_seen_times(self, item_type: Optional[str] = None, source: Optional[str] = None,
+                         since: Optional[str] = None) -> List[str]:
+        """조건에 맞는 아이템의 최초 수집 시각 목록 (게시 빈도 추정용)"""
+        sql = "SELECT first_seen FROM items"
+        conditions, params = [], []
+        if item_type:
+            conditions.append("type = ?")
+            params.append(item_type)
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        if since:
+            conditions.append("first_seen >= ?")
+            params.append(since)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [row['first_seen'] for row in rows]
+
+    def get_items(self, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """URL 목록에 해당하는 저장된 아이템 데이터 (없는 URL은 제외)"""
+        urls = list(urls)
+        found = {}
+        with self._lock:
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for row in self.conn.execute(
+                    f"SELECT url, data FROM items WHERE url IN ({placeholders})", chunk
+                ):
+                    found[row['url']] = json.loads(row['data'])
+        return found
+
+    def save_attachment(self, record: Dict[str, Any]):
+        """첨부파일 레코드 저장 (아이템 URL과 첨부파일 URL 기준으로 교체)"""
+        values = [record.get(name) for name in ATTACHMENT_COLUMNS] + [datetime.now().isoformat()]
+        with self._lock, self.conn:
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO attachments ({', '.join(ATTACHMENT_COLUMNS)}, updated_at) "
+                f"VALUES ({', '.join('?' * (len(ATTACHMENT_COLUMNS) + 1))})",
+                values
+            )
+
+    def get_attachment(self, item_url: str, url: str) -> Optional[Dict[str, Any]]:
+        """아이템의 첨부파일 레코드 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM attachments WHERE item_url = ? AND url = ?", (item_url, url)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def find_attachment(self, url: Optional[str] = None, sha256: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """URL 또는 해시가 같은 받아 둔 첨부파일 레코드 (텍스트 추출된 것 우선)"""
+        column, value = ('url', url) if url else ('sha256', sha256)
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT * FROM attachments WHERE {column} = ? AND sha256 IS NOT NULL "
+                "ORDER BY text_path IS NULL, updated_at DESC LIMIT 1", (value,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def item_attachments(self, item_url: str) -> List[Dict[str, Any]]:
+        """아이템의 첨부파일 레코드 목록"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM attachments WHERE item_url = ? ORDER BY rowid", (item_url,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_summaries(self, input_hashes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """입력 해시별로 저장된 요약 결과 (summary, tags)"""
+        input_hashes = list(input_hashes)
+        found = {}
+        with self._lock:
+            for start in range(0, len(input_hashes), 500):
+                chunk = input_hashes[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for row in self.conn.execute(
+                    f"SELECT input_hash, summary, tags FROM summaries WHERE input_hash IN ({placeholders})", chunk
+                ):
+                    found[row['input_hash']] = {'summary': row['summary'], 'tags': json.loads(row['tags'])}
+        return found
+
+    def save_summaries(self, results: Dict[str, Dict[str, Any]], model: Optional[str] = None):
+        """입력 해시별 요약 결과 저장"""
+        now = datetime.now().isoformat()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO summaries (input_hash, summary, tags, model, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(input_hash, result['summary'], json.dumps(result.get('tags') or [], ensure_ascii=False), model, now)
+                 for input_hash, result in results.items()]
+            )
+
+    def latest_items(self, item_type: str) -> List[Dict[str, Any]]:
+        """latest_*.json으로 게시할 검색 기간 내 아이템"""
+        return self.query(item_type=item_type, since=get_start_date().isoformat())
+
+
+# 모듈 공용 저장소 (최초 사용 시 생성)
+_store: Optional[ItemStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ItemStore:
+    """공용 아이템 저장소 반환"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ItemStore()
+    return _store
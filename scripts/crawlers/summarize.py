@@ -0,0 +1,255 @@
+"""
+요약·태그 생성 단계
+
+수집한 아이템의 제목과 본문(보도자료는 상세 페이지 본문, 뉴스는 검색 요약)을 크기 제한이 있는 배치로 묶어
+OpenAI 호환 Chat Completions 엔드포인트에 한 번에 요청하고, 결과 summary/tags를 아이템에 반영합니다.
+결과는 입력 해시(모델·프롬프트 버전·제목·본문)별로 저장소에 캐시하므로 같은 글은 다시 요청하지 않습니다.
+엔드포인트는 SummaryBackend를 구현하여 바꿀 수 있으며, 주소만 바꾸면 로컬 호환 서버로도 테스트할 수 있습니다.
+"""
+
+import os
+import sys
+import re
+import json
+import time
+import hashlib
+import logging
+import argparse
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+from urllib.parse import urlsplit
+
+import requests
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import (
+    SUMMARY_API_BASE, SUMMARY_API_KEY, SUMMARY_MODEL, SUMMARY_TIMEOUT, SUMMARY_BATCH_ITEMS, SUMMARY_BATCH_CHARS,
+    SUMMARY_ITEM_CHARS, SUMMARY_MAX_WORKERS, SUMMARY_MAX_CHARS, SUMMARY_MAX_TAGS, CONNECT_TIMEOUT
+)
+from crawlers.models import NewsItem, SourceItem
+from crawlers.store import ItemStore, get_store
+from crawlers.resilience import call_with_retry
+from crawlers.pipeline import StoreSink, run_pipeline
+from crawlers.publish import republish
+from crawlers.metrics import SUMMARY_ITEMS, SUMMARY_REQUESTS, SUMMARY_SECONDS
+
+logger = logging.getLogger('summarize')
+
+# 프롬프트나 응답 형식을 바꾸면 올려서 기존 캐시를 무효화
+PROMPT_VERSION = 1
+
+SYSTEM_PROMPT = f"""당신은 금융 뉴스와 정부 보도자료 요약 전문가입니다.
+입력은 {{"id", "title", "text"}} 객체의 JSON 배열입니다. 각 항목마다:
+1. summary: 핵심만 {SUMMARY_MAX_CHARS}자 이내로 요약합니다. 중요한 숫자, 날짜, 기관명은 반드시 포함합니다.
+2. tags: 금융·경제·정책 핵심 용어, 기관명, 상품명, 정책명을 1~3단어 명사형 태그로 최대 {SUMMARY_MAX_TAGS}개 뽑습니다.
+응답은 {{"results": [{{"id": "...", "summary": "...", "tags": ["..."]}}]}} 형식의 JSON 객체만 작성하고,
+모든 입력 항목의 id를 빠짐없이 그대로 사용하세요."""
+
+
+class SummaryBackend:
+    """요약 엔드포인트 (배치 하나를 받아 id별 결과 반환)"""
+
+    model: str = ''
+
+    def summarize_batch(self, batch: List[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """[{id, title, text}] → {id: {summary, tags}} (결과가 빠진 id는 다음 실행에서 다시 요청)"""
+        raise NotImplementedError
+
+
+class ChatCompletionsBackend(SummaryBackend):
+    """OpenAI 호환 /chat/completions 엔드포인트 (배치 하나를 JSON 응답 요청 하나로 처리)"""
+
+    def __init__(self, base_url: str = SUMMARY_API_BASE or 'https://api.openai.com/v1',
+                 api_key: str = SUMMARY_API_KEY, model: str = SUMMARY_MODEL, timeout: float = SUMMARY_TIMEOUT):
+        self.url = base_url.rstrip('/') + '/chat/completions'
+        self.host = urlsplit(self.url).netloc
+        self.model = model
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers['Content-Type'] = 'application/json'
+        if api_key:
+            self.session.headers['Authorization'] = f'Bearer {api_key}'
+
+    def _post(self, payload: Dict[str, Any]) -> requests.Response:
+        return self.session.post(self.url, data=json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+                                 timeout=(CONNECT_TIMEOUT, self.timeout))
+
+    def summarize_batch(self, batch: List[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
+        payload = {
+            'model': self.model,
+            'messages': [
+                {'role': 'system', 'content': SYSTEM_PROMPT},
+                {'role': 'user', 'content': json.dumps(batch, ensure_ascii=False)},
+            ],
+            'temperature': 0.2,
+            'response_format': {'type': 'json_object'},
+        }
+        response = call_with_retry(self.host, lambda: self._post(payload))
+        response.raise_for_status()
+        content = response.json()['choices'][0]['message']['content'] or ''
+        # 코드 블록으로 감싸 응답하는 모델도 있음
+        content = re.sub(r'^\s*```(?:json)?\s*|\s*```\s*$', '', content)
+        return {
+            str(result['id']): result
+            for result in json.loads(content).get('results') or []
+            if isinstance(result, dict) and result.get('id') is not None and result.get('summary')
+        }
+
+
+def get_backend() -> Optional[SummaryBackend]:
+    """설정된 요약 엔드포인트 (API 키와 주소가 모두 없으면 None)"""
+    if not SUMMARY_API_BASE and not SUMMARY_API_KEY:
+        return None
+    return ChatCompletionsBackend()
+
+
+def summary_input(item) -> Dict[str, str]:
+    """요약에 보낼 제목과 본문 (본문이 없으면 기존 요약 사용, SUMMARY_ITEM_CHARS자까지)"""
+    text = getattr(item, 'body', None) or item.summary or ''
+    return {'title': item.title, 'text': re.sub(r'\s+', ' ', text).strip()[:SUMMARY_ITEM_CHARS]}
+
+
+def input_hash(model: str, data: Dict[str, str]) -> str:
+    """요약 캐시 키 (모델, 프롬프트 버전, 제목, 본문)"""
+    payload = json.dumps([PROMPT_VERSION, model, data['title'], data['text']], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def apply_summary(item, result: Dict[str, Any]):
+    """요약 결과 반영 (태그는 기존 태그 뒤에 중복 없이 추가)"""
+    item.summary = str(result['summary']).strip()[:SUMMARY_MAX_CHARS * 2]
+    tags = [str(tag).strip() for tag in result.get('tags') or [] if str(tag).strip()]
+    item.tags = list(dict.fromkeys(list(item.tags) + tags[:SUMMARY_MAX_TAGS]))
+    return item
+
+
+class _Batch:
+    """한 번에 요청할 아이템 묶음"""
+
+    def __init__(self):
+        self.entries: List[tuple] = []  # (아이템, 입력 해시, 요청 데이터)
+        self.chars = 0
+
+    def fits(self, data: Dict[str, str]) -> bool:
+        size = len(data['title']) + len(data['text'])
+        return not self.entries or (len(self.entries) < SUMMARY_BATCH_ITEMS and self.chars + size <= SUMMARY_BATCH_CHARS)
+
+    def add(self, item, digest: str, data: Dict[str, str]):
+        self.entries.append((item, digest, data))
+        self.chars += len(data['title']) + len(data['text'])
+
+
+def summarize_items(items: Iterable, backend: Optional[SummaryBackend] = None, store: Optional[ItemStore] = None,
+                    max_workers: int = SUMMARY_MAX_WORKERS) -> Iterator:
+    """아이템마다 요약·태그를 채워 yield (캐시에 있으면 바로, 없으면 배치 요청이 끝나는 대로)
+
+    엔드포인트가 설정되지 않았으면 아이템을 그대로 내보내고, 요청이 실패한 배치의 아이템도 그대로 내보냅니다.
+    """
+    backend = backend or get_backend()
+    if backend is None:
+        yield from items
+        return
+
+    store = store or get_store()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='summary')
+    pending: Dict[Future, _Batch] = {}
+    batch = _Batch()
+
+    def request(batch: _Batch) -> Dict[str, Dict[str, Any]]:
+        start = time.perf_counter()
+        try:
+            results = backend.summarize_batch([
+                {'id': str(index), **data} for index, (_, _, data) in enumerate(batch.entries)
+            ])
+        except Exception:
+            SUMMARY_REQUESTS.inc(result='error')
+            raise
+        SUMMARY_REQUESTS.inc(result='success')
+        SUMMARY_SECONDS.observe(time.perf_counter() - start)
+        return results
+
+    def submit(batch: _Batch) -> Iterator:
+        pending[executor.submit(request, batch)] = batch
+        if len(pending) >= max_workers * 2:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from finish(done)
+
+    def finish(done: Set[Future]) -> Iterator:
+        for future in done:
+            finished = pending.pop(future)
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"요약 요청 오류 ({len(finished.entries)}개 항목): {str(e)}")
+                traceback.print_exc()
+                results = {}
+
+            cached = {}
+            for index, (item, digest, _) in enumerate(finished.entries):
+                result = results.get(str(index))
+                if result is None:
+                    SUMMARY_ITEMS.inc(result='failed')
+                    yield item
+                    continue
+                apply_summary(item, result)
+                # 본문 없이 요약만 저장되는 뉴스를 다시 처리할 때 요약을 또 요약하지 않도록 결과 자체도 캐시
+                cached[digest] = cached[input_hash(backend.model, summary_input(item))] = result
+                SUMMARY_ITEMS.inc(result='summarized')
+                yield item
+            if cached:
+                store.save_summaries(cached, backend.model)
+
+    try:
+        for item in items:
+            data = summary_input(item)
+            if not data['text']:
+                yield item
+                continue
+            digest = input_hash(backend.model, data)
+            result = store.get_summaries([digest]).get(digest)
+            if result is not None:
+                SUMMARY_ITEMS.inc(result='cached')
+                yield apply_summary(item, result)
+                continue
+
+            if not batch.fits(data):
+                yield from submit(batch)
+                batch = _Batch()
+            batch.add(item, digest, data)
+
+        if batch.entries:
+            yield from submit(batch)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from finish(done)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv: Optional[List[str]] = None):
+    """저장된 아이템 요약 CLI (캐시에 없는 글만 요청)"""
+    parser = argparse.ArgumentParser(description='저장된 아이템의 요약·태그 다시 생성')
+    parser.add_argument('--type', choices=['source', 'news'], default='source', help='아이템 유형')
+    parser.add_argument('--since', help='이 날짜 이후 아이템만 (YYYY-MM-DD)')
+    parser.add_argument('--limit', type=int, help='최대 아이템 수')
+    args = parser.parse_args(argv)
+
+    backend = get_backend()
+    if backend is None:
+        print("요약 엔드포인트가 설정되지 않았습니다 (OPENAI_API_KEY 또는 SCOPE_SUMMARY_API_BASE).")
+        return
+
+    store = get_store()
+    model = SourceItem if args.type == 'source' else NewsItem
+    items = (model.from_dict(data) for data in store.query(item_type=args.type, since=args.since, limit=args.limit))
+    sink = StoreSink(store)
+    count = run_pipeline(summarize_items(items, backend, store), [sink])
+    # 바뀐 요약·태그를 검색 색인과 최신 파일에도 반영 (다음 정기 수집까지 기다리지 않음)
+    republish(store, sink.result.new + sink.result.changed)
+    print(f"요약 처리 완료: {count}개 항목 (변경 {len(sink.result.changed)}개)")
+
+
+if __name__ == "__main__":
+    main()
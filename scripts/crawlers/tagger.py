@@ -0,0 +1,245 @@
+"""
+분류 사전 기반 태그 추출
+
+NEWS_KEYWORDS와 TAXONOMY(대표 태그와 동의어)를 Aho-Corasick 오토마톤 하나로 컴파일하여
+아이템의 제목·요약·본문을 한 번만 훑으면서 모든 용어를 찾습니다.
+찾은 용어는 대표 태그로 묶고, 제목에서 찾은 태그를 요약·본문에서 찾은 태그보다 앞에 둡니다.
+분류 사전을 바꾼 뒤에는 --retag로 저장된 전체 이력의 태그를 다시 계산할 수 있습니다.
+바뀐 아이템은 스케줄러와 같은 게시 잠금을 거쳐 다시 게시하므로 스케줄러가 도는 중에 실행해도 됩니다.
+"""
+
+import os
+import sys
+import re
+import time
+import logging
+import argparse
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import NEWS_KEYWORDS, TAXONOMY, TAG_MAX_PER_ITEM
+
+logger = logging.getLogger('tagger')
+
+# 필드별 가중치 (제목, 요약, 본문)
+FIELD_WEIGHTS = (3, 2, 1)
+
+# 단어 경계로 보지 않는 문자 (한글, 영문, 숫자)
+_WORD_CHAR = re.compile(r'[0-9A-Za-z가-힣]')
+_ASCII_WORD_CHAR = re.compile(r'[0-9A-Za-z]')
+_WORD_RUN = re.compile(r'[0-9a-z가-힣]*')
+
+# 한글 용어 바로 뒤에 붙어도 같은 단어로 보는 조사 (그 밖의 글자가 이어지면 더 긴 단어의 일부로 보고 제외)
+PARTICLES = frozenset('''
+    은 는 이 가 을 를 의 와 과 도 만 에 로 으로 에서 에게 께 까지 부터 보다 처럼 마저 조차 이나 나 랑 이랑
+    에는 에도 에서도 에서는 으로는 로는 으로도 로도 과의 와의 과는 와는 까지는 만의 이며 며 이고 고 이다 다
+    이라는 라는 이란 란 측 발 등 들 들이 들은 들의 들을 들도
+'''.split())
+
+
+class AhoCorasick:
+    """여러 패턴을 텍스트 한 번 순회로 모두 찾는 Aho-Corasick 오토마톤 (문자 단위)"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        for pattern in patterns:
+            self._add(pattern)
+        self._build()
+
+    def _add(self, pattern: str):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        self._out[state] += (len(self.patterns),)
+        self.patterns.append(pattern)
+
+    def _build(self):
+        """너비 우선으로 실패 링크를 만들고 실패 상태의 출력을 합침"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def iter(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(끝 위치(미포함), 패턴 번호)를 텍스트 순서대로 yield"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text):
+            next_state = goto[state].get(char)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state or 0
+            if out[state]:
+                for pattern in out[state]:
+                    yield index + 1, pattern
+
+
+def _variants(term: str) -> List[str]:
+    """사전 용어의 검색 표기 (소문자, 공백이 있으면 붙여 쓴 표기 추가)"""
+    term = term.strip().lower()
+    compact = re.sub(r'\s+', '', term)
+    return [term] if compact == term else [term, compact]
+
+
+class Tagger:
+    """분류 사전을 컴파일한 태그 추출기"""
+
+    def __init__(self, taxonomy: Dict[str, Sequence[str]]):
+        surfaces: Dict[str, str] = {}
+        for tag, synonyms in taxonomy.items():
+            for term in (tag, *synonyms):
+                for variant in _variants(term):
+                    surfaces.setdefault(variant, tag)
+        self.tags = set(taxonomy)
+        self._automaton = AhoCorasick(surfaces)
+        self._tag_of = [surfaces[pattern] for pattern in self._automaton.patterns]
+
+    def scan(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(시작 위치, 대표 태그) yield (앞이 단어 중간이면 제외, 뒤는 단어가 끝나거나 한글 용어면 조사만 허용)"""
+        lowered = text.lower()
+        patterns = self._automaton.patterns
+        for end, index in self._automaton.iter(lowered):
+            pattern = patterns[index]
+            start = end - len(pattern)
+            if start > 0 and _WORD_CHAR.match(lowered, start - 1):
+                continue
+            if end < len(lowered) and not self._ends_word(pattern, lowered, end):
+                continue
+            yield start, self._tag_of[index]
+
+    @staticmethod
+    def _ends_word(pattern: str, text: str, end: int) -> bool:
+        """용어 뒤에서 단어가 끝나는지 (금융위기의 금융위, 한은행사의 한은처럼 더 긴 단어의 앞부분이면 False)"""
+        if _ASCII_WORD_CHAR.match(pattern, len(pattern) - 1):
+            return not _ASCII_WORD_CHAR.match(text, end)
+        suffix = _WORD_RUN.match(text, end).group()
+        return not suffix or suffix in PARTICLES
+
+    def tag_text(self, title: str, summary: str = '', body: str = '',
+                 limit: Optional[int] = TAG_MAX_PER_ITEM) -> List[str]:
+        """제목·요약·본문을 한 번에 훑어 찾은 태그 (제목 가중치가 높고, 같으면 먼저 나온 순)"""
+        text = '\n'.join((title or '', summary or '', body or ''))
+        title_end = len(title or '')
+        summary_end = title_end + 1 + len(summary or '')
+        scores: Dict[str, int] = {}
+        first: Dict[str, int] = {}
+        for start, tag in self.scan(text):
+            weight = FIELD_WEIGHTS[0] if start < title_end else FIELD_WEIGHTS[1] if start < summary_end else FIELD_WEIGHTS[2]
+            scores[tag] = scores.get(tag, 0) + weight
+            first.setdefault(tag, start)
+        ranked = sorted(scores, key=lambda tag: (-scores[tag], first[tag]))
+        return ranked[:limit] if limit else ranked
+
+    def tag_item(self, item, limit: Optional[int] = TAG_MAX_PER_ITEM) -> List[str]:
+        """아이템 제목·요약·본문에서 찾은 태그"""
+        return self.tag_text(item.title, item.summary, getattr(item, 'body', None) or '', limit)
+
+
+def default_taxonomy() -> Dict[str, List[str]]:
+    """NEWS_KEYWORDS와 TAXONOMY를 합친 분류 사전"""
+    taxonomy: Dict[str, List[str]] = {keyword: [] for keyword in NEWS_KEYWORDS}
+    for tag, synonyms in TAXONOMY.items():
+        taxonomy.setdefault(tag, []).extend(synonyms)
+    return taxonomy
+
+
+# 모듈 공용 태그 추출기 (최초 사용 시 컴파일)
+_tagger: Optional[Tagger] = None
+_tagger_lock = threading.Lock()
+
+
+def get_tagger() -> Tagger:
+    """공용 태그 추출기 반환"""
+    global _tagger
+    if _tagger is None:
+        with _tagger_lock:
+            if _tagger is None:
+                _tagger = Tagger(default_taxonomy())
+    return _tagger
+
+
+def tag_items(items: Iterable, tagger: Optional[Tagger] = None) -> Iterator:
+    """아이템마다 분류 사전 태그를 기존 태그 뒤에 중복 없이 추가"""
+    tagger = tagger or get_tagger()
+    for item in items:
+        item.tags = list(dict.fromkeys(list(item.tags) + tagger.tag_item(item)))
+        yield item
+
+
+@lru_cache(maxsize=None)
+def _source_tags() -> Dict[str, Tuple[str, ...]]:
+    """기관명별 수집 시 붙이는 태그 (SourceSpec.tags)"""
+    from crawlers.sources import SOURCES
+
+    return {spec.name: spec.tags for spec in SOURCES.values()}
+
+
+def retag(data: Dict, tagger: Tagger) -> Dict:
+    """저장된 아이템의 분류 사전 태그를 다시 계산 (기관 태그, 사전에 없는 요약 태그, 뉴스 검색 키워드는 유지)"""
+    keywords = (data.get('keywords') or []) if data.get('type') == 'news' else []
+    spec_tags = _source_tags().get(data.get('source'), ()) if data.get('type') != 'news' else ()
+    # 뉴스 키워드에서 온 태그는 검색 키워드만 남기고 새로 계산 (예전 제목 단어 태그 정리)
+    keep = keywords[:1] + [
+        tag for tag in data.get('tags') or []
+        if tag in spec_tags or (tag not in tagger.tags and tag not in keywords)
+    ]
+    matched = tagger.tag_text(data.get('title') or '', data.get('summary') or '', data.get('body') or '')
+    data = {**data, 'tags': list(dict.fromkeys(keep + matched))}
+    if keywords:
+        data['keywords'] = list(dict.fromkeys(keywords[:1] + matched))[:TAG_MAX_PER_ITEM]
+    return data
+
+
+def main(argv: Optional[List[str]] = None):
+    """태그 추출 CLI (텍스트 태그 확인 또는 저장된 전체 아이템 태그 재계산)"""
+    parser = argparse.ArgumentParser(description='분류 사전 기반 태그 추출')
+    parser.add_argument('text', nargs='?', help='태그를 확인할 텍스트')
+    parser.add_argument('--retag', action='store_true', help='저장된 아이템 태그 다시 계산')
+    parser.add_argument('--type', choices=['source', 'news'], help='아이템 유형 (기본: 전체)')
+    args = parser.parse_args(argv)
+
+    tagger = get_tagger()
+    if args.text:
+        print(', '.join(tagger.tag_text(args.text, limit=None)) or '(태그 없음)')
+    if not args.retag:
+        return
+
+    from crawlers.store import get_store
+    from crawlers.publish import republish
+    from crawlers.pipeline import StoreSink, run_pipeline
+
+    store = get_store()
+    items = store.query(item_type=args.type)
+    start = time.perf_counter()
+    sink = StoreSink(store, batch_size=500)
+    count = run_pipeline((retag(data, tagger) for data in items), [sink])
+    elapsed = time.perf_counter() - start
+    republish(store, sink.result.changed)
+    print(f"태그 재계산 완료: {count}개 항목 중 {len(sink.result.changed)}개 변경, "
+          f"{elapsed:.2f}초 ({count / elapsed if elapsed else 0:.0f}개/초)")
+
+
+if __name__ == "__main__":
+    main()
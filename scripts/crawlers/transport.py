@@ -0,0 +1,208 @@
+"""
+공용 HTTP 전송 계층
+
+모든 보도자료 스크래퍼가 하나의 requests 세션을 공유하여
+호스트별 커넥션 풀(keep-alive)을 페이지와 스케줄러 실행 사이에서 재사용합니다.
+record 모드에서는 모든 요청/응답을 카세트에 기록하고, replay 모드에서는 네트워크 없이 카세트로 응답합니다.
+실제 요청에는 호스트별 속도 제한, 재시도, 서킷 브레이커(resilience)가 적용됩니다.
+"""
+
+import os
+import sys
+import logging
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+from typing import Dict, Optional
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers.config import (
+    DEFAULT_HEADERS, TIMEOUT, CONNECT_TIMEOUT, HTTP_MAX_HOSTS, MAX_CONCURRENCY_PER_HOST, HTTP_MODE, HTTP_CASSETTE
+)
+from crawlers.cassette import Cassette
+from crawlers.metrics import FETCH_BYTES, FETCH_ERRORS, FETCH_SECONDS
+from crawlers.resilience import call_with_retry
+
+logger = logging.getLogger('transport')
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_request_counts: Dict[str, int] = {}
+_bytes_counts: Dict[str, int] = {}
+
+# 전송 모드 ('live', 'record', 'replay')와 사용 중인 카세트
+HTTP_MODES = ('live', 'record', 'replay')
+_mode = 'live'
+_cassette: Optional[Cassette] = None
+
+
+def _accept_encoding() -> str:
+    """사용 가능한 압축 방식 목록 (brotli 모듈이 있으면 br 포함)"""
+    encodings = ['gzip', 'deflate']
+    try:
+        import brotli  # noqa: F401
+        encodings.append('br')
+    except ImportError:
+        pass
+    return ', '.join(encodings)
+
+
+def _create_session() -> requests.Session:
+    """호스트별 커넥션 풀을 가진 세션 생성"""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.headers['Accept-Encoding'] = _accept_encoding()
+    session.headers['Connection'] = 'keep-alive'
+
+    # pool_connections: 유지할 호스트 풀 개수, pool_maxsize: 호스트당 연결 수
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_MAX_HOSTS,
+        pool_maxsize=MAX_CONCURRENCY_PER_HOST,
+        pool_block=True
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """프로세스 전체에서 공유하는 세션 반환"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+                logger.info("공용 HTTP 세션 생성")
+    return _session
+
+
+def set_mode(mode: str, cassette: Optional[str] = None) -> Optional[Cassette]:
+    """전송 모드 변경 (record/replay는 카세트 이름 필요, 기본값 HTTP_CASSETTE)"""
+    global _mode, _cassette
+    if mode not in HTTP_MODES:
+        raise ValueError(f"알 수 없는 전송 모드: {mode} ({', '.join(HTTP_MODES)} 중 하나)")
+    with _session_lock:
+        _mode = mode
+        _cassette = Cassette(cassette or HTTP_CASSETTE) if mode != 'live' else None
+    if _cassette is not None:
+        logger.info(f"HTTP {mode} 모드: 카세트 {_cassette.path}")
+    return _cassette
+
+
+def get_mode() -> str:
+    """현재 전송 모드"""
+    return _mode
+
+
+def fetch(url: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+    """공용 세션으로 GET 요청 수행 (replay 모드에서는 카세트에서 응답)
+    
+    timeout을 주지 않으면 연결 CONNECT_TIMEOUT초, 응답 TIMEOUT초를 기다리고,
+    일시적인 오류는 재시도하며 서킷 브레이커가 열린 호스트는 CircuitOpenError로 바로 실패합니다.
+    """
+    mode, cassette = _mode, _cassette
+    host = urlsplit(url).netloc
+    start = time.perf_counter()
+    try:
+        if mode == 'replay':
+            response = cassette.replay(url, kwargs.get('headers'))
+        else:
+            session = get_session()
+            response = call_with_retry(
+                host, lambda: session.get(url, timeout=timeout or (CONNECT_TIMEOUT, TIMEOUT), **kwargs)
+            )
+    except Exception:
+        FETCH_ERRORS.inc(host=host)
+        raise
+    elapsed = time.perf_counter() - start
+    if mode == 'record':
+        cassette.record(url, kwargs.get('headers') or {}, response, elapsed)
+    FETCH_SECONDS.observe(elapsed, host=host)
+    FETCH_BYTES.inc(len(response.content), host=host)
+
+    with _session_lock:
+        _request_counts[host] = _request_counts.get(host, 0) + 1
+        _bytes_counts[host] = _bytes_counts.get(host, 0) + len(response.content)
+    return response
+
+
+def open_stream(url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = None) -> requests.Response:
+    """본문을 읽지 않은 스트리밍 응답 반환 (첨부파일 등 큰 파일용, 호출자가 iter_content 후 close)
+
+    속도 제한, 재시도, 서킷 브레이커는 fetch와 같이 적용되며 수신 바이트는 호출자가 집계합니다.
+    record 모드에서도 본문은 카세트에 기록하지 않고, replay 모드에서는 기록된 응답이 있으면 재생합니다.
+    """
+    mode, cassette = _mode, _cassette
+    host = urlsplit(url).netloc
+    start = time.perf_counter()
+    try:
+        if mode == 'replay':
+            response = cassette.replay(url, headers)
+        else:
+            session = get_session()
+            response = call_with_retry(
+                host, lambda: session.get(url, headers=headers, timeout=timeout or (CONNECT_TIMEOUT, TIMEOUT),
+                                          stream=True)
+            )
+    except Exception:
+        FETCH_ERRORS.inc(host=host)
+        raise
+    FETCH_SECONDS.observe(time.perf_counter() - start, host=host)
+
+    with _session_lock:
+        _request_counts[host] = _request_counts.get(host, 0) + 1
+    return response
+
+
+def get_stats() -> Dict[str, Dict[str, int]]:
+    """호스트별 요청 수, 새 연결 수, 재사용 횟수, 수신 바이트 통계"""
+    stats: Dict[str, Dict[str, int]] = {}
+    connections: Dict[str, int] = {}
+    if _session is not None:
+        adapter = _session.get_adapter('https://')
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+            connections[host] = connections.get(host, 0) + pool.num_connections
+
+    with _session_lock:
+        for host, count in _request_counts.items():
+            new_connections = connections.get(host, 0)
+            stats[host] = {
+                'requests': count,
+                'connections': new_connections,
+                'reused': max(0, count - new_connections),
+                'bytes': _bytes_counts.get(host, 0),
+            }
+    return stats
+
+
+def format_stats() -> str:
+    """로그 출력용 통계 문자열"""
+    stats = get_stats()
+    if not stats:
+        return "요청 없음"
+    return ', '.join(
+        f"{host} 요청 {s['requests']}회/연결 {s['connections']}개/재사용 {s['reused']}회"
+        for host, s in sorted(stats.items())
+    )
+
+
+def close_session():
+    """공용 세션 종료 (커넥션 풀 해제)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+if HTTP_MODE != 'live':
+    set_mode(HTTP_MODE)
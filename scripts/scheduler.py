@@ -6,116 +6,219 @@ APScheduler를 사용하여 1시간 간격으로 보도자료 및 뉴스 크롤
 
 import os
 import sys
+import time
 import logging
-import json
-from datetime import datetime, timedelta
-from pathlib import Path
+import threading
+from datetime import datetime
+from typing import List, Optional
 from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 
 # 상위 경로 추가하여 모듈 임포트 가능하게 설정
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from crawlers.config import LOG_DIR, DATA_DIR, save_data
-from crawlers.press_crawler import fetch_all_press_releases
-from crawlers.news_crawler import fetch_all_news
-
-# 디렉토리 생성
-os.makedirs(LOG_DIR, exist_ok=True)
-os.makedirs(DATA_DIR, exist_ok=True)
-
-# 로깅 설정
-log_file = LOG_DIR / f"scheduler_{datetime.now().strftime('%Y%m%d')}.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
+from crawlers.config import (
+    MAX_PRESS_PAGES, KST, SCHEDULE_MODE, JOB_MAX_WORKERS, JOB_TIMEOUT_PRESS, JOB_TIMEOUT_NEWS, setup_logging
 )
+from crawlers.store import get_store
+from crawlers.search import SearchIndex
+from crawlers.publish import publish
+from crawlers.pipeline import StoreSink, dedup, run_pipeline
+from crawlers.dedup import dedup_news
+from crawlers.press_crawler import iter_press_releases
+from crawlers.detail import enrich_details
+from crawlers.attachments import AttachmentSink
+from crawlers.summarize import summarize_items
+from crawlers.tagger import tag_items
+from crawlers.sources import SOURCES
+from crawlers.metrics import (
+    JOB_LAST_SUCCESS, JOB_RUNS, JOB_SECONDS, JOB_SKIPPED, JOB_TIMEOUTS, POLL_INTERVAL, record_upserts, start_http_server
+)
+from crawlers.polling import AdaptivePoller
+from crawlers.jobs import JobCancelled, JobStillRunning, run_with_deadline
+
 logger = logging.getLogger('scheduler')
 
+# 기관별 작업이 동시에 끝나도 검색 색인과 게시 파일은 한 번에 하나씩 갱신
+_publish_lock = threading.Lock()
 
-def crawl_press_releases():
-    """보도자료 크롤링 작업"""
-    logger.info("보도자료 크롤링 작업 시작")
+
+def crawl_press_releases(sources: Optional[List[str]] = None) -> int:
+    """보도자료 크롤링 작업 (sources를 주면 해당 기관만 수집, 신규 아이템 수 반환)"""
+    label = '보도자료' if sources is None else f"보도자료({', '.join(sources)})"
+    logger.info(f"{label} 크롤링 작업 시작")
     try:
         start_time = datetime.now()
         
-        # 보도자료 수집 (최대 2페이지)
-        results = fetch_all_press_releases(max_pages=2)
+        # 보도자료 증분 수집 (이미 수집한 게시물에 도달할 때까지, 최대 MAX_PRESS_PAGES 페이지)
+        # 상세 페이지 본문·첨부파일과 요약·태그를 채운 뒤 수집되는 대로 배치 단위로 URL 기준 upsert
+        # 첨부파일은 따로 받아 두고 텍스트 추출은 프로세스 풀에서 이어서 진행
+        store = get_store()
+        sink = StoreSink(store)
+        items = enrich_details(dedup(iter_press_releases(max_pages=MAX_PRESS_PAGES, sources=sources)), store=store)
+        count = run_pipeline(tag_items(summarize_items(items, store=store)), [sink, AttachmentSink(store)])
         
-        # 결과 저장
-        if results:
-            filename = f"press_releases_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
-            saved_path = save_data([item.to_dict() for item in results], filename)
-            
-            # API 데이터 업데이트를 위한 최신 파일 생성
-            latest_path = DATA_DIR / "latest_press_releases.json"
-            with open(latest_path, 'w', encoding='utf-8') as f:
-                json.dump([item.to_dict() for item in results], f, ensure_ascii=False, indent=2)
+        # 최신 파일을 저장소에서 내보내기
+        if count:
+            upserted = sink.result
+            record_upserts('press_releases', upserted, {spec.name: key for key, spec in SOURCES.items()})
+            with _publish_lock:
+                SearchIndex(store).index_items(upserted.new + upserted.changed)
+                
+                # API 데이터 업데이트를 위한 최신 파일 게시 (변경분 로그 추가 후 원자적 교체)
+                seq, published = publish('press_releases', lambda: store.latest_items('source'), upserted.new + upserted.changed)
                 
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
-            logger.info(f"보도자료 크롤링 완료: {saved_path} ({len(results)}개 항목, 소요시간: {duration:.2f}초)")
+            JOB_SECONDS.observe(duration, job='press_releases')
+            JOB_RUNS.inc(job='press_releases', result='success')
+            JOB_LAST_SUCCESS.set(time.time(), job='press_releases')
+            logger.info(f"{label} 크롤링 완료: {count}개 항목 (신규 {len(upserted.new)}개, "
+                        f"변경 {len(upserted.changed)}개), 최신 {published}개 게시 (delta seq {seq}), "
+                        f"소요시간: {duration:.2f}초")
+            return len(upserted.new)
         else:
-            logger.warning("수집된 보도자료가 없습니다.")
+            logger.warning(f"수집된 {label}가 없습니다.")
+            JOB_RUNS.inc(job='press_releases', result='empty')
+    except JobCancelled:
+        # 마감 초과는 작업 실행기가 처리 (오류로 집계하지 않음)
+        raise
     except Exception as e:
-        logger.error(f"보도자료 크롤링 작업 오류: {str(e)}", exc_info=True)
+        logger.error(f"{label} 크롤링 작업 오류: {str(e)}", exc_info=True)
+        JOB_RUNS.inc(job='press_releases', result='error')
+    return 0
 
 
-def crawl_news():
-    """뉴스 크롤링 작업"""
+def crawl_news() -> int:
+    """뉴스 크롤링 작업 (신규 아이템 수 반환)"""
     logger.info("뉴스 크롤링 작업 시작")
     try:
         start_time = datetime.now()
         
+        # 뉴스 수집기(브라우저 대체 경로 포함)는 뉴스 작업에서만 임포트
+        from crawlers.news_crawler import iter_news
+
         # 키워드별 뉴스 수집 (키워드당 최대 5개)
-        results = fetch_all_news(max_items_per_source=5)
+        # 요약·태그를 채운 뒤 수집되는 대로 배치 단위로 URL 기준 upsert
+        store = get_store()
+        sink = StoreSink(store)
+        count = run_pipeline(summarize_items(dedup_news(iter_news(max_items_per_source=5)), store=store), [sink])
         
-        # 결과 저장
-        if results:
-            filename = f"news_items_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
-            saved_path = save_data([item.to_dict() for item in results], filename)
-            
-            # API 데이터 업데이트를 위한 최신 파일 생성
-            latest_path = DATA_DIR / "latest_news_items.json"
-            with open(latest_path, 'w', encoding='utf-8') as f:
-                json.dump([item.to_dict() for item in results], f, ensure_ascii=False, indent=2)
+        # 최신 파일을 저장소에서 내보내기
+        if count:
+            upserted = sink.result
+            record_upserts('news', upserted)
+            with _publish_lock:
+                SearchIndex(store).index_items(upserted.new + upserted.changed)
+                
+                # API 데이터 업데이트를 위한 최신 파일 게시 (변경분 로그 추가 후 원자적 교체)
+                seq, published = publish('news_items', lambda: store.latest_items('news'), upserted.new + upserted.changed)
                 
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
-            logger.info(f"뉴스 크롤링 완료: {saved_path} ({len(results)}개 항목, 소요시간: {duration:.2f}초)")
+            JOB_SECONDS.observe(duration, job='news')
+            JOB_RUNS.inc(job='news', result='success')
+            JOB_LAST_SUCCESS.set(time.time(), job='news')
+            logger.info(f"뉴스 크롤링 완료: {count}개 항목 (신규 {len(upserted.new)}개, "
+                        f"변경 {len(upserted.changed)}개), 최신 {published}개 게시 (delta seq {seq}), "
+                        f"소요시간: {duration:.2f}초")
+            return len(upserted.new)
         else:
             logger.warning("수집된 뉴스가 없습니다.")
+            JOB_RUNS.inc(job='news', result='empty')
+    except JobCancelled:
+        raise
     except Exception as e:
         logger.error(f"뉴스 크롤링 작업 오류: {str(e)}", exc_info=True)
+        JOB_RUNS.inc(job='news', result='error')
+    return 0
+
+
+def _run_job(name: str, func, *args, timeout: float, on_timeout=None) -> int:
+    """마감 시간 안에서 작업 실행 (초과하면 취소하고, 이전 실행이 아직 돌고 있으면 건너뛰고 0 반환)"""
+    try:
+        return run_with_deadline(name, func, *args, timeout=timeout, on_timeout=on_timeout, default=0)
+    except JobCancelled:
+        JOB_TIMEOUTS.inc(job=name)
+        return 0
+    except JobStillRunning as e:
+        logger.warning(str(e))
+        JOB_SKIPPED.inc(job=name)
+        return 0
+
+
+def press_job(key: str) -> int:
+    """기관별 보도자료 작업 (JOB_TIMEOUT_PRESS초 마감)"""
+    return _run_job(f'press_{key}', crawl_press_releases, [key], timeout=JOB_TIMEOUT_PRESS)
 
 
-def setup_scheduler():
-    """스케줄러 설정"""
+def news_job() -> int:
+    """뉴스 작업 (JOB_TIMEOUT_NEWS초 마감, 초과 시 사용 중인 브라우저 강제 종료)"""
+    from crawlers.browser_pool import get_pool
+    return _run_job('news', crawl_news, timeout=JOB_TIMEOUT_NEWS,
+                    on_timeout=lambda: get_pool().abort("뉴스 작업 마감 시간 초과"))
+
+
+def _create_scheduler() -> BlockingScheduler:
+    """작업을 스레드 풀에서 병렬 실행하는 스케줄러 (밀린 실행은 한 번으로 합침)"""
+    return BlockingScheduler(
+        executors={'default': ThreadPoolExecutor(JOB_MAX_WORKERS)},
+        job_defaults={'coalesce': True, 'misfire_grace_time': 600}
+    )
+
+
+def poll_feed(scheduler, poller: AdaptivePoller, feed: str):
+    """적응형 스케줄의 피드별 작업 (수집 후 게시 패턴에 따라 다음 실행 시각 예약)"""
+    new_items = 0
+    try:
+        new_items = news_job() if feed == 'news' else press_job(feed)
+    finally:
+        poller.record(feed, new_items)
+        interval = poller.next_interval(feed)
+        POLL_INTERVAL.set(interval.total_seconds(), feed=feed)
+        next_run = datetime.now(KST) + interval
+        scheduler.add_job(
+            poll_feed,
+            DateTrigger(run_date=next_run),
+            args=(scheduler, poller, feed),
+            id=f'poll_{feed}',
+            name=f'{feed} 폴링',
+            max_instances=1,
+            replace_existing=True
+        )
+        logger.info(f"{feed} 다음 폴링: {next_run.strftime('%m-%d %H:%M')} "
+                    f"({interval.total_seconds() / 60:.0f}분 후, 이번 신규 {new_items}개)")
+
+
+def setup_scheduler(catch_up: bool = True):
+    """스케줄러 설정 (catch_up이면 모든 작업을 시작 직후 한 번 병렬로 실행)"""
     logger.info("크롤링 스케줄러 설정 시작")
-    scheduler = BlockingScheduler()
+    scheduler = _create_scheduler()
+    first_run = {'next_run_time': datetime.now(KST)} if catch_up else {}
     
-    # 보도자료 크롤링 작업 (매시 10분에 실행)
-    scheduler.add_job(
-        crawl_press_releases,
-        CronTrigger(minute=10),
-        id='press_releases_job',
-        name='보도자료 크롤링',
-        max_instances=1,
-        replace_existing=True
-    )
+    # 보도자료 크롤링 작업 (기관별, 매시 10분에 실행)
+    for key, spec in SOURCES.items():
+        scheduler.add_job(
+            press_job,
+            CronTrigger(minute=10),
+            args=(key,),
+            id=f'press_{key}_job',
+            name=f'보도자료 크롤링 ({spec.name})',
+            max_instances=1,
+            replace_existing=True,
+            **first_run
+        )
     
     # 뉴스 크롤링 작업 (매시 40분에 실행)
     scheduler.add_job(
-        crawl_news,
+        news_job,
         CronTrigger(minute=40),
         id='news_job',
         name='뉴스 크롤링',
         max_instances=1,
-        replace_existing=True
+        replace_existing=True,
+        **first_run
     )
     
     # 또는 1시간 간격으로 설정할 수도 있음
@@ -141,17 +244,39 @@ def setup_scheduler():
     return scheduler
 
 
+def setup_adaptive_scheduler():
+    """적응형 스케줄러 설정 (피드마다 바로 한 번 수집한 뒤 게시 패턴에 따라 간격 조정)"""
+    logger.info("적응형 크롤링 스케줄러 설정 시작")
+    scheduler = _create_scheduler()
+    poller = AdaptivePoller()
+    
+    for feed in poller.feeds():
+        scheduler.add_job(
+            poll_feed,
+            DateTrigger(run_date=datetime.now(KST)),
+            args=(scheduler, poller, feed),
+            id=f'poll_{feed}',
+            name=f'{feed} 폴링',
+            max_instances=1,
+            replace_existing=True
+        )
+    
+    logger.info(f"적응형 크롤링 스케줄러 설정 완료 (피드 {len(poller.feeds())}개)")
+    return scheduler
+
+
 if __name__ == "__main__":
+    setup_logging('scheduler')
     logger.info("===== 크롤링 스케줄러 시작 =====")
     
-    # 시작 시 바로 한 번 실행
-    logger.info("초기 크롤링 시작")
-    crawl_press_releases()
-    crawl_news()
-    logger.info("초기 크롤링 완료")
+    # Prometheus 메트릭 엔드포인트 (SCOPE_METRICS_PORT, 0이면 사용 안 함)
+    start_http_server()
     
-    # 스케줄러 설정 및 시작
-    scheduler = setup_scheduler()
+    # 스케줄러 설정 및 시작 (초기 크롤링은 시작 직후 기관별·뉴스 작업으로 병렬 실행)
+    if SCHEDULE_MODE == 'adaptive':
+        scheduler = setup_adaptive_scheduler()
+    else:
+        scheduler = setup_scheduler(catch_up=True)
     try:
         scheduler.start()
     except (KeyboardInterrupt, SystemExit):
@@ -0,0 +1,113 @@
+"""
+테스트 공용 픽스처
+
+로컬 HTTP 서버(경로별 응답 순서 지정), 테스트마다 새로 만드는 공용 세션·호스트 가드,
+임시 디렉토리의 저장소·게시 파일을 제공합니다.
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+import pytest
+
+# 상위 경로 추가하여 모듈 임포트 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawlers import publish, resilience, store as store_module, transport
+from crawlers.store import ItemStore
+
+
+class FixtureServer:
+    """경로마다 (상태, 헤더, 본문) 응답을 순서대로 돌려주는 로컬 서버 (마지막 응답은 반복)"""
+
+    def __init__(self):
+        self.routes: Dict[str, List[Tuple[int, Dict[str, str], bytes]]] = {}
+        self.requests: List[str] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.requests.append(self.path)
+                responses = server.routes.get(self.path.split('?')[0]) or [(404, {}, b'not found')]
+                status, headers, body = responses.pop(0) if len(responses) > 1 else responses[0]
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.host = f"127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        return f"http://{self.host}{path}"
+
+    def route(self, path: str, *responses: Tuple[int, Dict[str, str], bytes]):
+        self.routes[path] = list(responses)
+
+
+def run_with_timeout(func, timeout: float = 10):
+    """func()를 별도 스레드에서 실행하고 timeout초 안에 끝나지 않으면 실패 (멈춘 요청 감지용)"""
+    result = {}
+
+    def target():
+        try:
+            result['value'] = func()
+        except BaseException as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        pytest.fail(f"{timeout}초 안에 끝나지 않음 (커넥션 풀 대기 등으로 멈춤)")
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+@pytest.fixture
+def server():
+    fixture = FixtureServer()
+    fixture.thread.start()
+    yield fixture
+    fixture.httpd.shutdown()
+    fixture.httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_transport(monkeypatch):
+    """테스트마다 새 공용 세션과 호스트 가드 사용, 재시도 대기 없음"""
+    transport.close_session()
+    monkeypatch.setattr(resilience, '_guards', {})
+    monkeypatch.setattr(resilience, 'backoff_delay', lambda attempt, retry_after=None: 0)
+    yield
+    transport.close_session()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """임시 디렉토리의 공용 저장소"""
+    item_store = ItemStore(tmp_path / 'items.db')
+    monkeypatch.setattr(store_module, '_store', item_store)
+    yield item_store
+    item_store.close()
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """게시 파일(latest_*.json, delta 로그, 매니페스트)을 임시 디렉토리에 기록"""
+    monkeypatch.setattr(publish, 'DATA_DIR', tmp_path)
+    monkeypatch.setattr(publish, 'MANIFEST_FILE', tmp_path / 'publish_manifest.json')
+    monkeypatch.setattr(publish, '_logs', {})
+    return tmp_path
@@ -0,0 +1,98 @@
+"""
+첨부파일 스트리밍 다운로드 테스트
+"""
+
+import hashlib
+import time
+
+import pytest
+
+from conftest import run_with_timeout
+from crawlers import attachments, transport
+from crawlers.models import SourceItem
+from crawlers.pipeline import run_pipeline
+from crawlers.store import ItemStore
+
+
+@pytest.fixture
+def attachment_dir(tmp_path, monkeypatch):
+    """첨부파일 저장 위치를 임시 디렉토리로 변경"""
+    monkeypatch.setattr(attachments, 'ATTACHMENT_DIR', tmp_path)
+    monkeypatch.setattr(attachments, 'PARTIAL_DIR', tmp_path / 'partial')
+    monkeypatch.setattr(attachments, 'TEXT_DIR', tmp_path / 'text')
+    return tmp_path
+
+
+def test_download_after_retried_5xx(server, attachment_dir):
+    body = '첨부파일 본문'.encode('utf-8') * 1000
+    headers = {'Content-Disposition': 'attachment; filename="notice.txt"'}
+    server.route('/a.txt', (503, {}, b'busy'), (503, {}, b'busy'), (200, headers, body))
+    server.route('/b.txt', (503, {}, b'busy'), (200, headers, body))
+    server.route('/page', (200, {}, b'ok'))
+
+    first = run_with_timeout(lambda: attachments.download(server.url('/a.txt')))
+    second = run_with_timeout(lambda: attachments.download(server.url('/b.txt')))
+
+    sha256 = hashlib.sha256(body).hexdigest()
+    assert first['sha256'] == second['sha256'] == sha256
+    assert first['size'] == len(body)
+    assert first['kind'] == 'txt'
+    assert (attachment_dir / first['path']).read_bytes() == body
+    assert server.requests.count('/a.txt') == 3
+    assert server.requests.count('/b.txt') == 2
+
+    # 재시도한 스트리밍 응답이 커넥션을 잡고 있지 않아야 같은 호스트 요청이 막히지 않음
+    response = run_with_timeout(lambda: transport.fetch(server.url('/page')))
+    assert response.status_code == 200
+
+
+def test_attachments_follow_item_url_when_ids_collide(server, store, attachment_dir):
+    # 같은 날 같은 순번으로 만들어진 ID가 겹치면 저장소는 나중 URL의 ID를 바꿈
+    items = [
+        SourceItem(id='fsc-20240601-1', title=f'보도자료 {index}', source='금융위원회',
+                   date='2024-06-01T00:00:00+09:00', url=server.url(f'/view/{index}'), summary='', tags=[],
+                   attachments=[{'url': server.url(f'/file/{index}.txt'), 'name': f'붙임{index}.txt'}])
+        for index in range(2)
+    ]
+    for index in range(2):
+        server.route(f'/file/{index}.txt', (200, {}, f'첨부 {index}'.encode('utf-8')))
+    store.upsert_items(items)
+
+    sink = attachments.AttachmentSink(store)
+    run_with_timeout(lambda: run_pipeline(items, [sink]))
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline and not all(
+        attachments.attachment_texts(item.url, store) for item in items
+    ):
+        time.sleep(0.1)
+
+    for index, item in enumerate(items):
+        assert attachments.attachment_texts(item.url, store) == [(f'붙임{index}.txt', f'첨부 {index}')]
+
+
+def test_store_migrates_attachments_keyed_by_item_id(tmp_path):
+    path = tmp_path / 'items.db'
+    old = ItemStore(path)
+    item = SourceItem(id='fsc-1', title='보도자료', source='금융위원회', date='2024-06-01T00:00:00+09:00',
+                      url='https://www.fsc.go.kr/no/1', summary='', tags=[])
+    old.upsert_items([item])
+    old.conn.executescript("""
+        DROP TABLE attachments;
+        CREATE TABLE attachments (
+            item_id TEXT NOT NULL, url TEXT NOT NULL, name TEXT, kind TEXT, sha256 TEXT, size INTEGER,
+            path TEXT, text_path TEXT, status TEXT NOT NULL, error TEXT, updated_at TEXT NOT NULL,
+            PRIMARY KEY (item_id, url)
+        );
+        INSERT INTO attachments VALUES
+            ('fsc-1', 'https://www.fsc.go.kr/file/1.pdf', '붙임.pdf', 'pdf', 'abc', 3, 'ab/abc.pdf', NULL,
+             'downloaded', NULL, '2024-06-01T00:00:00');
+    """)
+    old.close()
+
+    migrated = ItemStore(path)
+    try:
+        records = migrated.item_attachments(item.url)
+        assert [(record['url'], record['sha256']) for record in records] == [('https://www.fsc.go.kr/file/1.pdf', 'abc')]
+        assert migrated.find_attachment(sha256='abc')['item_url'] == item.url
+    finally:
+        migrated.close()
@@ -0,0 +1,35 @@
+"""
+임포트 부작용 테스트
+
+보도자료 경로는 브라우저 스택(Selenium, webdriver_manager)을 불러오지 않아야 합니다.
+이미 불러온 모듈의 영향을 받지 않도록 모듈마다 새 인터프리터에서 확인합니다.
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BROWSER_MODULES = ('selenium', 'webdriver_manager')
+
+PROBE = """
+import sys, json, logging
+import {module}
+print(json.dumps([[name for name in {browser!r} if name in sys.modules], len(logging.getLogger().handlers)]))
+"""
+
+
+@pytest.mark.parametrize('module', ['crawlers.press_crawler', 'crawlers.detail', 'crawlers.attachments', 'scheduler'])
+def test_press_path_does_not_import_browser_stack(module):
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, browser=BROWSER_MODULES)],
+        cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True, timeout=60
+    ).stdout
+    browser, handlers = json.loads(output.strip().splitlines()[-1])
+
+    assert browser == []
+    assert handlers == 0
@@ -0,0 +1,69 @@
+"""
+마감 시간이 있는 작업 실행 테스트
+"""
+
+import threading
+import time
+
+import pytest
+
+import scheduler
+from crawlers import jobs
+from crawlers.jobs import JobCancelled, JobStillRunning, run_with_deadline
+from crawlers.metrics import JOB_RUNS, JOB_SKIPPED, JOB_TIMEOUTS
+from crawlers.models import SourceItem
+
+
+@pytest.fixture(autouse=True)
+def no_detached(monkeypatch):
+    """테스트마다 분리된 작업 스레드 목록을 비움"""
+    monkeypatch.setattr(jobs, '_detached', {})
+
+
+def test_cancelled_press_job_is_not_counted_as_error(store, monkeypatch):
+    def endless(max_pages=None, sources=None):
+        index = 0
+        while True:
+            index += 1
+            time.sleep(0.02)
+            yield SourceItem(id=f'fsc-{index}', title=f'보도자료 {index}', source='금융위원회',
+                             date='2024-06-01T00:00:00+09:00', url=f'https://www.fsc.go.kr/no/{index}',
+                             summary='', tags=[])
+
+    monkeypatch.setattr(scheduler, 'iter_press_releases', endless)
+    monkeypatch.setattr(scheduler, 'enrich_details', lambda items, store=None: items)
+    monkeypatch.setattr(scheduler, 'summarize_items', lambda items, store=None: items)
+    monkeypatch.setattr(scheduler, 'tag_items', lambda items: items)
+    monkeypatch.setattr(scheduler, 'JOB_TIMEOUT_PRESS', 0.2)
+    errors = JOB_RUNS.value(job='press_releases', result='error')
+    timeouts = JOB_TIMEOUTS.value(job='press_fsc')
+
+    assert scheduler.press_job('fsc') == 0
+
+    assert JOB_RUNS.value(job='press_releases', result='error') == errors
+    assert JOB_TIMEOUTS.value(job='press_fsc') == timeouts + 1
+
+
+def test_skips_job_while_detached_worker_is_alive(monkeypatch):
+    monkeypatch.setattr(jobs, 'JOB_CANCEL_GRACE', 0.05)
+    release = threading.Event()
+    calls = []
+
+    def stuck():
+        calls.append('stuck')
+        release.wait(10)  # 체크포인트 없이 멈춘 작업
+
+    with pytest.raises(JobCancelled):
+        run_with_deadline('press_fsc', stuck, timeout=0.05)
+    with pytest.raises(JobStillRunning):
+        run_with_deadline('press_fsc', calls.append, 'again', timeout=1)
+    skipped = JOB_SKIPPED.value(job='press_fsc')
+    assert scheduler._run_job('press_fsc', calls.append, 'again', timeout=1) == 0
+    assert JOB_SKIPPED.value(job='press_fsc') == skipped + 1
+    # 다른 기관 작업은 그대로 실행
+    assert run_with_deadline('press_bok', lambda: 'ok', timeout=1) == 'ok'
+
+    release.set()
+    jobs._detached['press_fsc'].join(5)
+    run_with_deadline('press_fsc', calls.append, 'again', timeout=1)
+    assert calls == ['stuck', 'again']
@@ -0,0 +1,35 @@
+"""
+보도자료 목록 수집 테스트
+"""
+
+from datetime import timedelta
+
+from crawlers import press_crawler
+from crawlers.config import get_start_date
+from crawlers.http_cache import CachedPage
+from crawlers.models import SourceItem
+
+
+class UnchangedCache:
+    """모든 목록 페이지가 바뀌지 않았다고 답하는 캐시"""
+
+    def __init__(self, items):
+        self.items = items
+
+    def get(self, url):
+        return CachedPage(url=url, body=b'', encoding='utf-8', content_hash='hash', unchanged=True, items=self.items)
+
+
+def test_unchanged_page_drops_items_older_than_start_date(monkeypatch):
+    start_date = get_start_date()
+    cached = [
+        SourceItem(id=f'fsc-{index}', title=f'보도자료 {index}', source='금융위원회',
+                   date=(start_date + timedelta(days=days)).isoformat(),
+                   url=f'https://www.fsc.go.kr/no/{index}', summary='', tags=[]).to_dict()
+        for index, days in enumerate((1, -1))
+    ]
+    monkeypatch.setattr(press_crawler, 'get_cache', lambda: UnchangedCache(cached))
+
+    items = press_crawler.scrape_source('fsc')
+
+    assert [item.url for item in items] == ['https://www.fsc.go.kr/no/0']
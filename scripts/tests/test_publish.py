@@ -0,0 +1,51 @@
+"""
+게시 및 변경분(delta) 로그 테스트
+"""
+
+import json
+import threading
+
+from crawlers import publish
+from crawlers.publish import DeltaLog
+
+
+def test_delta_log_continues_after_other_writer(tmp_path):
+    # 스케줄러와 CLI처럼 각자 순번을 캐시한 두 기록자
+    scheduler_log = DeltaLog('news_items', tmp_path)
+    cli_log = DeltaLog('news_items', tmp_path)
+
+    scheduler_log.append([{'url': 'a'}, {'url': 'b'}])
+    assert cli_log.append([{'url': 'c'}]) == 3
+    assert scheduler_log.append([{'url': 'd'}]) == 4
+
+    entries, cursor = DeltaLog('news_items', tmp_path).read_after(2)
+    assert [entry['item']['url'] for entry in entries] == ['c', 'd']
+    assert cursor == 4
+
+
+def test_concurrent_writers_get_unique_seqs(tmp_path):
+    writers = [DeltaLog('press_releases', tmp_path) for _ in range(4)]
+    threads = [
+        threading.Thread(target=lambda log=log, n=n: [log.append([{'writer': n, 'i': i}]) for i in range(50)])
+        for n, log in enumerate(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    entries, cursor = DeltaLog('press_releases', tmp_path).read_after(0)
+    assert [entry['seq'] for entry in entries] == list(range(1, 201))
+    assert cursor == 200
+
+
+def test_publish_keeps_other_kinds_in_manifest(data_dir):
+    press_seq, press_count = publish.publish('press_releases', lambda: [{'url': 'p'}], [{'url': 'p'}])
+    news_seq, news_count = publish.publish('news_items', lambda: [{'url': 'n1'}, {'url': 'n2'}], [{'url': 'n2'}])
+
+    with open(data_dir / 'publish_manifest.json', 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert (press_seq, press_count) == (1, 1)
+    assert (news_seq, news_count) == (1, 2)
+    assert manifest['press_releases']['seq'] == 1
+    assert manifest['news_items']['count'] == 2
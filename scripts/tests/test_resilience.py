@@ -0,0 +1,33 @@
+"""
+재시도·서킷 브레이커 테스트
+"""
+
+from conftest import run_with_timeout
+from crawlers import transport
+from crawlers.config import MAX_CONCURRENCY_PER_HOST, RETRY_MAX_ATTEMPTS
+
+
+def test_retry_returns_success_after_5xx(server):
+    server.route('/page', (503, {}, b'busy'), (200, {}, b'ok'))
+
+    response = transport.fetch(server.url('/page'))
+
+    assert response.status_code == 200
+    assert response.text == 'ok'
+    assert server.requests == ['/page', '/page']
+
+
+def test_streamed_5xx_retries_release_pooled_connections(server):
+    # 스트리밍 응답을 닫지 않고 재시도하면 호스트당 연결(MAX_CONCURRENCY_PER_HOST개)이 모두 묶여 멈춤
+    assert RETRY_MAX_ATTEMPTS > MAX_CONCURRENCY_PER_HOST
+    server.route('/file', (503, {}, b'busy'))
+    server.route('/page', (200, {}, b'ok'))
+
+    response = run_with_timeout(lambda: transport.open_stream(server.url('/file')))
+    assert response.status_code == 503
+    response.close()
+    assert server.requests == ['/file'] * RETRY_MAX_ATTEMPTS
+
+    # 같은 호스트의 일반 요청도 막히지 않아야 함
+    response = run_with_timeout(lambda: transport.fetch(server.url('/page')))
+    assert response.status_code == 200
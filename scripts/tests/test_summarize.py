@@ -0,0 +1,80 @@
+"""
+요약·태그 생성 단계 테스트
+"""
+
+import json
+from datetime import datetime
+
+from crawlers import summarize
+from crawlers.config import KST
+from crawlers.models import SourceItem
+from crawlers.publish import DeltaLog
+from crawlers.search import SearchIndex
+from crawlers.store import ItemStore
+from crawlers.summarize import SummaryBackend
+
+
+class FakeBackend(SummaryBackend):
+    """입력 제목으로 요약을 만드는 요약 엔드포인트"""
+
+    model = 'fake'
+
+    def __init__(self):
+        self.batches = []
+
+    def summarize_batch(self, batch):
+        self.batches.append(batch)
+        return {entry['id']: {'summary': f"요약: {entry['title']}", 'tags': ['새태그']} for entry in batch}
+
+
+def make_item(index: int) -> SourceItem:
+    return SourceItem(
+        id=f"fsc-{index}",
+        title=f"보도자료 {index}",
+        source='금융위원회',
+        date=datetime.now(KST).replace(microsecond=0).isoformat(),
+        url=f"https://www.fsc.go.kr/no/{index}",
+        summary='',
+        tags=['금융위원회', '보도자료'],
+        body=f"본문 {index}",
+    )
+
+
+def test_cli_reindexes_and_republishes(store, data_dir, monkeypatch):
+    store.upsert_items([make_item(index) for index in range(3)])
+    SearchIndex(store).rebuild()
+    backend = FakeBackend()
+    monkeypatch.setattr(summarize, 'get_backend', lambda: backend)
+
+    summarize.main(['--type', 'source'])
+
+    assert sum(len(batch) for batch in backend.batches) == 3
+    stored = store.get_items(['https://www.fsc.go.kr/no/0'])['https://www.fsc.go.kr/no/0']
+    assert stored['summary'] == '요약: 보도자료 0'
+    assert '새태그' in stored['tags']
+
+    # 검색 색인과 게시 파일에도 새 요약·태그가 반영되어야 함
+    assert [data['url'] for data in SearchIndex(store).search('새태그')]
+    with open(data_dir / 'latest_press_releases.json', 'r', encoding='utf-8') as f:
+        latest = json.load(f)
+    assert {data['summary'] for data in latest} == {f"요약: 보도자료 {index}" for index in range(3)}
+    with open(data_dir / 'delta_press_releases.jsonl', 'r', encoding='utf-8') as f:
+        assert len(f.readlines()) == 3
+
+
+def test_cli_republish_follows_scheduler_delta_log(store, data_dir, monkeypatch):
+    # 스케줄러 프로세스가 먼저 게시해 둔 변경분 로그 (CLI 프로세스는 그 순번을 캐시하지 않음)
+    scheduler_log = DeltaLog('press_releases', data_dir)
+    scheduler_log.append([make_item(index).to_dict() for index in range(2)])
+    store.upsert_items([make_item(index) for index in range(3)])
+    other_store = ItemStore(data_dir / 'items.db')
+    SearchIndex(other_store).index_items([make_item(index).to_dict() for index in range(3)])
+    other_store.close()
+    monkeypatch.setattr(summarize, 'get_backend', lambda: FakeBackend())
+
+    summarize.main(['--type', 'source'])
+    assert scheduler_log.append([make_item(9).to_dict()]) == 6
+
+    entries, cursor = DeltaLog('press_releases', data_dir).read_after(2)
+    assert [entry['seq'] for entry in entries] == [3, 4, 5, 6]
+    assert cursor == 6
@@ -0,0 +1,123 @@
+"""
+분류 사전 태그 추출 테스트
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from crawlers.config import KST
+from crawlers.models import NewsItem, SourceItem
+from crawlers.publish import DeltaLog
+from crawlers.tagger import AhoCorasick, Tagger, default_taxonomy, main as tagger_main, retag, tag_items
+
+
+@pytest.fixture(scope='module')
+def tagger():
+    return Tagger(default_taxonomy())
+
+
+def test_automaton_matches_brute_force():
+    patterns = ['he', 'she', 'his', 'hers', 'a', 'aa', 'aab', 'abc', 'b']
+    automaton = AhoCorasick(patterns)
+    rng = random.Random(0)
+    for _ in range(500):
+        text = ''.join(rng.choice('abehrs') for _ in range(30))
+        expected = sorted(
+            (start + len(pattern), index)
+            for index, pattern in enumerate(patterns)
+            for start in range(len(text)) if text.startswith(pattern, start)
+        )
+        assert sorted(automaton.iter(text)) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('금융위, 보이스피싱 피해 환급 대책 발표', ['금융위원회', '보이스피싱']),
+    ('한은은 기준 금리를 동결했다', ['한국은행', '기준금리']),
+    ('금감원의 DSR 점검', ['금융감독원', '가계부채']),
+    ('인터넷은행들이 대출을 늘렸다', ['인터넷전문은행']),
+])
+def test_tags_terms_with_particles(tagger, text, expected):
+    assert tagger.tag_text(text, limit=None) == expected
+
+
+@pytest.mark.parametrize('text', [
+    '글로벌 금융위기 재현 우려',
+    '과기부족 현상',
+    '한은행사 개최',
+    '신한은행 앱 출시',
+    'DSRX 지표',
+])
+def test_does_not_tag_inside_longer_words(tagger, text):
+    tags = tagger.tag_text(text, limit=None)
+    assert '금융위원회' not in tags
+    assert '과학기술정보통신부' not in tags
+    assert '한국은행' not in tags
+    assert '가계부채' not in tags
+
+
+def test_title_ranks_before_body(tagger):
+    tags = tagger.tag_text('가계부채 관리 방안', body='한국은행 기준금리 가상자산')
+    assert tags[0] == '가계부채'
+
+
+def test_retag_keeps_crawl_time_tags(tagger):
+    item = SourceItem(
+        id='bok-1',
+        title='가계부채 점검 회의 개최',
+        source='한국은행',
+        date='2024-06-01T00:00:00+09:00',
+        url='https://www.bok.or.kr/portal/bbs/B0000338/view.do?nttId=1',
+        summary='',
+        tags=['한국은행', '보도자료'],
+        body='가계부채 증가세를 점검했다.',
+    )
+    crawled = next(tag_items([item], tagger)).to_dict()
+    assert crawled['tags'] == ['한국은행', '보도자료', '가계부채']
+
+    assert retag(crawled, tagger)['tags'] == crawled['tags']
+
+
+def test_retag_news_recomputes_keyword_tags(tagger):
+    item = NewsItem(
+        id='naver-1',
+        title='금융위, 보이스피싱 대책',
+        source='네이버 뉴스',
+        publisher='연합뉴스',
+        date='2024-06-01T00:00:00+09:00',
+        url='https://a.kr/1',
+        summary='한은 기준금리 동결',
+        tags=['보이스피싱', '금융위,', '대책', '요약태그'],
+        keywords=['보이스피싱', '금융위,', '대책'],
+    )
+
+    retagged = retag(item.to_dict(), tagger)
+
+    assert retagged['tags'] == ['보이스피싱', '요약태그', '금융위원회', '한국은행', '기준금리']
+    assert retagged['keywords'] == ['보이스피싱', '금융위원회', '한국은행', '기준금리']
+
+
+def test_retag_cli_republishes_after_other_writer(store, data_dir):
+    item = NewsItem(
+        id='naver-1',
+        title='금융위, 보이스피싱 대책',
+        source='네이버 뉴스',
+        publisher='연합뉴스',
+        date=datetime.now(KST).replace(microsecond=0).isoformat(),
+        url='https://a.kr/1',
+        summary='',
+        tags=['보이스피싱', '대책'],
+        keywords=['보이스피싱', '대책'],
+    )
+    store.upsert_items([item])
+    # 스케줄러가 이미 게시한 변경분 (CLI 프로세스의 로그 객체는 이 순번을 모름)
+    scheduler_log = DeltaLog('news_items', data_dir)
+    scheduler_log.append([item.to_dict()])
+
+    tagger_main(['--retag', '--type', 'news'])
+    assert scheduler_log.append([item.to_dict()]) == 3
+
+    entries, _ = DeltaLog('news_items', data_dir).read_after(0)
+    assert [entry['seq'] for entry in entries] == [1, 2, 3]
+    assert '금융위원회' in entries[1]['item']['tags']
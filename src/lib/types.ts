@@ -10,6 +10,9 @@ export type SourceItem = {
   memo?: string;
   type?: 'issue' | 'source';
   organization?: string;
+  body?: string;
+  attachments?: { name: string; url: string }[];
+  contentHash?: string;
 };
 
 export type NewsItem = {